@@ -0,0 +1,155 @@
+"""
+Бенчмарк получения сообщений изменившихся чатов в EventListener.
+
+Локальная HTTP заглушка отвечает на каждый запрос с искусственной задержкой (как настоящий сервер).
+За один цикл одновременно меняются 1, 5 и 20 чатов, в каждом из которых больше новых сообщений,
+чем помещается на первую страницу, поэтому слушателю нужно догружать следующие страницы.
+Измеряется задержка ивентов — время от начала цикла до получения ивентов (средняя и максимальная):
+- "до": страницы чатов догружаются по очереди (max_concurrent_requests = 1);
+- "после": страницы чатов догружаются параллельно.
+
+Запуск (из корня репозитория):
+    python -m benchmarks.bench_listener_fanout --latency 0.05
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from loguru import logger
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from playerokapi.account import Account
+from playerokapi.listener.listener import EventListener
+
+
+USER = {"id": "buyer", "username": "buyer"}
+STATE = {"chats": [], "messages": {}, "latency": 0.05}
+
+
+def message(id: str, created_at: str) -> dict:
+    return {"id": id, "text": id, "createdAt": created_at, "user": USER}
+
+
+def chat(id: str, last_message: dict) -> dict:
+    return {"id": id, "type": "PM", "unreadMessagesCounter": 0, "participants": [USER], "lastMessage": last_message}
+
+
+def page(items: list, variables: dict) -> dict:
+    pagination = variables.get("pagination") or {}
+    after = pagination.get("after") or variables.get("after")
+    start = int(after) if after else 0
+    chunk = items[start:start + (pagination.get("first") or 24)]
+    end = start + len(chunk)
+    return {
+        "edges": [{"node": item} for item in chunk],
+        "pageInfo": {"startCursor": str(start), "endCursor": str(end),
+                     "hasPreviousPage": start > 0, "hasNextPage": end < len(items)},
+        "totalCount": len(items),
+    }
+
+
+def answer(operation: str, variables: dict) -> dict:
+    if operation == "chats":
+        return {"data": {"chats": page(STATE["chats"], variables)}}
+    if operation == "chatMessages":
+        return {"data": {"chatMessages": page(STATE["messages"][variables["filter"]["chatId"]], variables)}}
+    return {"data": {operation: None}}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """ Отвечает на GraphQL запросы (в том числе массивом) с задержкой. """
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, data):
+        time.sleep(STATE["latency"])
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        variables = json.loads(query.get("variables", ["{}"])[0])
+        self._send(answer(query["operationName"][0], variables))
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if isinstance(body, list):
+            return self._send([answer(b["operationName"], b.get("variables") or {}) for b in body])
+        self._send(answer(body["operationName"], body.get("variables") or {}))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def prepare(chats_count: int, changed: int, new_messages: int):
+    """ Создаёт чаты и меняет первые `changed` из них, добавляя по `new_messages` сообщений. """
+    old = "2026-01-01T00:00:00"
+    STATE["chats"] = [chat(f"c{i}", message(f"c{i}-0", old)) for i in range(chats_count)]
+    STATE["messages"] = {f"c{i}": [message(f"c{i}-0", old)] for i in range(chats_count)}
+    snapshot = {c["id"]: (c["lastMessage"]["id"], old) for c in STATE["chats"]}
+    for i in range(changed):
+        msgs = [message(f"c{i}-{n}", f"2026-01-01T00:01:{n:02d}") for n in range(new_messages, 0, -1)]
+        STATE["messages"][f"c{i}"] = msgs + STATE["messages"][f"c{i}"]
+        STATE["chats"][i] = chat(f"c{i}", msgs[0])
+    return snapshot
+
+
+def bench(url: str, changed: int, concurrency: int, rounds: int) -> tuple[float, float]:
+    account = Account(token="bench")
+    account.base_url = url
+    account.id = "seller"
+    account.max_concurrent_requests = concurrency
+    listener = EventListener(account, page_budget=changed * 2)
+    average, last = 0, 0
+    for _ in range(rounds):
+        snapshot = prepare(changed + 10, changed, 15)
+        listener._pages_left = listener.page_budget
+        # каждый цикл создаёт те же ID сообщений, поэтому индекс обработанных сбрасывается
+        listener.dedup = type(listener.dedup)()
+        start = time.perf_counter()
+        new_chats = listener.get_chats(snapshot)
+        events = listener.get_message_events(snapshot, new_chats)
+        elapsed = time.perf_counter() - start
+        assert len(events) == changed * 15, len(events)
+        # ивенты доступны, когда цикл закончен, поэтому задержка каждого — время цикла
+        average += elapsed / rounds
+        last = max(last, elapsed)
+    account.close()
+    return average, last
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--latency", type=float, default=0.05, help="Задержка ответа заглушки в секундах")
+    arg_parser.add_argument("--rounds", type=int, default=3, help="Кол-во циклов в каждом прогоне")
+    arg_parser.add_argument("--concurrency", type=int, default=8, help="Кол-во параллельных запросов во втором прогоне")
+    args = arg_parser.parse_args()
+    logging.getLogger("primp").setLevel(logging.WARNING)
+    logger.remove()
+
+    STATE["latency"] = args.latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        print(f"{'Чатов':>6} | {'по очереди, ср/макс':>22} | {'параллельно, ср/макс':>22} | ускорение")
+        for changed in (1, 5, 20):
+            before = bench(url, changed, 1, args.rounds)
+            after = bench(url, changed, args.concurrency, args.rounds)
+            print(f"{changed:>6} | {before[0] * 1000:9.0f} / {before[1] * 1000:6.0f} мс | "
+                  f"{after[0] * 1000:9.0f} / {after[1] * 1000:6.0f} мс | {before[0] / after[0]:6.2f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
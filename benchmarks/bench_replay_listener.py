@@ -0,0 +1,93 @@
+"""
+Бенчмарк EventListener на записанном трафике.
+
+Воспроизводит запись `TrafficRecorder` (например, снятую с живого аккаунта через настройку
+`playerokapi_traffic_record_path`) через `TrafficReplayer` и прогоняет по ней циклы слушателя.
+Измеряется время цикла (среднее и p95) и кол-во ивентов, поэтому регрессии горячего пути
+слушателя видны без обращения к сайту.
+
+Если запись не указана, она сначала снимается с локальной HTTP заглушки
+(20 изменившихся чатов по 15 новых сообщений, как в bench_listener_fanout).
+
+Запуск (из корня репозитория):
+    python -m benchmarks.bench_replay_listener --speed 0
+    python -m benchmarks.bench_replay_listener --path traffic.jsonl.gz --cycles 50 --speed 10
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from loguru import logger
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from playerokapi.account import Account
+from playerokapi.listener.listener import EventListener
+from playerokapi.recording import TrafficRecorder, TrafficReplayer
+from benchmarks.bench_listener_fanout import StubHandler, STATE, prepare
+
+
+def record_stub(path: str, cycles: int):
+    """ Снимает запись циклов слушателя с локальной заглушки. """
+    STATE["latency"] = 0.01
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    account = Account(token="bench")
+    account.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    account.id = "seller"
+    account.recorder = TrafficRecorder(path)
+    try:
+        run_cycles(account, cycles)
+    finally:
+        account.recorder.close()
+        account.close()
+        server.shutdown()
+
+
+def run_cycles(account: Account, cycles: int) -> tuple[list[float], int]:
+    """ Прогоняет циклы слушателя: (время каждого цикла в секундах, всего ивентов). """
+    listener = EventListener(account, page_budget=40)
+    timings, events = [], 0
+    for _ in range(cycles):
+        snapshot = prepare(30, 20, 15)
+        listener._pages_left = listener.page_budget
+        listener.dedup = type(listener.dedup)()
+        start = time.perf_counter()
+        new_chats = listener.get_chats(snapshot)
+        events += len(listener.get_message_events(snapshot, new_chats))
+        timings.append(time.perf_counter() - start)
+    return timings, events
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--path", help="Файл записи трафика (по умолчанию снимается с локальной заглушки)")
+    arg_parser.add_argument("--cycles", type=int, default=20, help="Кол-во циклов слушателя")
+    arg_parser.add_argument("--speed", type=float, default=0, help="Ускорение воспроизведения (0 — без задержек)")
+    args = arg_parser.parse_args()
+    logging.getLogger("primp").setLevel(logging.WARNING)
+    logger.remove()
+
+    path = args.path
+    if not path:
+        path = os.path.join(tempfile.mkdtemp(), "traffic.jsonl.gz")
+        record_stub(path, args.cycles)
+        print(f"Запись снята с заглушки: {path} ({os.path.getsize(path)} байт)")
+
+    account = Account(token="bench")
+    account.id = "seller"
+    account.replayer = TrafficReplayer(path, speed=args.speed)
+    timings, events = run_cycles(account, args.cycles)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"Циклов: {len(timings)}, ивентов: {events}")
+    print(f"Время цикла: среднее {sum(timings) / len(timings) * 1000:.1f} мс, p95 {p95 * 1000:.1f} мс")
+    print(f"Воспроизведение: {account.replayer.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
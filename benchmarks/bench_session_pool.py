@@ -0,0 +1,125 @@
+"""
+Бенчмарк пула HTTP клиентов Account.
+
+Сравнивает количество запросов в секунду к локальному HTTPS серверу-заглушке:
+- "до": новый primp.Client на каждый запрос (TCP + TLS рукопожатие каждый раз);
+- "после": Account.request с долгоживущим клиентом из пула.
+
+Запуск (из корня репозитория, нужен openssl в PATH):
+    python -m benchmarks.bench_session_pool --requests 200
+"""
+import argparse
+import json
+import logging
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from primp import Client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from playerokapi.account import Account
+
+
+RESPONSE_BODY = json.dumps({"data": {"viewer": {"id": "1", "username": "bench"}}}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """ Отвечает на любой GraphQL запрос одинаковым JSON с keep-alive. """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    def _answer(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    do_GET = _answer
+    do_POST = _answer
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_certificate(folder: str) -> tuple[str, str]:
+    """ Генерирует самоподписанный сертификат для 127.0.0.1 с помощью openssl. """
+    cert_path = os.path.join(folder, "cert.pem")
+    key_path = os.path.join(folder, "key.pem")
+    subprocess.check_call(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-keyout", key_path, "-out", cert_path],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return cert_path, key_path
+
+
+def start_server(cert_path: str, key_path: str) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class BenchAccount(Account):
+    """ Аккаунт, доверяющий самоподписанному сертификату заглушки. """
+
+    def _create_client(self, proxy):
+        return Client(referer=False, proxy=proxy, cookie_store=False, verify=False)
+
+
+def bench_new_client_per_request(url: str, count: int) -> float:
+    payload = {"operationName": "viewer", "variables": "{}"}
+    start = time.perf_counter()
+    for _ in range(count):
+        client = Client(referer=False, cookie_store=False, verify=False)
+        client.get(url, params=payload, timeout=15).json()
+    return count / (time.perf_counter() - start)
+
+
+def bench_pooled_account(url: str, count: int) -> float:
+    account = BenchAccount(token="bench")
+    payload = {"operationName": "viewer", "variables": "{}"}
+    account.request("get", url, {}, payload)  # прогрев, как в Account.get()
+    start = time.perf_counter()
+    for _ in range(count):
+        account.request("get", url, {}, payload).json()
+    rps = count / (time.perf_counter() - start)
+    account.close()
+    return rps
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--requests", type=int, default=200, help="Кол-во запросов в каждом прогоне")
+    args = arg_parser.parse_args()
+    logging.getLogger("primp").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as folder:
+        server = start_server(*make_certificate(folder))
+        url = f"https://127.0.0.1:{server.server_address[1]}/graphql"
+        try:
+            before = bench_new_client_per_request(url, args.requests)
+            after = bench_pooled_account(url, args.requests)
+        finally:
+            server.shutdown()
+
+    print(f"Новый клиент на каждый запрос: {before:8.1f} req/s")
+    print(f"Пул клиентов Account:          {after:8.1f} req/s")
+    print(f"Ускорение:                     {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Проверка транспорта подписки (graphql-ws) на локальной заглушке websocket сервера.
+
+Заглушка на aiohttp говорит по протоколу `graphql-transport-ws` и на каждом подключении
+разыгрывает свой сценарий, а транспорт `SubscriptionTransport` переподключается после каждого обрыва:
+1. ack, ping (ждёт pong), несколько `next`, `next` без поля операции, `complete`;
+2. ack, несколько `next`, `error`;
+3. ack, `next` с ошибками GraphQL;
+4. сервер не подтверждает соединение (`connection_error` вместо `connection_ack`);
+5. ack, несколько `next`, соединение обрывается без закрывающего сообщения;
+6. ack, несколько `next`, соединение остаётся открытым до конца проверки.
+Проверяется, что все обновления дошли (пустое — как `None`), на ping пришёл pong,
+счётчики подключений/переподключений/ошибок совпадают со сценарием, а паузы между
+подключениями идут по расписанию экспоненциального бэкоффа (сбрасываясь после полученных обновлений).
+
+Запуск (из корня репозитория):
+    python -m benchmarks.bench_subscription --updates 5
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+from aiohttp import web, WSMsgType
+from loguru import logger
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from playerokapi.account import Account
+from playerokapi.listener.subscription import GRAPHQL_WS_PROTOCOL, SubscriptionTransport
+
+
+SCENARIOS = ["complete", "error", "graphql_errors", "no_ack", "drop", "open"]
+STATE = {"updates": 5, "connections": [], "pongs": 0, "subscribed": []}
+
+
+def update(n: int) -> dict:
+    return {"chatUpdated": {"id": f"c{n}", "type": "PM", "lastMessage": {"id": f"m{n}"}}}
+
+
+async def handler(request: web.Request) -> web.WebSocketResponse:
+    ws = web.WebSocketResponse(protocols=(GRAPHQL_WS_PROTOCOL,))
+    await ws.prepare(request)
+    index = len(STATE["connections"])
+    scenario = SCENARIOS[min(index, len(SCENARIOS) - 1)]
+    connection = {"scenario": scenario, "opened_at": time.monotonic(), "closed_at": None}
+    STATE["connections"].append(connection)
+    try:
+        init = await ws.receive_json()
+        assert init["type"] == "connection_init", init
+        if scenario == "no_ack":
+            await ws.send_json({"type": "connection_error", "payload": {"message": "unauthorized"}})
+            await ws.close()
+            return ws
+        await ws.send_json({"type": "connection_ack"})
+        subscribe = await ws.receive_json()
+        assert subscribe["type"] == "subscribe", subscribe
+        STATE["subscribed"].append(subscribe["payload"]["operationName"])
+
+        if scenario == "complete":
+            await ws.send_json({"type": "ping"})
+            pong = await ws.receive_json()
+            assert pong["type"] == "pong", pong
+            STATE["pongs"] += 1
+        if scenario == "graphql_errors":
+            await ws.send_json({"id": "1", "type": "next", "payload": {"errors": [{"message": "forbidden"}]}})
+            await ws.receive()  # ждём, пока клиент закроет соединение
+            return ws
+        for n in range(STATE["updates"]):
+            await ws.send_json({"id": "1", "type": "next", "payload": {"data": update(index * 100 + n)}})
+        if scenario == "complete":
+            await ws.send_json({"id": "1", "type": "next", "payload": {"data": {}}})
+            await ws.send_json({"id": "1", "type": "complete"})
+        elif scenario == "error":
+            await ws.send_json({"id": "1", "type": "error", "payload": [{"message": "internal"}]})
+        elif scenario == "drop":
+            await ws.close()
+            return ws
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+    finally:
+        connection["closed_at"] = time.monotonic()
+    return ws
+
+
+async def run(updates: int, reconnect_delay: float) -> int:
+    STATE["updates"] = updates
+    app = web.Application()
+    app.router.add_get("/graphql", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    account = Account(token="bench")
+    account.base_url = f"http://127.0.0.1:{port}"
+    account.id = "seller"
+    transport = SubscriptionTransport(account, reconnect_delay=reconnect_delay,
+                                      max_reconnect_delay=reconnect_delay * 8, heartbeat=5)
+    # обновления сценариев complete, error и drop плюс пустое обновление (дальше ещё открытый сценарий)
+    expected = updates * 3 + 1
+    received = []
+
+    async def consume():
+        async for data in transport.listen():
+            received.append(data)
+            if len(received) >= expected + updates:
+                return
+
+    started_at = time.perf_counter()
+    await asyncio.wait_for(consume(), 30)
+    elapsed = time.perf_counter() - started_at
+    await transport.close()
+    await runner.cleanup()
+    account.close()
+
+    # пауза перед подключением: сбрасывается до минимальной после подключения с обновлениями,
+    # иначе удваивается (с разбросом ±20%)
+    expected_delays = [1, 1, 2, 4, 1]
+    failures = []
+    print(f"{'Сценарий':>15} | пауза перед следующим, мс | ожидалось, мс")
+    connections = STATE["connections"]
+    for connection, next_connection, factor in zip(connections, connections[1:], expected_delays):
+        gap = next_connection["opened_at"] - connection["closed_at"]
+        low, high = reconnect_delay * factor * 0.8, reconnect_delay * factor * 1.2
+        print(f"{connection['scenario']:>15} | {gap * 1000:>25.0f} | {low * 1000:.0f}-{high * 1000:.0f}")
+        # сервер замечает закрытие чуть позже клиента, поэтому нижняя граница с запасом
+        if not low * 0.5 <= gap <= high + 0.25:
+            failures.append(f"пауза после сценария {connection['scenario']}: {gap:.3f} сек.")
+
+    stats = transport.get_stats()
+    print(f"\nОбновлений: {len(received)} за {elapsed:.2f} сек., пустых: {received.count(None)}, pong: {STATE['pongs']}")
+    print(f"Статистика транспорта: {stats}")
+    checks = {
+        "все обновления получены": len(received) == expected + updates,
+        "пустое обновление отдано как None": received.count(None) == 1,
+        "ids в порядке отправки": [d["id"] for d in received if d][:updates] == [f"c{n}" for n in range(updates)],
+        "на ping отправлен pong": STATE["pongs"] == 1,
+        "подписка на chatUpdated": set(STATE["subscribed"]) == {"chatUpdated"},
+        "подключений": stats["connections"] == 5,
+        "переподключений": stats["reconnects"] == 5,
+        "ошибок": stats["errors"] == 5,
+        "messages": stats["messages"] == len(received),
+    }
+    for name, ok in checks.items():
+        if not ok:
+            failures.append(name)
+    for failure in failures:
+        print(f"ОШИБКА: {failure}")
+    print("OK" if not failures else f"Проверок не пройдено: {len(failures)}")
+    return 1 if failures else 0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--updates", type=int, default=5, help="Кол-во обновлений в каждом сценарии")
+    arg_parser.add_argument("--reconnect-delay", type=float, default=0.1, help="Минимальная пауза переподключения в секундах")
+    args = arg_parser.parse_args()
+    logging.getLogger("primp").setLevel(logging.WARNING)
+    logger.remove()
+    sys.exit(asyncio.run(run(args.updates, args.reconnect_delay)))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ logger.add("logs/app.log")
 
 from core.modules_manager import ModulesManager
 from core.handlers_manager import HandlersManager
+from core.handler_stats import handler_profiler
+from core.handler_runner import handler_runner
 
 from core.console import set_title, setup_logger
 import asyncio
@@ -30,15 +32,34 @@ from services.updater import Updater
 
 
 from tgbot import set_telegram_bot, set_loop
+from plbot import get_playerok_bots
+from playerokapi import set_account
 
 
 async def start_playerok_bot():
-    """Запускает FunPay бота в отдельном потоке."""
+    """Запускает Playerok ботов всех аккаунтов из конфига в одном отдельном потоке (в общем event loop'е)."""
     plbot_loop = asyncio.new_event_loop()
-    plbot = PlayerokBot()
+    # замер и запуск хендлеров общие для всех аккаунтов, поэтому настраиваются один раз по основному конфигу
+    config = Config.get()
+    handler_profiler.slow_threshold = config["handler_slow_threshold"]
+    handler_runner.max_workers = config["handler_executor_workers"]
+    handler_runner.timeout = config["handler_timeout"]
+    handler_runner.breaker_threshold = config["handler_breaker_threshold"]
+    plbots = []
+    for name in Config.get_account_names():
+        try:
+            # дополнительные аккаунты используют соединения основного
+            plbots.append(PlayerokBot(name, shared_with=plbots[0] if plbots else None))
+        except Exception as e:
+            if not plbots:
+                raise
+            logger.error(f"{Fore.LIGHTRED_EX}Не удалось запустить бота аккаунта {name}: {Fore.WHITE}{e}")
+    set_account(plbots[0].playerok_account)
 
     def run():
-        plbot_loop.run_until_complete(plbot.run_bot())
+        async def run_all():
+            await asyncio.gather(*(plbot.run_bot() for plbot in plbots))
+        plbot_loop.run_until_complete(run_all())
 
     Thread(target=run, daemon=True).start()
 
@@ -91,7 +112,8 @@ if __name__ == "__main__":
             if "ON_MODULE_CONNECTED" in module.bot_event_handlers and module.enabled:
                 for handler in module.bot_event_handlers["ON_MODULE_CONNECTED"]:
                     try:
-                        handler(module)
+                        with handler_profiler.measure(handler, "ON_MODULE_CONNECTED"):
+                            handler(module)
                     except Exception as e:
                         logger.error(
                             f"{Fore.LIGHTRED_EX}Ошибка при обработке хендлера ивента ON_MODULE_CONNECTED: {Fore.WHITE}{e}"
@@ -107,7 +129,8 @@ if __name__ == "__main__":
             if "ON_INIT" in bot_event_handlers:
                 for handler in bot_event_handlers["ON_INIT"]:
                     try:
-                        handler()
+                        with handler_profiler.measure(handler, "ON_INIT"):
+                            handler()
                     except Exception as e:
                         logger.error(
                             f"{Fore.LIGHTRED_EX}Ошибка при обработке хендлера ивента ON_INIT: {Fore.WHITE}{e}"
@@ -120,3 +143,10 @@ if __name__ == "__main__":
         asyncio.run(start_telegram_bot())
     except Exception as e:
         traceback.print_exc()
+    finally:
+        from playerokapi import get_account
+        for plbot in get_playerok_bots().values():
+            plbot.playerok_account.close()
+        handler_runner.shutdown()
+        if get_account() is not None:
+            get_account().close()
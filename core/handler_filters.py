@@ -0,0 +1,209 @@
+import re
+from typing import Callable, Iterable
+
+from playerokapi.enums import ChatTypes, ItemDealStatuses
+
+
+def _as_tuple(value) -> tuple:
+    if value is None:
+        return ()
+    if isinstance(value, (str, bytes, re.Pattern)) or not isinstance(value, Iterable):
+        return (value,)
+    return tuple(value)
+
+
+def _message_text(event) -> str | None:
+    message = getattr(event, "message", None)
+    text = getattr(message, "text", None)
+    return text.strip().lower() if text else None
+
+
+class FilteredHandler:
+    """
+    Хендлер ивента Playerok с фильтрами.\n
+    Фильтры объявляются прямо в `PLAYEROK_EVENT_HANDLERS` модуля, а диспетчер собирает их в индекс,
+    поэтому хендлер вызывается только для подходящих ивентов и не проверяет их сам.
+    Если заданы несколько фильтров, ивент должен подходить под все; если у фильтра несколько
+    значений — под любое из них.
+
+    Пример:
+        `EventTypes.NEW_MESSAGE: [FilteredHandler(handler_help, command=["!помощь", "!help"], not_own=True)]`
+
+    :param handler: Хендлер `(plbot, event)`.
+    :type handler: `callable`
+
+    :param command: Точный текст сообщения (без учёта регистра и пробелов по краям), _опционально_.
+    :type command: `str` or `list[str]` or `None`
+
+    :param prefix: Начало текста сообщения (без учёта регистра), _опционально_.
+    :type prefix: `str` or `list[str]` or `None`
+
+    :param regex: Регулярное выражение, которое должно найтись в тексте сообщения, _опционально_.
+    :type regex: `str` or `re.Pattern` or `list` or `None`
+
+    :param chat_type: Тип чата ивента, _опционально_.
+    :type chat_type: `PlayerokAPI.enums.ChatTypes` or `list` or `None`
+
+    :param not_own: Пропускать сообщения, отправленные самим аккаунтом бота (и системные сообщения без отправителя).
+    :type not_own: `bool`
+
+    :param deal_status: Статус сделки ивента, _опционально_.
+    :type deal_status: `PlayerokAPI.enums.ItemDealStatuses` or `list` or `None`
+    """
+
+    def __init__(self, handler: Callable, command: str | list[str] | None = None,
+                 prefix: str | list[str] | None = None, regex: str | re.Pattern | list | None = None,
+                 chat_type: ChatTypes | list[ChatTypes] | None = None, not_own: bool = False,
+                 deal_status: ItemDealStatuses | list[ItemDealStatuses] | None = None):
+        self.handler: Callable = handler
+        """ Хендлер. """
+        self.commands: tuple[str] = tuple(c.strip().lower() for c in _as_tuple(command))
+        """ Точные тексты сообщений. """
+        self.prefixes: tuple[str] = tuple(p.lower() for p in _as_tuple(prefix))
+        """ Начала текста сообщений. """
+        self.regexes: tuple[re.Pattern] = tuple(re.compile(r) for r in _as_tuple(regex))
+        """ Регулярные выражения по тексту сообщения. """
+        self.chat_types: frozenset[ChatTypes] = frozenset(_as_tuple(chat_type))
+        """ Типы чатов. """
+        self.not_own: bool = not_own
+        """ Пропускать ли сообщения самого аккаунта. """
+        self.deal_statuses: frozenset[ItemDealStatuses] = frozenset(_as_tuple(deal_status))
+        """ Статусы сделки. """
+
+    def __call__(self, plbot, event):
+        return self.handler(plbot, event)
+
+    def __repr__(self) -> str:
+        return f"<FilteredHandler {getattr(self.handler, '__qualname__', self.handler)}>"
+
+    @property
+    def has_text_filter(self) -> bool:
+        return bool(self.commands or self.prefixes or self.regexes)
+
+    def check(self, plbot, event) -> bool:
+        """
+        Проверяет, подходит ли ивент под все фильтры хендлера.
+
+        :param plbot: Playerok бот, получивший ивент.
+        :type plbot: `plbot.playerokbot.PlayerokBot`
+
+        :param event: Ивент Playerok.
+        :type event: ивент `PlayerokAPI.listener.events`
+
+        :return: True, если хендлер нужно вызвать.
+        :rtype: `bool`
+        """
+        if self.has_text_filter and not self.check_text(_message_text(event), getattr(getattr(event, "message", None), "text", None)):
+            return False
+        return self.check_rest(plbot, event)
+
+    def check_text(self, text: str | None, raw_text: str | None) -> bool:
+        """ Проверяет текстовые фильтры (нормализованный текст и исходный текст для регулярных выражений). """
+        if text is None:
+            return False
+        return (text in self.commands
+                or any(text.startswith(p) for p in self.prefixes)
+                or any(r.search(raw_text) for r in self.regexes))
+
+    def check_rest(self, plbot, event) -> bool:
+        """ Проверяет нетекстовые фильтры (тип чата, отправитель, статус сделки). """
+        if self.chat_types and getattr(event.chat, "type", None) not in self.chat_types:
+            return False
+        if self.not_own:
+            user = getattr(getattr(event, "message", None), "user", None)
+            if user is None or user.id == plbot.playerok_account.id:
+                return False
+        if self.deal_statuses and getattr(getattr(event, "deal", None), "status", None) not in self.deal_statuses:
+            return False
+        return True
+
+
+def handler_filters(**filters) -> Callable[[Callable], FilteredHandler]:
+    """
+    Декоратор, оборачивающий хендлер в `FilteredHandler` с переданными фильтрами.
+
+    Пример:
+        `@handler_filters(prefix="!", not_own=True)`
+    """
+    def decorator(handler: Callable) -> FilteredHandler:
+        return FilteredHandler(handler, **filters)
+    return decorator
+
+
+class HandlerIndex:
+    """
+    Индекс хендлеров одного типа ивентов, собранный из их фильтров.\n
+    Точные команды ищутся по словарю, префиксы — по первой букве, статусы сделки — по словарю,
+    а регулярные выражения и остальные фильтры проверяются только у отобранных хендлеров.
+    Хендлеры без фильтров вызываются всегда, порядок хендлеров сохраняется.
+
+    :param handlers: Хендлеры ивента в порядке вызова.
+    :type handlers: `tuple`
+    """
+
+    def __init__(self, handlers: tuple):
+        self.handlers: tuple = handlers
+        """ Хендлеры ивента в порядке вызова. """
+        self.filtered: bool = any(isinstance(h, FilteredHandler) for h in handlers)
+        """ Есть ли среди хендлеров хендлеры с фильтрами. """
+
+        self._always: list[int] = []
+        self._by_command: dict[str, list[int]] = {}
+        self._by_prefix_char: dict[str, list[tuple[str, int]]] = {}
+        self._by_deal_status: dict[ItemDealStatuses, list[int]] = {}
+        self._by_regex: list[int] = []
+        for i, handler in enumerate(handlers):
+            if not isinstance(handler, FilteredHandler):
+                self._always.append(i)
+            elif handler.has_text_filter:
+                for command in handler.commands:
+                    self._by_command.setdefault(command, []).append(i)
+                for prefix in handler.prefixes:
+                    self._by_prefix_char.setdefault(prefix[:1], []).append((prefix, i))
+                if handler.regexes:
+                    self._by_regex.append(i)
+            elif handler.deal_statuses:
+                for status in handler.deal_statuses:
+                    self._by_deal_status.setdefault(status, []).append(i)
+            else:
+                self._always.append(i)
+
+    def match(self, plbot, event) -> tuple | list:
+        """
+        Отбирает хендлеры, подходящие под ивент.
+
+        :param plbot: Playerok бот, получивший ивент.
+        :type plbot: `plbot.playerokbot.PlayerokBot`
+
+        :param event: Ивент Playerok.
+        :type event: ивент `PlayerokAPI.listener.events`
+
+        :return: Подходящие хендлеры в порядке вызова.
+        :rtype: `tuple` or `list`
+        """
+        if not self.filtered:
+            return self.handlers
+        candidates = set(self._always)
+        raw_text = getattr(getattr(event, "message", None), "text", None)
+        text = _message_text(event)
+        if text is not None:
+            candidates.update(self._by_command.get(text, ()))
+            for prefix, i in self._by_prefix_char.get(text[:1], ()):
+                if text.startswith(prefix):
+                    candidates.add(i)
+            for prefix, i in self._by_prefix_char.get("", ()):
+                candidates.add(i)
+            for i in self._by_regex:
+                if i not in candidates and self.handlers[i].check_text(text, raw_text):
+                    candidates.add(i)
+        status = getattr(getattr(event, "deal", None), "status", None)
+        if status is not None:
+            candidates.update(self._by_deal_status.get(status, ()))
+
+        matched = []
+        for i in sorted(candidates):
+            handler = self.handlers[i]
+            if isinstance(handler, FilteredHandler) and not handler.check_rest(plbot, event):
+                continue
+            matched.append(handler)
+        return matched
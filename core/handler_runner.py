@@ -0,0 +1,252 @@
+import asyncio
+import contextvars
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from logging import getLogger
+from threading import Lock
+from typing import Any, Callable
+
+from core.modules_manager import ModulesManager, Module
+from core.handler_stats import handler_name
+
+
+logger = getLogger("UNIVERSAL.Handlers")
+
+
+class HandlerTimeoutError(Exception):
+    """ Хендлер не уложился в отведённое время. """
+
+    def __init__(self, handler: Callable, timeout: float):
+        self.handler = handler
+        self.timeout = timeout
+
+    def __str__(self):
+        return f"Хендлер {handler_name(self.handler)} не завершился за {self.timeout} сек."
+
+
+class HandlerBreaker:
+    """
+    Предохранитель одного хендлера.
+
+    :param name: Имя хендлера.
+    :type name: `str`
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        """ Имя хендлера. """
+        self.timeouts: int = 0
+        """ Всего вызовов, прерванных по таймауту. """
+        self.consecutive_timeouts: int = 0
+        """ Таймаутов подряд. """
+        self.open_until: float = 0
+        """ До какого момента (time.monotonic) хендлер пропускается. """
+        self.skipped: int = 0
+        """ Сколько вызовов пропущено, пока предохранитель был открыт. """
+        self.trips: int = 0
+        """ Сколько раз срабатывал предохранитель. """
+
+    @property
+    def is_open(self) -> bool:
+        return self.open_until > time.monotonic()
+
+    def to_dict(self) -> dict:
+        return {
+            "handler": self.name,
+            "timeouts": self.timeouts,
+            "consecutive_timeouts": self.consecutive_timeouts,
+            "open": self.is_open,
+            "skipped": self.skipped,
+            "trips": self.trips,
+        }
+
+
+class HandlerRunner:
+    """
+    Общий на весь процесс запускатор хендлеров ивентов Playerok.\n
+    Синхронные хендлеры (обычные функции) выполняются в ограниченном пуле потоков, чтобы не блокировать event loop,
+    а каждый вызов (синхронный или асинхронный) ограничен по времени `timeout`.
+    Если хендлер `breaker_threshold` раз подряд не укладывается в таймаут, срабатывает его предохранитель:
+    модуль, которому принадлежит хендлер, отключается через `ModulesManager.disable_module`,
+    а встроенный хендлер пропускается `breaker_cooldown` секунд. О срабатывании сообщается
+    через функции `on_breaker_trip` (например, в Telegram).
+
+    :param max_workers: Размер пула потоков для синхронных хендлеров.
+    :type max_workers: `int`
+
+    :param timeout: Таймаут вызова хендлера в секундах (0 — без таймаута).
+    :type timeout: `float`
+
+    :param breaker_threshold: После скольких таймаутов подряд срабатывает предохранитель хендлера (0 — никогда).
+    :type breaker_threshold: `int`
+
+    :param breaker_cooldown: Сколько секунд пропускается встроенный хендлер после срабатывания предохранителя.
+    :type breaker_cooldown: `float`
+    """
+
+    def __init__(self, max_workers: int = 4, timeout: float = 60, breaker_threshold: int = 3,
+                 breaker_cooldown: float = 300):
+        self.max_workers: int = max_workers
+        """ Размер пула потоков для синхронных хендлеров. """
+        self.timeout: float = timeout
+        """ Таймаут вызова хендлера в секундах (0 — без таймаута). """
+        self.breaker_threshold: int = breaker_threshold
+        """ После скольких таймаутов подряд срабатывает предохранитель хендлера (0 — никогда). """
+        self.breaker_cooldown: float = breaker_cooldown
+        """ Сколько секунд пропускается встроенный хендлер после срабатывания предохранителя. """
+        self.on_breaker_trip: list[Callable[[Callable, Module | None], Any]] = []
+        """ Функции `(хендлер, отключённый модуль или None)`, вызываемые при срабатывании предохранителя. """
+
+        self.sync_calls: int = 0
+        """ Сколько вызовов синхронных хендлеров выполнено в пуле потоков. """
+        self.pool_timeouts: int = 0
+        """ Сколько синхронных хендлеров не дождались свободного потока за таймаут. """
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._is_sync: dict[Callable, bool] = {}
+        self._breakers: dict[Callable, HandlerBreaker] = {}
+        self._lock = Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """ Пул потоков для синхронных хендлеров (создаётся при первом обращении). """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="handler")
+            return self._executor
+
+    def is_sync(self, handler: Callable) -> bool:
+        """ Синхронный ли хендлер (у `FilteredHandler` проверяется обёрнутый хендлер). """
+        is_sync = self._is_sync.get(handler)
+        if is_sync is None:
+            func = getattr(handler, "handler", handler)
+            is_sync = self._is_sync[handler] = not (inspect.iscoroutinefunction(func)
+                                                    or inspect.iscoroutinefunction(getattr(func, "__call__", None)))
+        return is_sync
+
+    async def run(self, handler: Callable, *args) -> Any:
+        """
+        Вызывает хендлер: синхронный — в пуле потоков, и в обоих случаях — с таймаутом.\n
+        Пока предохранитель хендлера открыт, хендлер не вызывается.
+
+        :param handler: Хендлер.
+        :type handler: `callable`
+
+        :param args: Аргументы хендлера.
+
+        :return: Результат хендлера.
+
+        :raises HandlerTimeoutError: Хендлер не уложился в таймаут.
+        """
+        breaker = self._breakers.get(handler)
+        if breaker is not None and breaker.is_open:
+            breaker.skipped += 1
+            return None
+        if self.is_sync(handler):
+            self.sync_calls += 1
+            awaitable = await self._submit(handler, *args)
+        else:
+            awaitable = handler(*args)
+        try:
+            result = await asyncio.wait_for(awaitable, self.timeout or None)
+            if inspect.isawaitable(result):  # синхронная обёртка вернула корутину
+                result = await asyncio.wait_for(result, self.timeout or None)
+        except asyncio.TimeoutError:
+            self._on_timeout(handler)
+            raise HandlerTimeoutError(handler, self.timeout) from None
+        if breaker is not None:
+            breaker.consecutive_timeouts = 0
+        return result
+
+    async def _submit(self, handler: Callable, *args) -> asyncio.Future:
+        """
+        Отправляет синхронный хендлер в пул потоков и ждёт, пока он начнёт выполняться,
+        чтобы ожидание свободного потока не засчитывалось хендлеру в таймаут.
+        """
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+
+        def call():
+            loop.call_soon_threadsafe(started.set)
+            return handler(*args)
+
+        # как asyncio.to_thread: хендлер в потоке видит контекст своего бота (get_playerok_bot(), get_account())
+        context = contextvars.copy_context()
+        future = loop.run_in_executor(self.executor, partial(context.run, call))
+        try:
+            await asyncio.wait_for(started.wait(), self.timeout or None)
+        except asyncio.TimeoutError:
+            future.cancel()
+            # все потоки заняты (скорее всего, зависшими хендлерами) — это не вина этого хендлера
+            self.pool_timeouts += 1
+            raise HandlerTimeoutError(handler, self.timeout) from None
+        return future
+
+    def _on_timeout(self, handler: Callable):
+        breaker = self._breakers.get(handler)
+        if breaker is None:
+            breaker = self._breakers[handler] = HandlerBreaker(handler_name(handler))
+        breaker.timeouts += 1
+        breaker.consecutive_timeouts += 1
+        if not self.breaker_threshold or breaker.consecutive_timeouts < self.breaker_threshold:
+            return
+        breaker.trips += 1
+        breaker.consecutive_timeouts = 0
+        module = self.get_handler_module(handler)
+        if module is not None:
+            logger.error(f"Хендлер {breaker.name} {self.breaker_threshold} раз подряд не уложился в {self.timeout} сек. — отключаем модуль {module.meta.name}")
+            ModulesManager.disable_module(module.uuid)
+        else:
+            logger.error(f"Хендлер {breaker.name} {self.breaker_threshold} раз подряд не уложился в {self.timeout} сек. — пропускаем его {self.breaker_cooldown} сек.")
+            breaker.open_until = time.monotonic() + self.breaker_cooldown
+        for callback in self.on_breaker_trip:
+            try:
+                callback(handler, module)
+            except Exception as e:
+                logger.error(f"Ошибка при уведомлении о срабатывании предохранителя хендлера {breaker.name}: {e}")
+
+    @staticmethod
+    def get_handler_module(handler: Callable) -> Module | None:
+        """
+        Получает включённый модуль, которому принадлежит хендлер ивента Playerok.
+
+        :param handler: Хендлер.
+        :type handler: `callable`
+
+        :return: Модуль или `None`, если хендлер встроенный.
+        :rtype: `Module` or `None`
+        """
+        for module in ModulesManager.get_modules():
+            if not module.enabled:
+                continue
+            for funcs in module.playerok_event_handlers.values():
+                if handler in funcs:
+                    return module
+        return None
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики запуска хендлеров.
+
+        :return: Словарь с настройками, кол-вом вызовов в пуле потоков и предохранителями хендлеров.
+        :rtype: `dict`
+        """
+        return {
+            "max_workers": self.max_workers,
+            "timeout": self.timeout,
+            "sync_calls": self.sync_calls,
+            "pool_timeouts": self.pool_timeouts,
+            "breakers": [b.to_dict() for b in self._breakers.values()],
+        }
+
+    def shutdown(self):
+        """ Останавливает пул потоков (не дожидаясь зависших хендлеров). """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+handler_runner = HandlerRunner()
@@ -0,0 +1,199 @@
+import json
+import time
+from collections import deque
+from logging import getLogger
+from threading import Lock
+from typing import Callable
+
+
+logger = getLogger("UNIVERSAL.Handlers")
+
+
+def handler_name(handler: Callable) -> str:
+    """ Имя хендлера для статистики: `модуль.функция` (у `FilteredHandler` — имя обёрнутого хендлера). """
+    handler = getattr(handler, "handler", handler)
+    module = getattr(handler, "__module__", None) or ""
+    name = getattr(handler, "__qualname__", None) or repr(handler)
+    return f"{module}.{name}" if module else name
+
+
+class HandlerStats:
+    """
+    Статистика вызовов одного хендлера.
+
+    :param name: Имя хендлера.
+    :type name: `str`
+
+    :param window: По скольким последним вызовам считаются перцентили.
+    :type window: `int`
+    """
+
+    def __init__(self, name: str, window: int = 500):
+        self.name: str = name
+        """ Имя хендлера. """
+        self.count: int = 0
+        """ Всего вызовов. """
+        self.errors: int = 0
+        """ Вызовов, завершившихся исключением. """
+        self.slow: int = 0
+        """ Вызовов дольше порога медленного хендлера. """
+        self.total_time: float = 0
+        """ Суммарное время вызовов в секундах. """
+        self.max_time: float = 0
+        """ Максимальное время вызова в секундах. """
+        self.events: set[str] = set()
+        """ Ивенты, на которые вызывался хендлер. """
+
+        self._times: deque[float] = deque(maxlen=window)
+
+    def add(self, elapsed: float, error: bool, slow: bool):
+        self.count += 1
+        self.errors += error
+        self.slow += slow
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self._times.append(elapsed)
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Получает перцентиль времени вызова.
+
+        :param percent: Перцентиль (от 0 до 100).
+        :type percent: `float`
+
+        :return: Время в секундах или `None`, если вызовов ещё не было.
+        :rtype: `float` or `None`
+        """
+        if not self._times:
+            return None
+        values = sorted(self._times)
+        index = min(len(values) - 1, int(round(percent / 100 * (len(values) - 1))))
+        return values[index]
+
+    def to_dict(self) -> dict:
+        """ Статистика хендлера в виде словаря. """
+        return {
+            "handler": self.name,
+            "events": sorted(self.events),
+            "count": self.count,
+            "errors": self.errors,
+            "slow": self.slow,
+            "total_time": self.total_time,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max_time,
+        }
+
+
+class HandlerTimer:
+    """ Контекстный менеджер, замеряющий один вызов хендлера (см. `HandlerProfiler.measure()`). """
+
+    __slots__ = ("profiler", "handler", "event", "chat_id", "started_at")
+
+    def __init__(self, profiler: "HandlerProfiler", handler: Callable, event: str, chat_id: str | None):
+        self.profiler = profiler
+        self.handler = handler
+        self.event = event
+        self.chat_id = chat_id
+        self.started_at: float = 0
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.handler, self.event, time.perf_counter() - self.started_at,
+                             error=exc_type is not None, chat_id=self.chat_id)
+        return False
+
+
+class HandlerProfiler:
+    """
+    Общий на весь процесс замер времени хендлеров.\n
+    Каждый вызов хендлера ивента Playerok и ивента бота (`ON_*`) замеряется монотонными часами,
+    время складывается в статистику по хендлеру (кол-во вызовов, p50/p95/макс., ошибки),
+    а вызовы дольше `slow_threshold` логируются с ивентом и ID чата —
+    так видно, хендлер какого модуля тормозит бота.
+
+    :param slow_threshold: Порог медленного вызова хендлера в секундах (0 — не логировать).
+    :type slow_threshold: `float`
+    """
+
+    def __init__(self, slow_threshold: float = 1):
+        self.slow_threshold: float = slow_threshold
+        """ Порог медленного вызова хендлера в секундах (0 — не логировать). """
+        self.started_at: float = time.time()
+        """ Время начала сбора статистики. """
+
+        self._stats: dict[Callable, HandlerStats] = {}
+        self._lock = Lock()
+
+    def measure(self, handler: Callable, event: str, chat_id: str | None = None) -> HandlerTimer:
+        """
+        Замеряет вызов хендлера: `with handler_profiler.measure(handler, "NEW_MESSAGE", chat.id): ...`
+
+        :param handler: Хендлер.
+        :type handler: `callable`
+
+        :param event: Название ивента.
+        :type event: `str`
+
+        :param chat_id: ID чата ивента, _опционально_.
+        :type chat_id: `str` or `None`
+        """
+        return HandlerTimer(self, handler, event, chat_id)
+
+    def record(self, handler: Callable, event: str, elapsed: float, error: bool = False, chat_id: str | None = None):
+        """
+        Записывает вызов хендлера.
+
+        :param handler: Хендлер.
+        :type handler: `callable`
+
+        :param event: Название ивента.
+        :type event: `str`
+
+        :param elapsed: Время вызова в секундах.
+        :type elapsed: `float`
+
+        :param error: Завершился ли вызов исключением.
+        :type error: `bool`
+
+        :param chat_id: ID чата ивента, _опционально_.
+        :type chat_id: `str` or `None`
+        """
+        slow = 0 < self.slow_threshold <= elapsed
+        with self._lock:
+            stats = self._stats.get(handler)
+            if stats is None:
+                stats = self._stats[handler] = HandlerStats(handler_name(handler))
+            stats.add(elapsed, error, slow)
+            stats.events.add(event)
+        if slow:
+            logger.warning(f"Медленный хендлер {stats.name}: {elapsed:.2f} сек. в ивенте {event}"
+                           + (f" (чат {chat_id})" if chat_id else ""))
+
+    def get_stats(self) -> list[dict]:
+        """
+        Получает статистику хендлеров.
+
+        :return: Статистика хендлеров, отсортированная по суммарному времени вызовов (сначала самые затратные).
+        :rtype: `list[dict]`
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+        return [s.to_dict() for s in sorted(stats, key=lambda s: s.total_time, reverse=True)]
+
+    def dump(self) -> str:
+        """ Статистика хендлеров в JSON (для выгрузки и внешних скриптов). """
+        return json.dumps({"since": self.started_at, "slow_threshold": self.slow_threshold,
+                           "handlers": self.get_stats()}, ensure_ascii=False, indent=2)
+
+    def reset(self):
+        """ Сбрасывает статистику. """
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+
+handler_profiler = HandlerProfiler()
@@ -1,91 +1,193 @@
+from threading import Lock
+from types import MappingProxyType
+from typing import Mapping
+
 from playerokapi.enums import EventTypes
+from core.handler_filters import HandlerIndex
+
+_bot_event_handlers: Mapping[str, tuple] = MappingProxyType({
+    "ON_MODULE_CONNECTED": (),
+    "ON_INIT": (),
+    "ON_PLAYEROK_BOT_INIT": (),
+    "ON_TELEGRAM_BOT_INIT": ()
+})
+""" Хендлеры ивентов бота (неизменяемая таблица, заменяется целиком при каждом изменении). """
+_playerok_event_handlers: Mapping[EventTypes, tuple] = MappingProxyType({
+    EventTypes.CHAT_INITIALIZED: (),
+    EventTypes.NEW_MESSAGE : (),
+    EventTypes.NEW_DEAL : (),
+    EventTypes.DEAL_CONFIRMED : (),
+    EventTypes.DEAL_ROLLED_BACK : (),
+    EventTypes.DEAL_HAS_PROBLEM : (),
+    EventTypes.DEAL_PROBLEM_RESOLVED : (),
+    EventTypes.DEAL_STATUS_CHANGED : (),
+    EventTypes.ITEM_PAID : (),
+    EventTypes.ITEM_SENT : ()
+})
+""" Хендлеры ивентов Playerok Listener`а (неизменяемая таблица, заменяется целиком при каждом изменении). """
+_playerok_event_index: Mapping[EventTypes, HandlerIndex] = MappingProxyType(
+    {event: HandlerIndex(funcs) for event, funcs in _playerok_event_handlers.items()})
+""" Индексы фильтров хендлеров ивентов Playerok (пересобираются вместе с таблицей). """
+_version: int = 0
+""" Версия таблиц хендлеров, увеличивается при каждом их изменении. """
+_write_lock = Lock()
+""" Блокировка изменений таблиц (чтение идёт без блокировки). """
+
+
+def _freeze(data: Mapping) -> Mapping:
+    return MappingProxyType({event: tuple(funcs) for event, funcs in data.items()})
+
+
+def _extend(table: Mapping, handlers: Mapping) -> Mapping:
+    new_table = dict(table)
+    for event, funcs in handlers.items():
+        new_table[event] = new_table.get(event, ()) + tuple(funcs)
+    return MappingProxyType(new_table)
+
+
+def _exclude(table: Mapping, handlers: Mapping) -> Mapping:
+    new_table = dict(table)
+    for event, funcs in handlers.items():
+        if event in new_table and funcs:
+            excluded = set(funcs)
+            new_table[event] = tuple(func for func in new_table[event] if func not in excluded)
+    return MappingProxyType(new_table)
+
+
+def _insert(table: Mapping, event, handler, index: int | None) -> Mapping:
+    new_table = dict(table)
+    funcs = list(new_table.get(event, ()))
+    if index is None:
+        funcs.append(handler)
+    else:
+        funcs.insert(index, handler)
+    new_table[event] = tuple(funcs)
+    return MappingProxyType(new_table)
 
-_bot_event_handlers = {
-    "ON_MODULE_CONNECTED": [],
-    "ON_INIT": [],
-    "ON_PLAYEROK_BOT_INIT": [],
-    "ON_TELEGRAM_BOT_INIT": []
-}
-""" Хендлеры ивентов бота. """
-_playerok_event_handlers = {
-    EventTypes.CHAT_INITIALIZED: [],
-    EventTypes.NEW_MESSAGE : [],
-    EventTypes.NEW_DEAL : [],
-    EventTypes.DEAL_CONFIRMED : [],
-    EventTypes.DEAL_ROLLED_BACK : [],
-    EventTypes.DEAL_HAS_PROBLEM : [],
-    EventTypes.DEAL_PROBLEM_RESOLVED : [],
-    EventTypes.DEAL_STATUS_CHANGED : [],
-    EventTypes.ITEM_PAID : [],
-    EventTypes.ITEM_SENT : []
-}
-""" Хендлеры ивентов Playerok Listener`а. """
 
 class HandlersManager:
     """
-    Класс, описывающий взаимодействие с хендлерами бота.
+    Класс, описывающий взаимодействие с хендлерами бота.\n
+    Таблицы хендлеров неизменяемые: `{ивент: кортеж хендлеров, ...}`. Любое изменение
+    (подключение/отключение модуля) собирает новую таблицу и атомарно подменяет ею старую,
+    поэтому диспетчер читает таблицу без блокировок, а ивент, уже начавший обрабатываться,
+    дорабатывает со старым набором хендлеров.
     """
 
+    @staticmethod
+    def get_version() -> int:
+        """ Получает версию таблиц хендлеров (меняется при каждом их изменении). """
+        return _version
+
+    @staticmethod
+    def _publish(bot_event_handlers: Mapping | None = None, playerok_event_handlers: Mapping | None = None):
+        """ Подменяет таблицы хендлеров новыми (вызывается под `_write_lock`). """
+        global _bot_event_handlers, _playerok_event_handlers, _playerok_event_index, _version
+        if bot_event_handlers is not None:
+            _bot_event_handlers = bot_event_handlers
+        if playerok_event_handlers is not None:
+            _playerok_event_index = MappingProxyType(
+                {event: HandlerIndex(funcs) for event, funcs in playerok_event_handlers.items()})
+            _playerok_event_handlers = playerok_event_handlers
+        _version += 1
+
     @staticmethod
     def set_bot_event_handlers(data: dict[str, list]):
-        global _bot_event_handlers
-        _bot_event_handlers = data
+        with _write_lock:
+            HandlersManager._publish(bot_event_handlers=_freeze(data))
 
     @staticmethod
-    def get_bot_event_handlers() -> dict[str, list]:
-        global _bot_event_handlers
+    def get_bot_event_handlers() -> Mapping[str, tuple]:
         return _bot_event_handlers
 
     @staticmethod
-    def add_bot_event_handler(event: str, handler):
-        global _bot_event_handlers
-        _bot_event_handlers[event].append(handler)
+    def add_bot_event_handler(event: str, handler, index: int | None = None):
+        """
+        Добавляет хендлер ивента бота.
+
+        :param event: Ивент бота.
+        :type event: `str`
+
+        :param handler: Хендлер.
+        :type handler: `callable`
+
+        :param index: Позиция хендлера среди хендлеров ивента (по умолчанию — в конец), _опционально_.
+        :type index: `int` or `None`
+        """
+        with _write_lock:
+            HandlersManager._publish(bot_event_handlers=_insert(_bot_event_handlers, event, handler, index))
 
     @staticmethod
     def set_playerok_event_handlers(data: dict[EventTypes, list]):
-        global _playerok_event_handlers
-        _playerok_event_handlers = data
+        with _write_lock:
+            HandlersManager._publish(playerok_event_handlers=_freeze(data))
 
     @staticmethod
-    def get_playerok_event_handlers() -> dict[EventTypes, list]:
-        global _playerok_event_handlers
+    def get_playerok_event_handlers() -> Mapping[EventTypes, tuple]:
         return _playerok_event_handlers
-    
+
+    @staticmethod
+    def get_playerok_event_index() -> Mapping[EventTypes, HandlerIndex]:
+        """ Получает индексы фильтров хендлеров ивентов Playerok: {`тип ивента`: `HandlerIndex`, ...}. """
+        return _playerok_event_index
+
     @staticmethod
-    def add_playerok_event_handler(event: EventTypes, handler):
-        global _playerok_event_handlers
-        _playerok_event_handlers[event].append(handler)
+    def match_playerok_event_handlers(plbot, event) -> tuple | list:
+        """
+        Получает хендлеры ивента Playerok, подходящие под него по фильтрам (см. `FilteredHandler`).
+
+        :param plbot: Playerok бот, получивший ивент.
+        :type plbot: `plbot.playerokbot.PlayerokBot`
+
+        :param event: Ивент Playerok.
+        :type event: ивент `PlayerokAPI.listener.events`
+
+        :return: Подходящие хендлеры в порядке вызова.
+        :rtype: `tuple` or `list`
+        """
+        index = _playerok_event_index.get(event.type)
+        return index.match(plbot, event) if index is not None else ()
+
+    @staticmethod
+    def add_playerok_event_handler(event: EventTypes, handler, index: int | None = None):
+        """
+        Добавляет хендлер ивента Playerok.
+
+        :param event: Тип ивента.
+        :type event: `PlayerokAPI.enums.EventTypes`
+
+        :param handler: Хендлер.
+        :type handler: `callable`
+
+        :param index: Позиция хендлера среди хендлеров ивента (по умолчанию — в конец), _опционально_.
+        :type index: `int` or `None`
+        """
+        with _write_lock:
+            HandlersManager._publish(playerok_event_handlers=_insert(_playerok_event_handlers, event, handler, index))
 
     @staticmethod
     def register_bot_event_handlers(handlers):
         """ Устанавливает ивент хендлеры бота. """
-        global _bot_event_handlers
-        for event_type, funcs in handlers.items():
-            if event_type not in _bot_event_handlers:
-                _bot_event_handlers[event_type] = []
-            _bot_event_handlers[event_type].extend(funcs)
+        with _write_lock:
+            HandlersManager._publish(bot_event_handlers=_extend(_bot_event_handlers, handlers))
 
     @staticmethod
     def register_playerok_event_handlers(handlers):
         """ Устанавливает хендлеры фанпей ивентов. """
-        global _playerok_event_handlers
-        for event_type, funcs in handlers.items():
-            if event_type not in _playerok_event_handlers:
-                _playerok_event_handlers[event_type] = []
-            _playerok_event_handlers[event_type].extend(funcs)
+        with _write_lock:
+            HandlersManager._publish(playerok_event_handlers=_extend(_playerok_event_handlers, handlers))
+
+    @staticmethod
+    def register_handlers(bot_event_handlers, playerok_event_handlers):
+        """ Добавляет все хендлеры модуля в глобальные таблицы одним изменением. """
+        with _write_lock:
+            HandlersManager._publish(_extend(_bot_event_handlers, bot_event_handlers),
+                                     _extend(_playerok_event_handlers, playerok_event_handlers))
 
     @staticmethod
     def remove_handlers(bot_event_handlers, playerok_event_handlers):
-        """ Удаляет все хендлеры модуля из глобальных списков. """
-        global _bot_event_handlers, _playerok_event_handlers
-        for event, funcs in bot_event_handlers.items():
-            if event in _bot_event_handlers:
-                for func in funcs:
-                    if func in _bot_event_handlers[event]:
-                        _bot_event_handlers[event].remove(func)
-        for event, funcs in playerok_event_handlers.items():
-            if event in playerok_event_handlers:
-                for func in funcs:
-                    if func in playerok_event_handlers[event]:
-                        playerok_event_handlers[event].remove(func)
-        
\ No newline at end of file
+        """ Удаляет все хендлеры модуля из глобальных таблиц одним изменением. """
+        with _write_lock:
+            HandlersManager._publish(_exclude(_bot_event_handlers, bot_event_handlers),
+                                     _exclude(_playerok_event_handlers, playerok_event_handlers))
+
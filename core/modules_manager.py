@@ -139,8 +139,7 @@ class ModulesManager:
             if not module:
                 raise Exception("Модуль не найден в загруженных")
         
-            HandlersManager.register_bot_event_handlers(module.bot_event_handlers)
-            HandlersManager.register_playerok_event_handlers(module.playerok_event_handlers)
+            HandlersManager.register_handlers(module.bot_event_handlers, module.playerok_event_handlers)
             i = _loaded_modules.index(module)
             module.enabled = True
             _loaded_modules[i] = module
@@ -284,8 +283,7 @@ class ModulesManager:
         names = []
         for module in modules:
             try:
-                HandlersManager.register_bot_event_handlers(module.bot_event_handlers)
-                HandlersManager.register_playerok_event_handlers(module.playerok_event_handlers)
+                HandlersManager.register_handlers(module.bot_event_handlers, module.playerok_event_handlers)
                 i = _loaded_modules.index(module)
                 module.enabled = True
                 _loaded_modules[i] = module
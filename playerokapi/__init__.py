@@ -1,5 +1,5 @@
-from . import types
-from . import parser
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -7,10 +7,32 @@ if TYPE_CHECKING:
 
 _account: 'Account' = None
 
+_current_account: ContextVar['Account | None'] = ContextVar("playerokapi_current_account", default=None)
+""" Аккаунт, ответ которого сейчас разбирается парсером (приоритетнее глобального аккаунта). """
+
+from . import types
+from . import parser
+
 def get_account() -> 'Account':
     global _account
-    return _account
+    return _current_account.get() or _account
 
 def set_account(value: 'Account') -> 'Account':
     global _account
-    _account = value
\ No newline at end of file
+    _account = value
+
+def set_current_account(value: 'Account'):
+    """ Задаёт аккаунт текущего контекста (задачи asyncio или потока), когда в процессе работают несколько аккаунтов. """
+    return _current_account.set(value)
+
+@contextmanager
+def use_account(value: 'Account | None'):
+    """ Временно задаёт аккаунт текущего контекста (`None` — оставляет текущий). """
+    if value is None:
+        yield get_account()
+        return
+    token = _current_account.set(value)
+    try:
+        yield value
+    finally:
+        _current_account.reset(token)
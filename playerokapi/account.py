@@ -1,16 +1,58 @@
 from __future__ import annotations
-from time import sleep
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+import time
 import tls_requests
 from typing import *
 import json
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSON_DECODE_ERRORS = (ValueError,)
+except ImportError:
+    try:
+        import msgspec
+        json_loads = msgspec.json.decode
+        JSON_DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+    except ImportError:
+        json_loads = json.loads
+        JSON_DECODE_ERRORS = (ValueError,)
 
 from . import types
 from .exceptions import *
 from .parser import *
 from .enums import *
+from . import _current_account
+from .circuit_breaker import CloudflareCircuitBreaker, cloudflare_breaker
+from .rate_limiter import RateLimiter
+from .proxy_pool import ProxyPool
+from . import operations
+from .operations import Operation
+from .uploads import Attachment, Uploads
+from .recording import TrafficRecorder, TrafficReplayer
 from primp import Client
 
 
+CLOUDFLARE_SIGNATURES = [
+    "<title>Just a moment...</title>",
+    "window._cf_chl_opt",
+    "Enable JavaScript and cookies to continue",
+    "Checking your browser before accessing",
+    "cf-browser-verification",
+]
+""" Признаки страницы проверки CloudFlare в ответе. """
+
+
+def _user_profile_from_user(data: dict) -> types.UserProfile:
+    """ Достаёт профиль пользователя из ответа `user` (ответ бывает двух типов). """
+    profile: dict = None
+    if data.get("__typename") == "UserFragment":
+        profile = data
+    elif data.get("__typename") == "User":
+        profile = data.get("profile")
+    return user_profile(profile)
+
+
 class Account:
     """
     Класс, описывающий данные и методы Playerok аккаунта.
@@ -29,6 +71,13 @@ class Account:
 
     :param request_max_retries: Максимальное количество повторных попыток отправки запроса, если была обнаружена CloudFlare защита.
     :type request_max_retries: `int`
+
+    :param rate_limiter: Ограничитель частоты запросов, _опционально_ (по умолчанию без ограничений).
+    :type rate_limiter: `PlayerokAPI.rate_limiter.RateLimiter`
+
+    :param proxies: Пул прокси (массив прокси или готовый `ProxyPool`), _опционально_.
+        Если указан, каждый запрос отправляется через прокси с лучшей оценкой, а `https_proxy` не используется.
+    :type proxies: `list[str]` or `PlayerokAPI.proxy_pool.ProxyPool`
     """
 
     def __init__(
@@ -38,6 +87,8 @@ class Account:
         https_proxy: str = None,
         requests_timeout: int = 15,
         request_max_retries: int = 30,
+        rate_limiter: RateLimiter | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         **kwargs,
     ):
         from . import set_account
@@ -52,6 +103,12 @@ class Account:
         """ Прокси. """
         self.request_max_retries = request_max_retries
         """ Максимальное количество повторных попыток отправки запроса. """
+        self.rate_limiter: RateLimiter = rate_limiter or RateLimiter(requests_per_second=None)
+        """ Ограничитель частоты запросов (общий для всех, кто использует аккаунт). """
+        self.proxy_pool: ProxyPool | None = (
+            proxies if isinstance(proxies, ProxyPool) else ProxyPool(proxies) if proxies else None
+        )
+        """ Пул прокси с оценкой их состояния. """
 
         self.base_url = "https://playerok.com"
         """ Базовый URL для всех запросов. """
@@ -87,14 +144,127 @@ class Account:
         self.profile: AccountProfile | None = None
         """ Профиль аккаунта (не путать с профилем пользователя). \n\n_Заполняется при первом использовании get()_ """
 
+        self._clients: dict[str | None, Client] = {}
+        """ 
+        Пул долгоживущих HTTP клиентов (keep-alive соединения и переиспользование TLS сессий).\n
+        В формате: {`proxy`: `client`, ...}
+        """
+        self._clients_lock = Lock()
+        """ Блокировка пула клиентов (аккаунт используется из нескольких потоков). """
+        self._warmed_up: bool = False
+        """ Были ли уже открыты соединения с сайтом. """
+        self.cloudflare_breaker: CloudflareCircuitBreaker = cloudflare_breaker
+        """ Предохранитель от CloudFlare проверки (по умолчанию общий на весь процесс). """
+        self.graphql_batching: bool = True
+        """ Отправлять ли несколько операций одним запросом (отключается сам, если сервер их не поддерживает). """
+        self.max_concurrent_requests: int = 4
+        """ Сколько запросов можно отправлять одновременно, когда несколько операций отправляются по одной. """
+        self.recorder: TrafficRecorder | None = None
+        """ Запись трафика: если указана, все ответы сайта записываются в файл. """
+        self.replayer: TrafficReplayer | None = None
+        """ Воспроизведение трафика: если указано, вместо запросов на сайт отдаются записанные ответы. """
+
         set_account(self)  # сохранение объекта аккаунта
 
+    def _create_client(self, proxy: str | None) -> Client:
+        """
+        Создаёт новый HTTP клиент для пула.
+
+        :param proxy: Прокси, через который будет работать клиент.
+        :type proxy: `str` or `None`
+
+        :return: Объект клиента.
+        :rtype: `primp.Client`
+        """
+        # cookie_store выключен, так как токен передаётся заголовком Cookie в каждом запросе
+        return Client(referer=False, proxy=proxy, cookie_store=False)
+
+    def get_client(self, proxy: str | None = None) -> Client:
+        """
+        Получает клиент из пула (создаёт его, если он ещё не создан).
+        Один клиент держит открытыми соединения с сайтом, поэтому
+        повторные запросы не тратят время на TCP и TLS рукопожатия.
+
+        :param proxy: Прокси, для которого нужен клиент. По умолчанию прокси аккаунта, _опционально_.
+        :type proxy: `str` or `None`
+
+        :return: Объект клиента.
+        :rtype: `primp.Client`
+        """
+        proxy = proxy or self.https_proxy
+        client = self._clients.get(proxy)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(proxy)
+                if client is None:
+                    client = self._create_client(proxy)
+                    self._clients[proxy] = client
+        return client
+
+    def share_connections(self, account: Account) -> Account:
+        """
+        Начинает использовать пул HTTP клиентов другого аккаунта того же типа.\n
+        Токен передаётся заголовком в каждом запросе, а cookie клиенты не хранят,
+        поэтому несколько аккаунтов в одном процессе могут держать общие соединения с сайтом.
+        Закрытие пула через `close()` закрывает соединения всех аккаунтов, которые его используют.
+
+        :param account: Аккаунт, пул клиентов которого нужно использовать.
+        :type account: `PlayerokAPI.account.Account`
+
+        :return: Этот же объект аккаунта.
+        :rtype: `PlayerokAPI.account.Account`
+        """
+        if type(account)._create_client is not type(self)._create_client:
+            raise TypeError("Пул клиентов можно разделять только между аккаунтами одного типа")
+        self._clients = account._clients
+        self._clients_lock = account._clients_lock
+        self._warmed_up = account._warmed_up
+        return self
+
+    def warm_up(self):
+        """
+        Заранее открывает соединение с сайтом, чтобы первый
+        настоящий запрос не тратил время на установку соединения.
+        Ошибки прогрева игнорируются.
+        """
+        if self.replayer is not None:
+            return
+        for proxy in self.proxy_pool.proxies if self.proxy_pool else [None]:
+            try:
+                self.get_client(proxy).head(self.base_url, timeout=self.requests_timeout)
+            except Exception:
+                pass
+        self._warmed_up = True
+
+    def close(self):
+        """
+        Закрывает все соединения пула клиентов.
+        После закрытия аккаунт можно продолжать использовать - клиенты создадутся заново.
+        """
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            exit_ = getattr(client, "__exit__", None)
+            if exit_ is not None:
+                try:
+                    exit_(None, None, None)
+                except Exception:
+                    pass
+        self._warmed_up = False
+
+    def __enter__(self) -> Account:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def request(
         self,
         method: str,
         url: str,
         headers: dict[str, str],
-        payload: dict[str, str] | None = None,
+        payload: dict[str, str] | bytes | None = None,
         files: dict | None = None,
     ) -> requests.Response:
         """
@@ -109,8 +279,8 @@ class Account:
         :param headers: Заголовки запроса.
         :type headers: `dict[str, str]`
 
-        :param payload: Payload запроса.
-        :type payload: `dict[str, str]` or `None`
+        :param payload: Payload запроса (или уже сериализованное тело POST запроса).
+        :type payload: `dict[str, str]` or `bytes` or `None`
 
         :param files: Файлы запроса.
         :type files: `dict` or `None`
@@ -119,15 +289,45 @@ class Account:
         :rtype: `requests.Response`
         """
 
-        def make_req():
-            headers["Accept-Language"] = "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7"
-            headers["Cookie"] = f"token={self.token}"
-            if self.user_agent:
-                headers["User-Agent"] = self.user_agent
-            headers["x-apollo-operation-name"] = "SomeName"
-            headers["apollo-require-preflight"] = "true"
+        return self._send(method, url, headers, payload, files)[0]
 
-            client = Client(referer=False, proxy=self.https_proxy)
+    def _request_json(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, str] | bytes | None = None,
+        files: dict | None = None,
+        check_errors: bool = True,
+    ) -> Any:
+        """
+        Отправляет запрос и возвращает уже разобранный JSON ответа
+        (без повторного декодирования тела вызывающим кодом).
+        """
+        return self._send(method, url, headers, payload, files, check_errors)[1]
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, str] | bytes | None = None,
+        files: dict | None = None,
+        check_errors: bool = True,
+    ) -> tuple[requests.Response, Any]:
+        """
+        Отправляет запрос и один раз декодирует ответ.
+
+        :param check_errors: Возбуждать ли `RequestError`, если в ответе есть GraphQL ошибки, _опционально_.
+        :type check_errors: `bool`
+
+        :return: Кортеж (ответ, разобранный JSON ответа или `None`).
+        :rtype: `tuple[requests.Response, Any]`
+        """
+
+        def make_req(proxy: str | None):
+            self._prepare_headers(headers)
+            client = self.get_client(proxy)
             if method == "get":
                 r = client.get(
                     url=url,
@@ -138,7 +338,8 @@ class Account:
             elif method == "post":
                 r = client.post(
                     url=url,
-                    json=payload if not files else None,
+                    content=payload if isinstance(payload, bytes) else None,
+                    json=payload if not files and not isinstance(payload, bytes) else None,
                     data=payload if files else None,
                     headers=headers,
                     files=files,
@@ -148,50 +349,387 @@ class Account:
                 return
             return r
 
-        resp = make_req()
-
-        cloudflare_signatures = [
-            "<title>Just a moment...</title>",
-            "window._cf_chl_opt",
-            "Enable JavaScript and cookies to continue",
-            "Checking your browser before accessing",
-            "cf-browser-verification",
-        ]
-        if any(sig in resp.text for sig in cloudflare_signatures):
-            for _ in range(self.request_max_retries):
-                sleep(5)
-                resp = make_req()
-                if not any(sig in resp.text for sig in cloudflare_signatures):
-                    break
-            else:
-                raise CloudflareDetectedException(resp)
-        if "errors" in resp.text:
-            raise RequestError(resp)
+        if self.replayer is not None:
+            resp = self.replayer.replay(method, url, payload)
+            return resp, self._check_response(resp, check_errors)
+
+        breaker = self.cloudflare_breaker
+        max_failures = breaker.failures + self.request_max_retries
+        tried_proxies = []
+        while True:
+            probe = breaker.acquire(max_failures)
+            try:
+                self.rate_limiter.acquire()
+                proxy = self.proxy_pool.choose(tried_proxies) if self.proxy_pool else None
+                started_at = time.perf_counter()
+                try:
+                    resp = make_req(proxy)
+                    connection_failed = False
+                except Exception:
+                    self._record_proxy(proxy, None)
+                    if not self._retry_with_next_proxy(proxy, tried_proxies):
+                        raise
+                    connection_failed = True
+            except BaseException:
+                # в т.ч. при отмене (CancelledError, KeyboardInterrupt): иначе пробный запрос
+                # не освободит предохранитель и все остальные запросы будут ждать вечно
+                breaker.record_error(probe)
+                raise
+            if connection_failed:
+                # ошибка соединения через прокси — повторяем запрос через следующий прокси пула
+                breaker.record_error(probe)
+                continue
+            latency = time.perf_counter() - started_at
+            challenge = self._is_cloudflare_challenge(resp)
+            self._record_proxy(proxy, resp, latency, challenge)
+            if not challenge:
+                break
+            breaker.record_challenge(probe, resp)
+        breaker.record_success(probe)
+        if self.recorder is not None:
+            self.recorder.record(method, payload, resp, latency)
+        return resp, self._check_response(resp, check_errors)
+
+    def _retry_with_next_proxy(self, proxy: str | None, tried_proxies: list[str]) -> bool:
+        """
+        Проверяет, можно ли повторить запрос, завершившийся ошибкой соединения, через другой прокси пула.
+
+        :param proxy: Прокси, через который был отправлен запрос.
+        :type proxy: `str` or `None`
+
+        :param tried_proxies: Уже опробованные для этого запроса прокси (прокси `proxy` в него добавляется).
+        :type tried_proxies: `list[str]`
+
+        :return: Есть ли в пуле ещё не опробованный прокси.
+        :rtype: `bool`
+        """
+        if not self.proxy_pool or proxy is None:
+            return False
+        tried_proxies.append(proxy)
+        return len(tried_proxies) < len(self.proxy_pool.proxies)
+
+    def _record_proxy(
+        self,
+        proxy: str | None,
+        resp: requests.Response | None,
+        latency: float | None = None,
+        challenge: bool = False,
+    ):
+        """
+        Записывает результат запроса в статистику пула прокси.
+
+        :param proxy: Прокси, через который был отправлен запрос.
+        :type proxy: `str` or `None`
+
+        :param resp: Ответ или `None`, если запрос завершился ошибкой соединения.
+        :type resp: `requests.Response` or `None`
+
+        :param latency: Время ответа в секундах.
+        :type latency: `float` or `None`
+
+        :param challenge: Вернул ли сайт страницу CloudFlare проверки.
+        :type challenge: `bool`
+        """
+        if not self.proxy_pool:
+            return
+        error = resp is None or resp.status_code >= 500
+        self.proxy_pool.record(proxy, latency, error=error, challenge=challenge)
+
+    def _prepare_headers(self, headers: dict[str, str]) -> dict[str, str]:
+        """
+        Дополняет заголовки запроса общими для всех запросов заголовками.
+
+        :param headers: Заголовки запроса.
+        :type headers: `dict[str, str]`
+
+        :return: Дополненные заголовки.
+        :rtype: `dict[str, str]`
+        """
+        headers["Accept-Language"] = "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7"
+        headers["Cookie"] = f"token={self.token}"
+        if self.user_agent:
+            headers["User-Agent"] = self.user_agent
+        headers["x-apollo-operation-name"] = "SomeName"
+        headers["apollo-require-preflight"] = "true"
+        return headers
+
+    def _is_cloudflare_challenge(self, resp: requests.Response) -> bool:
+        """
+        Проверяет, является ли ответ страницей проверки CloudFlare.\n
+        Тело ответа просматривается только у HTML ответов — JSON ответы сайта проверку не содержат.
+
+        :param resp: Объект ответа.
+        :type resp: `requests.Response`
+        """
+        content_type = resp.headers.get("content-type", "")
+        if "json" in content_type or (content_type and "html" not in content_type):
+            return False
+        return any(sig in resp.text for sig in CLOUDFLARE_SIGNATURES)
+
+    def _decode_json(self, resp: requests.Response) -> Any:
+        """
+        Один раз декодирует JSON ответа (через orjson/msgspec, если они установлены).
+
+        :param resp: Объект ответа.
+        :type resp: `requests.Response`
+
+        :return: Разобранный JSON или `None`, если ответ не JSON.
+        """
+        content = resp.content
+        if "json" not in resp.headers.get("content-type", "") and content[:1] not in (b"{", b"["):
+            return None
+        try:
+            return json_loads(content)
+        except JSON_DECODE_ERRORS:
+            return None
+
+    def _has_errors(self, data: Any) -> bool:
+        """ Проверяет, есть ли в разобранном ответе (или в одном из ответов массива) поле `errors`. """
+        if isinstance(data, dict):
+            return bool(data.get("errors"))
+        if isinstance(data, list):
+            return any(isinstance(entry, dict) and entry.get("errors") for entry in data)
+        return False
+
+    def _check_response(self, resp: requests.Response, check_errors: bool = True) -> Any:
+        """
+        Декодирует ответ и проверяет его на ошибки, возбуждая соответствующее исключение.
+
+        :param resp: Объект ответа.
+        :type resp: `requests.Response`
+
+        :param check_errors: Проверять ли GraphQL ошибки в ответе, _опционально_.
+        :type check_errors: `bool`
+
+        :return: Разобранный JSON ответа (или `None`, если ответ не JSON).
+        """
+        data = self._decode_json(resp)
+        if check_errors and self._has_errors(data):
+            raise RequestError(resp, data)
         if resp.status_code != 200:
             raise RequestFailedError(resp)
-        return resp
+        return data
 
-    def get(self) -> Account:
+    def _graphql_headers(self, multipart: bool = False) -> dict[str, str]:
         """
-        Получает/обновляет данные об аккаунте.
+        Создаёт заголовки GraphQL запроса.
 
-        :return: Профиль аккаунта с обновлёнными данными.
-        :rtype: `PlayerokAPI.Account`
+        :param multipart: Отправляется ли запрос с файлами, _опционально_.
+        :type multipart: `bool`
+
+        :return: Заголовки запроса.
+        :rtype: `dict[str, str]`
         """
         headers = {
             "Accept": "*/*",
-            "Content-Type": "application/json",
             "Origin": self.base_url,
         }
-        payload = {
-            "operationName": "viewer",
-            "query": "query viewer {\n  viewer {\n    ...Viewer\n    __typename\n  }\n}\n\nfragment Viewer on User {\n  id\n  username\n  email\n  role\n  hasFrozenBalance\n  supportChatId\n  systemChatId\n  unreadChatsCounter\n  isBlocked\n  isBlockedFor\n  createdAt\n  lastItemCreatedAt\n  hasConfirmedPhoneNumber\n  canPublishItems\n  profile {\n    id\n    avatarURL\n    testimonialCounter\n    __typename\n  }\n  __typename\n}",
-            "query": "query viewer {\n  viewer {\n    ...Viewer\n    __typename\n  }\n}\n\nfragment Viewer on User {\n  id\n  username\n  email\n  role\n  hasFrozenBalance\n  supportChatId\n  systemChatId\n  unreadChatsCounter\n  isBlocked\n  isBlockedFor\n  createdAt\n  lastItemCreatedAt\n  hasConfirmedPhoneNumber\n  canPublishItems\n  profile {\n    id\n    avatarURL\n    testimonialCounter\n    __typename\n  }\n  __typename\n}",
-            "variables": {},
-        }
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload)
-        rjson = r.json()
-        data: dict = rjson["data"]["viewer"]
+        if not multipart:
+            headers["Content-Type"] = "application/json"
+        return headers
+
+    def _send_operation(
+        self,
+        operation: Operation,
+        variables: dict,
+        with_document: bool,
+        uploads: Uploads | None = None,
+    ) -> dict:
+        """
+        Отправляет GraphQL операцию на сервер.
+
+        :param operation: Операция из реестра `PlayerokAPI.operations`.
+        :type operation: `PlayerokAPI.operations.Operation`
+
+        :param variables: Переменные операции.
+        :type variables: `dict`
+
+        :param with_document: Отправлять ли полный текст документа вместо одного хеша.
+        :type with_document: `bool`
+
+        :param uploads: Файлы multipart запроса, _опционально_.
+        :type uploads: `PlayerokAPI.uploads.Uploads` or `None`
+
+        :return: Разобранный JSON ответа.
+        :rtype: `dict`
+        """
+        url = f"{self.base_url}/graphql"
+        if operation.method == "get":
+            return self._request_json("get", url, self._graphql_headers(), operation.params(variables))
+        if uploads:
+            payload = {
+                "operations": operation.body(variables, with_document).decode(),
+                "map": json.dumps(uploads.map),
+            }
+            return self._request_json("post", url, self._graphql_headers(multipart=True), payload, uploads.files)
+        return self._request_json("post", url, self._graphql_headers(), operation.body(variables, with_document))
+
+    def _make_uploads(self, attachments: list[Attachment], variable: str) -> Uploads:
+        """
+        Готовит файлы multipart запроса (файловые объекты без пути копируются во временные файлы).
+
+        :param attachments: Массив файлов-приложений (пути или файловые объекты).
+        :type attachments: `list[str | os.PathLike | BinaryIO]`
+
+        :param variable: Путь к переменной операции, в которую подставляются файлы.
+        :type variable: `str`
+
+        :return: Файлы multipart запроса.
+        :rtype: `PlayerokAPI.uploads.Uploads`
+        """
+        return Uploads(attachments, variable)
+
+    def _execute(
+        self,
+        operation: Operation,
+        variables: dict,
+        parse: Callable[[Any], Any],
+        uploads: Uploads | None = None,
+    ) -> Any:
+        """
+        Отправляет GraphQL операцию и разбирает её поле в `data` ответа.\n
+        Через этот метод проходят все методы аккаунта, поэтому `AsyncAccount`
+        переопределяет только его, а не каждый метод по отдельности.\n
+        Если сервер не знает persisted запрос, он автоматически повторяется с полным текстом документа.
+
+        :param operation: Операция из реестра `PlayerokAPI.operations`.
+        :type operation: `PlayerokAPI.operations.Operation`
+
+        :param variables: Переменные операции.
+        :type variables: `dict`
+
+        :param parse: Функция парсера, разбирающая данные ответа.
+        :type parse: `Callable`
+
+        :param uploads: Файлы multipart запроса, _опционально_ (временные файлы удаляются после отправки).
+        :type uploads: `PlayerokAPI.uploads.Uploads` or `None`
+
+        :return: Результат функции парсера.
+        """
+        with_document = operation.should_send_document()
+        try:
+            try:
+                r = self._send_operation(operation, variables, with_document, uploads)
+            except RequestError as e:
+                if with_document or not operation.handle_persisted_error(e.error_code, e.error_message):
+                    raise
+                r = self._send_operation(operation, variables, True, uploads)
+        finally:
+            if uploads is not None:
+                uploads.close()
+        return self._parse(parse, r["data"][operation.field])
+
+    def _parse(self, parse: Callable[[Any], Any], data: Any) -> Any:
+        """
+        Вызывает функцию парсера так, чтобы созданные ей объекты
+        (например, `UserProfile`) были привязаны к этому аккаунту.
+        """
+        token = _current_account.set(self)
+        try:
+            return parse(data)
+        finally:
+            _current_account.reset(token)
+
+    def execute_batch(self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]]) -> list[Any]:
+        """
+        Отправляет несколько GraphQL операций одним HTTP запросом (массивом)
+        и разбирает ответ на каждую операцию её парсером.\n
+        Если сервер не поддерживает такие запросы, операции
+        отправляются по одной, а батчинг для аккаунта отключается.
+
+        :param calls: Массив операций в формате: [(`операция`, `переменные`, `парсер`), ...].
+        :type calls: `list[tuple[PlayerokAPI.operations.Operation, dict, Callable]]`
+
+        :return: Массив результатов парсеров в том же порядке, что и операции.
+        :rtype: `list`
+        """
+        if len(calls) < 2 or not self.graphql_batching:
+            return self._execute_all(calls)
+        with_document = [operation.should_send_document() for operation, _, _ in calls]
+        resp, entries = self._send_batch(calls, with_document)
+        if entries is None:
+            self.graphql_batching = False
+            return self._execute_all(calls)
+        retry = self._batch_retry_indexes(calls, with_document, entries)
+        if retry:
+            _, retried = self._send_batch([calls[i] for i in retry], [True] * len(retry))
+            for i, entry in zip(retry, retried or []):
+                entries[i] = entry
+        return self._batch_results(resp, calls, entries)
+
+    def _execute_all(self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]]) -> list[Any]:
+        """
+        Отправляет операции отдельными запросами параллельно (не более `max_concurrent_requests`
+        одновременно, общий бюджет запросов соблюдает ограничитель частоты).
+
+        :param calls: Массив операций в формате: [(`операция`, `переменные`, `парсер`), ...].
+        :type calls: `list[tuple[PlayerokAPI.operations.Operation, dict, Callable]]`
+
+        :return: Массив результатов парсеров в том же порядке, что и операции.
+        :rtype: `list`
+        """
+        if len(calls) < 2 or self.max_concurrent_requests < 2:
+            return [self._execute(*call) for call in calls]
+        with ThreadPoolExecutor(max_workers=min(len(calls), self.max_concurrent_requests)) as executor:
+            return list(executor.map(lambda call: self._execute(*call), calls))
+
+    def _send_batch(
+        self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]], with_document: list[bool]
+    ) -> tuple[requests.Response | None, list[dict] | None]:
+        """
+        Отправляет массив операций одним POST запросом.
+
+        :return: Кортеж (ответ, массив ответов на операции).
+            Массив равен `None`, если сервер не принял запрос массивом.
+        """
+        body = self._batch_body(calls, with_document)
+        try:
+            resp, data = self._send("post", f"{self.base_url}/graphql", self._graphql_headers(), body, check_errors=False)
+        except RequestFailedError as e:
+            return e.response, None
+        return resp, self._batch_entries(data, len(calls))
+
+    def _batch_body(
+        self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]], with_document: list[bool]
+    ) -> bytes:
+        """ Собирает тело запроса-массива из заранее сериализованных частей операций. """
+        return b"[" + b",".join(
+            operation.body(variables, document)
+            for (operation, variables, _), document in zip(calls, with_document)
+        ) + b"]"
+
+    def _batch_entries(self, data: Any, count: int) -> list[dict] | None:
+        """ Проверяет, что ответ — массив ответов на все операции (иначе `None`). """
+        if not isinstance(data, list) or len(data) != count:
+            return None
+        return data
+
+    def _batch_retry_indexes(
+        self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]], with_document: list[bool], entries: list[dict]
+    ) -> list[int]:
+        """ Находит операции, которые нужно повторить с полным текстом документа. """
+        retry = []
+        for i, ((operation, _, _), document, entry) in enumerate(zip(calls, with_document, entries)):
+            if document or not entry.get("errors"):
+                continue
+            error = entry["errors"][0]
+            if operation.handle_persisted_error(error.get("extensions", {}).get("code"), error.get("message")):
+                retry.append(i)
+        return retry
+
+    def _batch_results(
+        self, resp: requests.Response, calls: list[tuple[Operation, dict, Callable[[Any], Any]]], entries: list[dict]
+    ) -> list[Any]:
+        """ Разбирает ответы на операции их парсерами. """
+        results = []
+        for (operation, _, parse), entry in zip(calls, entries):
+            if entry.get("errors"):
+                raise RequestError(resp, entry)
+            results.append(self._parse(parse, entry["data"][operation.field]))
+        return results
+
+    def _apply_viewer(self, data: dict | None) -> Account:
+        """ Заполняет данные аккаунта из ответа `viewer`. """
         if data is None:
             raise UnauthorizedError()
         self.id = data.get("id")
@@ -208,31 +746,26 @@ class Account:
         self.last_item_created_at = data.get("lastItemCreatedAt")
         self.has_confirmed_phone_number = data.get("hasConfirmedPhoneNumber")
         self.can_publish_items = data.get("canPublishItems")
+        return self
 
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "user",
-            "variables": json.dumps({"username": self.username}, ensure_ascii=False),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "6dff0b984047e79aa4e416f0f0cb78c5175f071e08c051b07b6cf698ecd7f865",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        data: dict = r["data"]["user"]
+    def _apply_profile(self, data: dict) -> Account:
+        """ Заполняет профиль аккаунта из ответа `user`. """
         if data.get("__typename") == "User":
             self.profile = account_profile(data)
         return self
 
+    def get(self) -> Account:
+        """
+        Получает/обновляет данные об аккаунте.
+
+        :return: Профиль аккаунта с обновлёнными данными.
+        :rtype: `PlayerokAPI.Account`
+        """
+        if not self._warmed_up:
+            self.warm_up()
+        self._execute(operations.VIEWER, {}, self._apply_viewer)
+        return self._execute(operations.USER, {"username": self.username}, self._apply_profile)
+
     def get_user(
         self, id: str | None = None, username: str | None = None
     ) -> types.UserProfile:
@@ -249,34 +782,7 @@ class Account:
         :return: Объект профиля пользователя.
         :rtype: `PlayerokAPI.types.UserProfile`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "user",
-            "variables": json.dumps(
-                {"id": id, "username": username}, ensure_ascii=False
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "6dff0b984047e79aa4e416f0f0cb78c5175f071e08c051b07b6cf698ecd7f865",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        data: dict = r["data"]["user"]
-        profile: dict = None
-        if data.get("__typename") == "UserFragment":
-            profile = data
-        elif data.get("__typename") == "User":
-            profile = data.get("profile")
-        return user_profile(profile)
+        return self._execute(operations.USER, {"id": id, "username": username}, _user_profile_from_user)
 
     def get_deals(
         self,
@@ -308,37 +814,16 @@ class Account:
             for v in status:
                 str_statuses.append(v.name)
         str_direction = direction.name if direction else None
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "deals",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {
-                        "userId": self.id,
-                        "direction": str_direction,
-                        "status": str_statuses,
-                    },
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "852f0fb21111c1e51909e3e5e72bedbc7922bd58c2faa68fe85fa1d2227fe66d",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {
+                "userId": self.id,
+                "direction": str_direction,
+                "status": str_statuses,
+            },
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return item_deal_list(r["data"]["deals"])
+        return self._execute(operations.DEALS, variables, item_deal_list)
 
     def get_deal(self, deal_id: str) -> types.ItemDeal:
         """
@@ -350,26 +835,7 @@ class Account:
         :return: Объект сделки.
         :rtype: `PlayerokAPI.types.ItemDeal`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "deal",
-            "variables": json.dumps({"id": deal_id}, ensure_ascii=False),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "65167f8820a53e382591a149453946df78de59299819b2e4a4a7b85b053fb3a3",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return item_deal(r["data"]["deal"])
+        return self._execute(operations.DEAL, {"id": deal_id}, item_deal)
 
     def update_deal(self, deal_id: str, new_status: ItemDealStatuses) -> types.ItemDeal:
         """
@@ -385,19 +851,7 @@ class Account:
         :return: Объект обновлённой сделки.
         :rtype: `PlayerokAPI.types.ItemDeal`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "updateDeal",
-            "variables": {"input": {"id": deal_id, "status": new_status.name}},
-            "query": "mutation updateDeal($input: UpdateItemDealInput!) {\n  updateDeal(input: $input) {\n    ...RegularItemDeal\n    __typename\n  }\n}\n\nfragment RegularItemDeal on ItemDeal {\n  id\n  status\n  direction\n  statusExpirationDate\n  statusDescription\n  obtaining\n  hasProblem\n  reportProblemEnabled\n  completedBy {\n    ...MinimalUserFragment\n    __typename\n  }\n  props {\n    ...ItemDealProps\n    __typename\n  }\n  prevStatus\n  completedAt\n  createdAt\n  logs {\n    ...ItemLog\n    __typename\n  }\n  transaction {\n    ...ItemDealTransaction\n    __typename\n  }\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  chat {\n    ...RegularChatId\n    __typename\n  }\n  item {\n    ...PartialDealItem\n    __typename\n  }\n  testimonial {\n    ...RegularItemDealTestimonial\n    __typename\n  }\n  obtainingFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  commentFromBuyer\n  __typename\n}\n\nfragment MinimalUserFragment on UserFragment {\n  id\n  username\n  role\n  __typename\n}\n\nfragment ItemDealProps on ItemDealProps {\n  autoConfirmPeriod\n  __typename\n}\n\nfragment ItemLog on ItemLog {\n  id\n  event\n  createdAt\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment ItemDealTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  value\n  createdAt\n  paymentMethodId\n  statusExpirationDate\n  __typename\n}\n\nfragment RegularChatId on Chat {\n  id\n  __typename\n}\n\nfragment PartialDealItem on Item {\n  ...PartialDealMyItem\n  ...PartialDealForeignItem\n  __typename\n}\n\nfragment PartialDealMyItem on MyItem {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  priorityPrice\n  rawPrice\n  statusExpirationDate\n  sellerType\n  approvalDate\n  createdAt\n  priorityPosition\n  viewsCounter\n  feeMultiplier\n  comment\n  attachments {\n    ...RegularFile\n    __typename\n  }\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  category {\n    ...MinimalGameCategory\n    __typename\n  }\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...MinimalGameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment RegularFile on File {\n  id\n  url\n  filename\n  mime\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment MinimalGameCategory on GameCategory {\n  id\n  slug\n  name\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment MinimalGameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment PartialDealForeignItem on ForeignItem {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  sellerType\n  approvalDate\n  priorityPosition\n  createdAt\n  viewsCounter\n  feeMultiplier\n  comment\n  attachments {\n    ...RegularFile\n    __typename\n  }\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  category {\n    ...MinimalGameCategory\n    __typename\n  }\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...MinimalGameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment RegularItemDealTestimonial on Testimonial {\n  id\n  status\n  text\n  rating\n  createdAt\n  updatedAt\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  moderator {\n    ...RegularUserFragment\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  __typename\n}",
-        }
-
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
-        return item_deal(r["data"]["updateDeal"])
+        return self._execute(operations.UPDATE_DEAL, {"input": {"id": deal_id, "status": new_status.name}}, item_deal)
 
     def get_games(
         self, count: int = 24, type: GameTypes | None = None, after_cursor: str = None
@@ -417,33 +871,12 @@ class Account:
         :return: Страница игр.
         :rtype: `PlayerokAPI.types.GameList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {"type": type.name} if type else {},
         }
-        payload = {
-            "operationName": "games",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {"type": type.name} if type else {},
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "b9f6675fd5923bc5c247388e8e3209c3eede460ed328dbe6a9ec8e6428d3649b",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game_list(r["data"]["games"])
+        return self._execute(operations.GAMES, variables, game_list)
 
     def get_game(self, id: str | None = None, slug: str | None = None) -> types.Game:
         """
@@ -459,26 +892,7 @@ class Account:
         :return: Объект игры.
         :rtype: `PlayerokAPI.types.Game`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "GamePage",
-            "variables": json.dumps({"id": id, "slug": slug}, ensure_ascii=False),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "12e701986f07aaaf57327b1133b9a1f3050b851c99b19293adfac40cfed0e41d",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game(r["data"]["game"])
+        return self._execute(operations.GAME, {"id": id, "slug": slug}, game)
 
     def get_game_category(
         self, id: str | None = None, game_id: str | None = None, slug: str | None = None
@@ -499,28 +913,7 @@ class Account:
         :return: Объект категории игры.
         :rtype: `PlayerokAPI.types.GameCategory`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "GamePageCategory",
-            "variables": json.dumps(
-                {"id": id, "gameId": game_id, "slug": slug}, ensure_ascii=False
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "02350443a7af0575ab5d13b25e59c7dd664f10abbfe835123da39f518e29da14",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game_category(r["data"]["gameCategory"])
+        return self._execute(operations.GAME_CATEGORY, {"id": id, "gameId": game_id, "slug": slug}, game_category)
 
     def get_game_category_agreements(
         self,
@@ -547,36 +940,15 @@ class Account:
         :return: Страница соглашений.
         :rtype: `PlayerokAPI.types.GameCategoryAgreementList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "gameCategoryAgreements",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {
-                        "gameCategoryId": game_category_id,
-                        "userId": user_id if user_id else self.id,
-                    },
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "3ea4b047196ed9f84aa5eb652299c4bd73f2e99e9fdf4587877658d9ea6330f6",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {
+                "gameCategoryId": game_category_id,
+                "userId": user_id if user_id else self.id,
+            },
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game_category_agreement_list(r["data"]["gameCategoryAgreements"])
+        return self._execute(operations.GAME_CATEGORY_AGREEMENTS, variables, game_category_agreement_list)
 
     def get_game_category_obtaining_types(
         self, game_category_id: str, count: int = 24, after_cursor: str | None = None
@@ -596,35 +968,12 @@ class Account:
         :return: Страница соглашений.
         :rtype: `PlayerokAPI.types.GameCategoryAgreementList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {"gameCategoryId": game_category_id},
         }
-        payload = {
-            "operationName": "gameCategoryObtainingTypes",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {"gameCategoryId": game_category_id},
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "15b0991414821528251930b4c8161c299eb39882fd635dd5adb1a81fb0570aea",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game_category_obtaining_type_list(
-            r["data"]["gameCategoryObtainingTypes"]
-        )
+        return self._execute(operations.GAME_CATEGORY_OBTAINING_TYPES, variables, game_category_obtaining_type_list)
 
     def get_game_category_instructions(
         self,
@@ -655,37 +1004,16 @@ class Account:
         :return: Страница инструкий.
         :rtype: `PlayerokAPI.types.GameCategoryInstructionList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "gameCategoryInstructions",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {
-                        "gameCategoryId": game_category_id,
-                        "obtainingTypeId": obtaining_type_id,
-                        "type": type.name if type else None,
-                    },
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "5991cead6a8ca46195bc4f7ae3164e7606105dbb82834c910658edeb0a1d1918",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {
+                "gameCategoryId": game_category_id,
+                "obtainingTypeId": obtaining_type_id,
+                "type": type.name if type else None,
+            },
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game_category_instruction_list(r["data"]["gameCategoryInstructions"])
+        return self._execute(operations.GAME_CATEGORY_INSTRUCTIONS, variables, game_category_instruction_list)
 
     def get_game_category_data_fields(
         self,
@@ -716,37 +1044,16 @@ class Account:
         :return: Страница полей с данными.
         :rtype: `PlayerokAPI.types.GameCategoryDataFieldList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "gameCategoryDataFields",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {
-                        "gameCategoryId": game_category_id,
-                        "obtainingTypeId": obtaining_type_id,
-                        "type": type.name if type else None,
-                    },
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "6fdadfb9b05880ce2d307a1412bc4f2e383683061c281e2b65a93f7266ea4a49",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {
+                "gameCategoryId": game_category_id,
+                "obtainingTypeId": obtaining_type_id,
+                "type": type.name if type else None,
+            },
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return game_category_data_field_list(r["data"]["gameCategoryDataFields"])
+        return self._execute(operations.GAME_CATEGORY_DATA_FIELDS, variables, game_category_data_field_list)
 
     def get_chats(
         self,
@@ -773,37 +1080,16 @@ class Account:
         :return: Страница чатов.
         :rtype: `PlayerokAPI.types.ChatList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "chats",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count},
-                    "after": after_cursor,
-                    "filter": {
-                        "userId": self.id,
-                        "type": type.name if type else None,
-                        "status": status.name if status else None,
-                    },
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "c942a7060d50ffebc87bab2105d43abbefb0862d765399b907f0fbed0983582d",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count},
+            "after": after_cursor,
+            "filter": {
+                "userId": self.id,
+                "type": type.name if type else None,
+                "status": status.name if status else None,
+            },
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return chat_list(r["data"]["chats"])
+        return self._execute(operations.CHATS, variables, chat_list)
 
     def get_chat(self, chat_id: str) -> types.Chat:
         """
@@ -815,26 +1101,7 @@ class Account:
         :return: Объект чата.
         :rtype: `PlayerokAPI.types.Chat`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "chat",
-            "variables": json.dumps({"id": chat_id}, ensure_ascii=False),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "38efcc58bdc432cc05bc743345e9ef9653a3ca1c0f45db822f4166d0f0cc17c4",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return chat(r["data"]["chat"])
+        return self._execute(operations.CHAT, {"id": chat_id}, chat)
 
     def get_chat_by_username(self, username: str) -> types.Chat | None:
         """
@@ -878,32 +1145,31 @@ class Account:
         :return: Страница сообщений.
         :rtype: `PlayerokAPI.types.ChatMessageList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "chatMessages",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count, "after": after_cursor},
-                    "filter": {"chatId": chat_id},
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "1531b5a6398cbbe354b17de4aaa545e2c6d346dbd96649e4934d2829098c75fc",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count, "after": after_cursor},
+            "filter": {"chatId": chat_id},
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return chat_message_list(r["data"]["chatMessages"])
+        return self._execute(operations.CHAT_MESSAGES, variables, chat_message_list)
+
+    def get_chats_messages(
+        self, chat_ids: list[str], count: int = 24
+    ) -> list[types.ChatMessageList]:
+        """
+        Получает сообщения сразу нескольких чатов одним запросом.
+
+        :param chat_ids: Массив ID чатов.
+        :type chat_ids: `list[str]`
+
+        :param count: Кол-во сообщений, которые нужно получить из каждого чата (не более 24), _опционально_.
+        :type count: `int`
+
+        :return: Массив страниц сообщений в том же порядке, что и ID чатов.
+        :rtype: `list[PlayerokAPI.types.ChatMessageList]`
+        """
+        return self.execute_batch([
+            (operations.CHAT_MESSAGES, {"pagination": {"first": count, "after": None}, "filter": {"chatId": chat_id}}, chat_message_list)
+            for chat_id in chat_ids
+        ])
 
     def mark_chat_as_read(self, chat_id: str) -> types.Chat:
         """
@@ -915,18 +1181,7 @@ class Account:
         :return: Объект чата с обновлёнными данными.
         :rtype: `PlayerokAPI.types.Chat`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "markChatAsRead",
-            "query": "mutation markChatAsRead($input: MarkChatAsReadInput!) {\n	markChatAsRead(input: $input) {\n		...RegularChat\n		__typename\n	}\n}\n\nfragment RegularChat on Chat {\n	id\n	type\n	unreadMessagesCounter\n	bookmarked\n	isTextingAllowed\n	owner {\n		...ChatParticipant\n		__typename\n	}\n	agent {\n		...ChatParticipant\n		__typename\n	}\n	participants {\n		...ChatParticipant\n		__typename\n	}\n	deals {\n		...ChatActiveItemDeal\n		__typename\n	}\n	status\n	startedAt\n	finishedAt\n	__typename\n}\n\nfragment ChatParticipant on UserFragment {\n	...RegularUserFragment\n	__typename\n}\n\nfragment RegularUserFragment on UserFragment {\n	id\n	username\n	role\n	avatarURL\n	isOnline\n	isBlocked\n	rating\n	testimonialCounter\n	createdAt\n	supportChatId\n	systemChatId\n	__typename\n}\n\nfragment ChatActiveItemDeal on ItemDealProfile {\n	id\n	direction\n	status\n	hasProblem\n	testimonial {\n		id\n		rating\n		__typename\n	}\n	item {\n		...ChatDealItemEdgeNode\n		__typename\n	}\n	user {\n		...RegularUserFragment\n		__typename\n	}\n	__typename\n}\n\nfragment ChatDealItemEdgeNode on ItemProfile {\n	...ChatDealMyItemEdgeNode\n	...ChatDealForeignItemEdgeNode\n	__typename\n}\n\nfragment ChatDealMyItemEdgeNode on MyItemProfile {\n	id\n	slug\n	priority\n	status\n	name\n	price\n	rawPrice\n	statusExpirationDate\n	sellerType\n	attachment {\n		...PartialFile\n		__typename\n	}\n	user {\n		...UserItemEdgeNode\n		__typename\n	}\n	approvalDate\n	createdAt\n	priorityPosition\n	feeMultiplier\n	__typename\n}\n\nfragment PartialFile on File {\n	id\n	url\n	__typename\n}\n\nfragment UserItemEdgeNode on UserFragment {\n	...UserEdgeNode\n	__typename\n}\n\nfragment UserEdgeNode on UserFragment {\n	...RegularUserFragment\n	__typename\n}\n\nfragment ChatDealForeignItemEdgeNode on ForeignItemProfile {\n	id\n	slug\n	priority\n	status\n	name\n	price\n	rawPrice\n	sellerType\n	attachment {\n		...PartialFile\n		__typename\n	}\n	user {\n		...UserItemEdgeNode\n		__typename\n	}\n	approvalDate\n	priorityPosition\n	createdAt\n	feeMultiplier\n	__typename\n}",
-            "variables": {"input": {"chatId": chat_id}},
-        }
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
-        return chat(r["data"]["markChatAsRead"])
+        return self._execute(operations.MARK_CHAT_AS_READ, {"input": {"chatId": chat_id}}, chat)
 
     def send_message(
         self, chat_id: str, text: str, mark_chat_as_read: bool = False
@@ -948,18 +1203,7 @@ class Account:
         """
         if mark_chat_as_read:
             self.mark_chat_as_read(chat_id=chat_id)
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "createChatMessage",
-            "query": "mutation createChatMessage($input: CreateChatMessageInput!, $file: Upload) {\n  createChatMessage(input: $input, file: $file) {\n    ...RegularChatMessage\n    __typename\n  }\n}\n\nfragment RegularChatMessage on ChatMessage {\n  id\n  text\n  createdAt\n  deletedAt\n  isRead\n  isSuspicious\n  isBulkMessaging\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  file {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...ChatMessageUserFields\n    __typename\n  }\n  deal {\n    ...ChatMessageItemDeal\n    __typename\n  }\n  item {\n    ...ItemEdgeNode\n    __typename\n  }\n  transaction {\n    ...RegularTransaction\n    __typename\n  }\n  moderator {\n    ...UserEdgeNode\n    __typename\n  }\n  eventByUser {\n    ...ChatMessageUserFields\n    __typename\n  }\n  eventToUser {\n    ...ChatMessageUserFields\n    __typename\n  }\n  isAutoResponse\n  event\n  buttons {\n    ...ChatMessageButton\n    __typename\n  }\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment ChatMessageUserFields on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment ChatMessageItemDeal on ItemDeal {\n  id\n  direction\n  status\n  statusDescription\n  hasProblem\n  user {\n    ...ChatParticipant\n    __typename\n  }\n  testimonial {\n    ...ChatMessageDealTestimonial\n    __typename\n  }\n  item {\n    id\n    name\n    price\n    slug\n    rawPrice\n    sellerType\n    user {\n      ...ChatParticipant\n      __typename\n    }\n    category {\n      id\n      __typename\n    }\n    attachments {\n      ...PartialFile\n      __typename\n    }\n    comment\n    dataFields {\n      ...GameCategoryDataFieldWithValue\n      __typename\n    }\n    obtainingType {\n      ...GameCategoryObtainingType\n      __typename\n    }\n    __typename\n  }\n  obtainingFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  chat {\n    id\n    type\n    __typename\n  }\n  transaction {\n    id\n    statusExpirationDate\n    __typename\n  }\n  statusExpirationDate\n  commentFromBuyer\n  __typename\n}\n\nfragment ChatParticipant on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment ChatMessageDealTestimonial on Testimonial {\n  id\n  status\n  text\n  rating\n  createdAt\n  updatedAt\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  moderator {\n    ...RegularUserFragment\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment ItemEdgeNode on ItemProfile {\n  ...MyItemEdgeNode\n  ...ForeignItemEdgeNode\n  __typename\n}\n\nfragment MyItemEdgeNode on MyItemProfile {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  statusExpirationDate\n  sellerType\n  attachment {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...UserItemEdgeNode\n    __typename\n  }\n  approvalDate\n  createdAt\n  priorityPosition\n  viewsCounter\n  feeMultiplier\n  __typename\n}\n\nfragment UserItemEdgeNode on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment ForeignItemEdgeNode on ForeignItemProfile {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  sellerType\n  attachment {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...UserItemEdgeNode\n    __typename\n  }\n  approvalDate\n  priorityPosition\n  createdAt\n  viewsCounter\n  feeMultiplier\n  __typename\n}\n\nfragment RegularTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  provider {\n    ...RegularTransactionProvider\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  fee\n  createdAt\n  props {\n    ...RegularTransactionProps\n    __typename\n  }\n  verifiedAt\n  verifiedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  completedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  paymentMethodId\n  completedAt\n  isSuspicious\n  __typename\n}\n\nfragment RegularTransactionProvider on TransactionProvider {\n  id\n  name\n  fee\n  minFeeAmount\n  description\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  paymentMethods {\n    ...TransactionPaymentMethod\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProviderAccount on TransactionProviderAccount {\n  id\n  value\n  userId\n  __typename\n}\n\nfragment TransactionProviderPropsFragment on TransactionProviderPropsFragment {\n  requiredUserData {\n    ...TransactionProviderRequiredUserData\n    __typename\n  }\n  tooltip\n  __typename\n}\n\nfragment TransactionProviderRequiredUserData on TransactionProviderRequiredUserData {\n  email\n  phoneNumber\n  __typename\n}\n\nfragment ProviderLimits on ProviderLimits {\n  incoming {\n    ...ProviderLimitRange\n    __typename\n  }\n  outgoing {\n    ...ProviderLimitRange\n    __typename\n  }\n  __typename\n}\n\nfragment ProviderLimitRange on ProviderLimitRange {\n  min\n  max\n  __typename\n}\n\nfragment TransactionPaymentMethod on TransactionPaymentMethod {\n  id\n  name\n  fee\n  providerId\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProps on TransactionPropsFragment {\n  creatorId\n  dealId\n  paidFromPendingIncome\n  paymentURL\n  successURL\n  fee\n  paymentAccount {\n    id\n    value\n    __typename\n  }\n  paymentGateway\n  alreadySpent\n  exchangeRate\n  amountAfterConversionRub\n  amountAfterConversionUsdt\n  __typename\n}\n\nfragment ChatMessageButton on ChatMessageButton {\n  type\n  url\n  text\n  __typename\n}",
-            "variables": {"input": {"chatId": chat_id, "text": text}},
-        }
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
-        return chat_message(r["data"]["createChatMessage"])
+        return self._execute(operations.CREATE_CHAT_MESSAGE, {"input": {"chatId": chat_id, "text": text}}, chat_message)
 
     def create_item(
         self,
@@ -970,7 +1214,7 @@ class Account:
         description: str,
         options: list[GameCategoryOption],
         data_fields: list[GameCategoryDataField],
-        attachments: list[str],
+        attachments: list[Attachment],
     ) -> types.Item:
         """
         Создаёт предмет (после создания помещается в черновик, а не сразу выставляется на продажу).
@@ -998,8 +1242,9 @@ class Account:
             Поля с типом `OBTAINING_DATA` **заполнять и передавать не нужно**, так как эти данные будет указывать сам покупатель при оформлении предмета.
         :type data_fields: `list[PlayerokAPI.types.GameCategoryDataField]`
 
-        :param attachments: Массив файлов-приложений предмета. Указываются пути к файлам.
-        :type attachments: `list[str]`
+        :param attachments: Массив файлов-приложений предмета. Указываются пути к файлам или открытые бинарные файлы.
+            Файлы не читаются целиком в память, а отправляются потоком.
+        :type attachments: `list[str | os.PathLike | BinaryIO]`
 
         :return: Объект созданного предмета.
         :rtype: `PlayerokAPI.types.Item`
@@ -1011,39 +1256,19 @@ class Account:
         for field in data_fields:
             payload_data_fields.append({"fieldId": field.id, "value": field.value})
 
-        headers = {
-            "Accept": "*/*",
-            "Origin": self.base_url,
-        }
-        operations = {
-            "operationName": "createItem",
-            "query": "mutation createItem($input: CreateItemInput!, $attachments: [Upload!]!) {\n  createItem(input: $input, attachments: $attachments) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "gameCategoryId": game_category_id,
-                    "obtainingTypeId": obtaining_type_id,
-                    "name": name,
-                    "price": int(price),
-                    "description": description,
-                    "attributes": payload_attributes,
-                    "dataFields": payload_data_fields,
-                },
-                "attachments": [None] * len(attachments),
+        variables = {
+            "input": {
+                "gameCategoryId": game_category_id,
+                "obtainingTypeId": obtaining_type_id,
+                "name": name,
+                "price": int(price),
+                "description": description,
+                "attributes": payload_attributes,
+                "dataFields": payload_data_fields,
             },
+            "attachments": [None] * len(attachments),
         }
-        map = {}
-        files = {}
-        i = 0
-        for att in attachments:
-            i += 1
-            map[str(i)] = [f"variables.attachments.{i - 1}"]
-            files[str(i)] = open(att, "rb")
-        payload = {"operations": json.dumps(operations), "map": json.dumps(map)}
-
-        r = self.request(
-            "post", f"{self.base_url}/graphql", headers, payload, files
-        ).json()
-        return item(r["data"]["createItem"])
+        return self._execute(operations.CREATE_ITEM, variables, item, self._make_uploads(attachments, "attachments"))
 
     def update_item(
         self,
@@ -1054,7 +1279,7 @@ class Account:
         options: list[GameCategoryOption] | None = None,
         data_fields: list[GameCategoryDataField] | None = None,
         remove_attachments: list[str] | None = None,
-        add_attachments: list[str] | None = None,
+        add_attachments: list[Attachment] | None = None,
     ) -> types.Item:
         """
         Обновляет предмет аккаунта.
@@ -1082,8 +1307,8 @@ class Account:
         :param remove_attachments: Массив ID файлов-приложений предмета, которые нужно удалить.
         :type remove_attachments: `list[str]` or `None`
 
-        :param add_attachments: Массив файлов-приложений предмета, которые нужно добавить. Указываются пути к файлам.
-        :type add_attachments: `list[str]` or `None`
+        :param add_attachments: Массив файлов-приложений предмета, которые нужно добавить. Указываются пути к файлам или открытые бинарные файлы.
+        :type add_attachments: `list[str | os.PathLike | BinaryIO]` or `None`
 
         :return: Объект обновлённого предмета.
         :rtype: `PlayerokAPI.types.Item`
@@ -1097,50 +1322,27 @@ class Account:
             for field in data_fields:
                 payload_data_fields.append({"fieldId": field.id, "value": field.value})
 
-        headers = {
-            "Accept": "*/*",
-            "Origin": self.base_url,
-        }
-        operations = {
-            "operationName": "updateItem",
-            "query": "mutation updateItem($input: UpdateItemInput!, $addedAttachments: [Upload!]) {\n  updateItem(input: $input, addedAttachments: $addedAttachments) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {"id": id},
-                "addedAttachments": [None] * len(add_attachments)
-                if add_attachments
-                else None,
-            },
+        variables = {
+            "input": {"id": id},
+            "addedAttachments": [None] * len(add_attachments)
+            if add_attachments
+            else None,
         }
         if name:
-            operations["variables"]["input"]["name"] = name
+            variables["input"]["name"] = name
         if price:
-            operations["variables"]["input"]["price"] = int(price)
+            variables["input"]["price"] = int(price)
         if description:
-            operations["variables"]["input"]["description"] = description
+            variables["input"]["description"] = description
         if options:
-            operations["variables"]["input"]["attributes"] = payload_attributes
+            variables["input"]["attributes"] = payload_attributes
         if data_fields:
-            operations["variables"]["input"]["dataFields"] = payload_data_fields
+            variables["input"]["dataFields"] = payload_data_fields
         if remove_attachments:
-            operations["variables"]["input"]["removedAttachments"] = remove_attachments
-
-        map = {}
-        files = {}
-        if add_attachments:
-            i = 0
-            for att in add_attachments:
-                i += 1
-                map[str(i)] = [f"variables.addedAttachments.{i - 1}"]
-                files[str(i)] = open(att, "rb")
-        payload = {"operations": json.dumps(operations), "map": json.dumps(map)}
-        r = self.request(
-            "post",
-            f"{self.base_url}/graphql",
-            headers,
-            payload if files else operations,
-            files if files else None,
-        ).json()
-        return item(r["data"]["updateItem"])
+            variables["input"]["removedAttachments"] = remove_attachments
+
+        uploads = self._make_uploads(add_attachments, "addedAttachments") if add_attachments else None
+        return self._execute(operations.UPDATE_ITEM, variables, item, uploads)
 
     def remove_item(self, id: str) -> bool:
         """
@@ -1149,20 +1351,10 @@ class Account:
         :param id: ID предмета.
         :type id: `str`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
+        variables = {
+            "id": id,
         }
-        payload = {
-            "operationName": "removeItem",
-            "query": "mutation removeItem($id: UUID!) {\n  removeItem(id: $id) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "id": id,
-            },
-        }
-        self.request("post", f"{self.base_url}/graphql", headers, payload)
-        return True
+        return self._execute(operations.REMOVE_ITEM, variables, lambda data: True)
 
     def publish_item(
         self,
@@ -1185,24 +1377,14 @@ class Account:
         :return: Объект опубликованного предмета.
         :rtype: `PlayerokAPI.types.Item`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "publishItem",
-            "query": "mutation publishItem($input: PublishItemInput!) {\n  publishItem(input: $input) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "transactionProviderId": transaction_provider_id.name,
-                    "priorityStatuses": [priority_status_id],
-                    "itemId": item_id,
-                }
-            },
+        variables = {
+            "input": {
+                "transactionProviderId": transaction_provider_id.name,
+                "priorityStatuses": [priority_status_id],
+                "itemId": item_id,
+            }
         }
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
-        return item(r["data"]["publishItem"])
+        return self._execute(operations.PUBLISH_ITEM, variables, item)
 
     def get_items(
         self,
@@ -1234,11 +1416,6 @@ class Account:
         :return: Страница профилей предметов.
         :rtype: `PlayerokAPI.types.ItemProfileList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
         filter = (
             {"gameId": game_id, "status": [status.name] if status else None}
             if not category_id
@@ -1247,27 +1424,11 @@ class Account:
                 "status": [status.name] if status else None,
             }
         )
-        payload = {
-            "operationName": "items",
-            "variables": json.dumps(
-                {
-                    "pagination": {"first": count, "after": after_cursor},
-                    "filter": filter,
-                },
-                ensure_ascii=False,
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "d79d6e2921fea03c5f1515a8925fbb816eacaa7bcafe03eb47a40425ef49601e",
-                    }
-                },
-                ensure_ascii=False,
-            ),
+        variables = {
+            "pagination": {"first": count, "after": after_cursor},
+            "filter": filter,
         }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return item_profile_list(r["data"]["items"])
+        return self._execute(operations.ITEMS, variables, item_profile_list)
 
     def get_item(self, id: str | None = None, slug: str | None = None) -> types.Item:
         """
@@ -1283,26 +1444,7 @@ class Account:
         :return: Объект предмета.
         :rtype: `PlayerokAPI.types.Item`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "item",
-            "variables": json.dumps({"id": id, "slug": slug}, ensure_ascii=False),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "e359f060312bb73e464c78e153bbef81dc071bfa366eeefd5a730dd572c41ccb",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return item(r["data"]["item"])
+        return self._execute(operations.ITEM, {"id": id, "slug": slug}, item)
 
     def get_item_priority_statuses(
         self, item_id: str, item_price: str
@@ -1319,31 +1461,11 @@ class Account:
         :return: Массив статусов приоритета предмета.
         :rtype: `list[PlayerokAPI.types.ItemPriorityStatus]`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "itemPriorityStatuses",
-            "variables": json.dumps(
-                {"itemId": item_id, "price": int(item_price)}, ensure_ascii=False
-            ),
-            "extensions": json.dumps(
-                {
-                    "persistedQuery": {
-                        "version": 1,
-                        "sha256Hash": "b922220c6f979537e1b99de6af8f5c13727daeff66727f679f07f986ce1c025a",
-                    }
-                },
-                ensure_ascii=False,
-            ),
-        }
-        r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        statuses = []
-        for status in r["data"]["itemPriorityStatuses"]:
-            statuses.append(item_priority_status(status))
-        return statuses
+        return self._execute(
+            operations.ITEM_PRIORITY_STATUSES,
+            {"itemId": item_id, "price": int(item_price)},
+            lambda data: [item_priority_status(status) for status in data],
+        )
 
     def increase_item_priority_status(
         self,
@@ -1370,22 +1492,12 @@ class Account:
         :return: Объект обновлённого предмета.
         :rtype: `PlayerokAPI.types.Item`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.base_url,
-        }
-        payload = {
-            "operationName": "increaseItemPriorityStatus",
-            "query": "mutation increaseItemPriorityStatus($input: PublishItemInput!) {\n  increaseItemPriorityStatus(input: $input) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "itemId": item_id,
-                    "priorityStatuses": [priority_status_id],
-                    "transactionProviderData": {"paymentMethodId": payment_method_id},
-                    "transactionProviderId": transaction_provider_id,
-                }
-            },
+        variables = {
+            "input": {
+                "itemId": item_id,
+                "priorityStatuses": [priority_status_id],
+                "transactionProviderData": {"paymentMethodId": payment_method_id},
+                "transactionProviderId": transaction_provider_id,
+            }
         }
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
-        return item(r["data"]["increaseItemPriorityStatus"])
+        return self._execute(operations.INCREASE_ITEM_PRIORITY_STATUS, variables, item)
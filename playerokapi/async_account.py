@@ -0,0 +1,368 @@
+from __future__ import annotations
+import asyncio
+import inspect
+import time
+from typing import *
+
+from . import types
+from .account import Account
+from .rate_limiter import RateLimiter
+from .proxy_pool import ProxyPool
+from . import operations
+from .operations import Operation
+from .uploads import Attachment, Uploads
+from .exceptions import *
+from .parser import *
+from .enums import *
+from primp import AsyncClient
+
+
+class AsyncAccount(Account):
+    """
+    Асинхронная версия класса `Account` для использования внутри `asyncio` event loop'а.\n
+    Содержит все те же методы и использует те же парсеры и типы, что и `Account`,
+    но каждый метод нужно ожидать через `await`, например: `await account.get_chats(10)`.
+    Во время ожидания ответа от сервера event loop не блокируется.
+
+    :param token: Токен аккаунта.
+    :type token: `str`
+
+    :param user_agent: Юзер-агент браузера, _опционально_.
+    :type user_agent: `str`
+
+    :param https_proxy: HTTPS прокси в формате: `https://user:pass@ip:port` или `https://ip:port`, _опционально_.
+    :type https_proxy: `str`
+
+    :param requests_timeout: Таймаут ожидания ответов на запросы.
+    :type requests_timeout: `int`
+
+    :param request_max_retries: Максимальное количество повторных попыток отправки запроса, если была обнаружена CloudFlare защита.
+    :type request_max_retries: `int`
+
+    :param rate_limiter: Ограничитель частоты запросов, _опционально_ (по умолчанию без ограничений).
+    :type rate_limiter: `PlayerokAPI.rate_limiter.RateLimiter`
+
+    :param proxies: Пул прокси (массив прокси или готовый `ProxyPool`), _опционально_.
+    :type proxies: `list[str]` or `PlayerokAPI.proxy_pool.ProxyPool`
+    """
+
+    def __init__(
+        self,
+        token: str,
+        user_agent: str = "",
+        https_proxy: str = None,
+        requests_timeout: int = 15,
+        request_max_retries: int = 30,
+        rate_limiter: RateLimiter | None = None,
+        proxies: list[str] | ProxyPool | None = None,
+        **kwargs,
+    ):
+        from . import get_account, set_account
+
+        previous_account = get_account()
+        super().__init__(token, user_agent, https_proxy, requests_timeout, request_max_retries, rate_limiter,
+                         proxies, **kwargs)
+        if previous_account is not None:
+            # глобальным остаётся синхронный аккаунт, чтобы не сломать синхронный код модулей
+            set_account(previous_account)
+
+    @classmethod
+    def from_account(cls, account: Account) -> AsyncAccount:
+        """
+        Создаёт асинхронный аккаунт с теми же настройками и данными,
+        что и у переданного (уже полученного через `get()`) синхронного аккаунта,
+        без повторных запросов на сайт.
+
+        :param account: Объект синхронного аккаунта.
+        :type account: `PlayerokAPI.account.Account`
+
+        :return: Объект асинхронного аккаунта.
+        :rtype: `PlayerokAPI.async_account.AsyncAccount`
+        """
+        async_account = cls(
+            token=account.token,
+            user_agent=account.user_agent,
+            https_proxy=account.https_proxy,
+            requests_timeout=account.requests_timeout,
+            request_max_retries=account.request_max_retries,
+            rate_limiter=account.rate_limiter,
+            proxies=account.proxy_pool,
+        )
+        return async_account.copy_from(account)
+
+    def copy_from(self, account: Account) -> AsyncAccount:
+        """
+        Копирует настройки и данные другого аккаунта (например, после его обновления через `get()`).
+
+        :param account: Объект аккаунта, из которого нужно скопировать данные.
+        :type account: `PlayerokAPI.account.Account`
+
+        :return: Этот же объект асинхронного аккаунта.
+        :rtype: `PlayerokAPI.async_account.AsyncAccount`
+        """
+        for attr in ("token", "user_agent", "requests_timeout", "request_max_retries", "base_url",
+                     "rate_limiter", "cloudflare_breaker", "proxy_pool", "max_concurrent_requests", "recorder", "replayer",
+                     "id", "username", "email", "role", "support_chat_id", "system_chat_id",
+                     "unread_chats_counter", "is_blocked", "is_blocked_for", "created_at",
+                     "last_item_created_at", "has_frozen_balance", "has_confirmed_phone_number",
+                     "can_publish_items", "profile"):
+            setattr(self, attr, getattr(account, attr))
+        return self
+
+    def _create_client(self, proxy: str | None) -> AsyncClient:
+        return AsyncClient(referer=False, proxy=proxy, cookie_store=False)
+
+    async def warm_up(self):
+        """
+        Заранее открывает соединение с сайтом, чтобы первый
+        настоящий запрос не тратил время на установку соединения.
+        Ошибки прогрева игнорируются.
+        """
+        if self.replayer is not None:
+            return
+        proxies = self.proxy_pool.proxies if self.proxy_pool else [None]
+        await asyncio.gather(
+            *(self.get_client(proxy).head(self.base_url, timeout=self.requests_timeout) for proxy in proxies),
+            return_exceptions=True,
+        )
+        self._warmed_up = True
+
+    async def __aenter__(self) -> AsyncAccount:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, str] | bytes | None = None,
+        files: dict | None = None,
+    ) -> requests.Response:
+        """
+        Асинхронно отправляет запрос на сервер playerok.com.
+
+        :param method: Метод запроса: post, get.
+        :type method: `str`
+
+        :param url: URL запроса.
+        :type url: `str`
+
+        :param headers: Заголовки запроса.
+        :type headers: `dict[str, str]`
+
+        :param payload: Payload запроса (или уже сериализованное тело POST запроса).
+        :type payload: `dict[str, str]` or `bytes` or `None`
+
+        :param files: Файлы запроса.
+        :type files: `dict` or `None`
+
+        :return: Ответ запроса.
+        :rtype: `primp.AsyncResponse`
+        """
+
+        return (await self._send(method, url, headers, payload, files))[0]
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, str] | bytes | None = None,
+        files: dict | None = None,
+        check_errors: bool = True,
+    ) -> Any:
+        return (await self._send(method, url, headers, payload, files, check_errors))[1]
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, str] | bytes | None = None,
+        files: dict | None = None,
+        check_errors: bool = True,
+    ) -> tuple[requests.Response, Any]:
+        async def make_req(proxy: str | None):
+            self._prepare_headers(headers)
+            client = self.get_client(proxy)
+            if method == "get":
+                r = await client.get(
+                    url=url,
+                    params=payload,
+                    headers=headers,
+                    timeout=self.requests_timeout,
+                )
+            elif method == "post":
+                r = await client.post(
+                    url=url,
+                    content=payload if isinstance(payload, bytes) else None,
+                    json=payload if not files and not isinstance(payload, bytes) else None,
+                    data=payload if files else None,
+                    headers=headers,
+                    files=files,
+                    timeout=self.requests_timeout,
+                )
+            else:
+                return
+            return r
+
+        if self.replayer is not None:
+            resp = await self.replayer.replay_async(method, url, payload)
+            return resp, self._check_response(resp, check_errors)
+
+        breaker = self.cloudflare_breaker
+        max_failures = breaker.failures + self.request_max_retries
+        tried_proxies = []
+        while True:
+            probe = await breaker.acquire_async(max_failures)
+            try:
+                await self.rate_limiter.acquire_async()
+                proxy = self.proxy_pool.choose(tried_proxies) if self.proxy_pool else None
+                started_at = time.perf_counter()
+                try:
+                    resp = await make_req(proxy)
+                    connection_failed = False
+                except Exception:
+                    self._record_proxy(proxy, None)
+                    if not self._retry_with_next_proxy(proxy, tried_proxies):
+                        raise
+                    connection_failed = True
+            except BaseException:
+                # в т.ч. при отмене (CancelledError, KeyboardInterrupt): иначе пробный запрос
+                # не освободит предохранитель и все остальные запросы будут ждать вечно
+                breaker.record_error(probe)
+                raise
+            if connection_failed:
+                # ошибка соединения через прокси — повторяем запрос через следующий прокси пула
+                breaker.record_error(probe)
+                continue
+            latency = time.perf_counter() - started_at
+            challenge = self._is_cloudflare_challenge(resp)
+            self._record_proxy(proxy, resp, latency, challenge)
+            if not challenge:
+                break
+            breaker.record_challenge(probe, resp)
+        breaker.record_success(probe)
+        if self.recorder is not None:
+            self.recorder.record(method, payload, resp, latency)
+        return resp, self._check_response(resp, check_errors)
+
+    def _make_uploads(self, attachments: list[Attachment], variable: str) -> Awaitable[Uploads]:
+        """ Готовит файлы multipart запроса в пуле потоков, чтобы копирование файлов не блокировало event loop. """
+        return asyncio.to_thread(Uploads, attachments, variable)
+
+    async def _execute(
+        self,
+        operation: Operation,
+        variables: dict,
+        parse: Callable[[Any], Any],
+        uploads: Uploads | Awaitable[Uploads] | None = None,
+    ) -> Any:
+        if inspect.isawaitable(uploads):
+            uploads = await uploads
+        with_document = operation.should_send_document()
+        try:
+            try:
+                r = await self._send_operation(operation, variables, with_document, uploads)
+            except RequestError as e:
+                if with_document or not operation.handle_persisted_error(e.error_code, e.error_message):
+                    raise
+                r = await self._send_operation(operation, variables, True, uploads)
+        finally:
+            if uploads is not None:
+                uploads.close()
+        return self._parse(parse, r["data"][operation.field])
+
+    async def execute_batch(self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]]) -> list[Any]:
+        if len(calls) < 2 or not self.graphql_batching:
+            return await self._execute_all(calls)
+        with_document = [operation.should_send_document() for operation, _, _ in calls]
+        resp, entries = await self._send_batch(calls, with_document)
+        if entries is None:
+            self.graphql_batching = False
+            return await self._execute_all(calls)
+        retry = self._batch_retry_indexes(calls, with_document, entries)
+        if retry:
+            _, retried = await self._send_batch([calls[i] for i in retry], [True] * len(retry))
+            for i, entry in zip(retry, retried or []):
+                entries[i] = entry
+        return self._batch_results(resp, calls, entries)
+
+    async def _execute_all(self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]]) -> list[Any]:
+        semaphore = asyncio.Semaphore(max(self.max_concurrent_requests, 1))
+
+        async def execute(call: tuple[Operation, dict, Callable[[Any], Any]]) -> Any:
+            async with semaphore:
+                return await self._execute(*call)
+
+        return list(await asyncio.gather(*(execute(call) for call in calls)))
+
+    async def _send_batch(
+        self, calls: list[tuple[Operation, dict, Callable[[Any], Any]]], with_document: list[bool]
+    ) -> tuple[requests.Response | None, list[dict] | None]:
+        body = self._batch_body(calls, with_document)
+        try:
+            resp, data = await self._send("post", f"{self.base_url}/graphql", self._graphql_headers(), body, check_errors=False)
+        except RequestFailedError as e:
+            return e.response, None
+        return resp, self._batch_entries(data, len(calls))
+
+    async def get(self) -> AsyncAccount:
+        """
+        Получает/обновляет данные об аккаунте.
+
+        :return: Профиль аккаунта с обновлёнными данными.
+        :rtype: `PlayerokAPI.AsyncAccount`
+        """
+        if not self._warmed_up:
+            await self.warm_up()
+        await self._execute(operations.VIEWER, {}, self._apply_viewer)
+        return await self._execute(operations.USER, {"username": self.username}, self._apply_profile)
+
+    async def get_chat_by_username(self, username: str) -> types.Chat | None:
+        """
+        Получает чат по никнейму собеседника.
+
+        :param username: Никнейм собеседника.
+        :type username: `str`
+
+        :return: Объект чата.
+        :rtype: `PlayerokAPI.types.Chat` or `None`
+        """
+        next_cursor = None
+        first_chat: types.Chat | None = None
+        while True:
+            chats = await self.get_chats(count=24, after_cursor=next_cursor)
+            for chat in chats.chats:
+                if first_chat and chat.id == first_chat.id:
+                    return None
+                first_chat = chat if not first_chat else first_chat
+                for user in chat.users:
+                    if user.username.lower() == username.lower():
+                        return chat
+            next_cursor = chats.page_info.end_cursor
+
+    async def send_message(
+        self, chat_id: str, text: str, mark_chat_as_read: bool = False
+    ) -> types.ChatMessage:
+        """
+        Отправляет сообщение в чат.
+
+        :param chat_id: ID чата, в который нужно отправить сообщение.
+        :type chat_id: `str`
+
+        :param text: Текст сообщения.
+        :type text: `str`
+
+        :param mark_chat_as_read: Пометить чат, как прочитанный перед отправкой, _опционально_.
+        :type mark_chat_as_read: `bool`
+
+        :return: Объект отправленного сообщения.
+        :rtype: `PlayerokAPI.types.ChatMessage`
+        """
+        if mark_chat_as_read:
+            await self.mark_chat_as_read(chat_id=chat_id)
+        return await super().send_message(chat_id, text)
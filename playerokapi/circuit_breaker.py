@@ -0,0 +1,221 @@
+from __future__ import annotations
+import asyncio
+import random
+import time
+from threading import Condition
+
+from .exceptions import CloudflareDetectedException
+
+
+class CircuitBreakerStates:
+    """
+    Состояния предохранителя.
+    """
+    CLOSED = "CLOSED"
+    """ Закрыт — запросы отправляются как обычно. """
+    OPEN = "OPEN"
+    """ Открыт — ждём следующую попытку по расписанию бэкоффа. """
+    HALF_OPEN = "HALF_OPEN"
+    """ Полуоткрыт — один пробный запрос уже отправлен, остальные ждут его результата. """
+
+
+class CloudflareCircuitBreaker:
+    """
+    Общий на весь процесс предохранитель от CloudFlare проверки.\n
+    Первый запрос, получивший страницу проверки, открывает предохранитель.
+    После этого все запросы (из любых потоков и event loop'ов) ждут по одному
+    общему расписанию экспоненциального бэкоффа с джиттером, а когда время ожидания выходит,
+    на сайт отправляется только один пробный запрос. Успешный пробный запрос закрывает предохранитель.
+
+    :param base_delay: Задержка перед первой пробой в секундах.
+    :type base_delay: `float`
+
+    :param max_delay: Максимальная задержка между пробами в секундах.
+    :type max_delay: `float`
+
+    :param multiplier: Множитель задержки после каждой неудачной пробы.
+    :type multiplier: `float`
+
+    :param jitter: Доля задержки, которая выбирается случайно (от 0 до 1).
+    :type jitter: `float`
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 5,
+        max_delay: float = 120,
+        multiplier: float = 2,
+        jitter: float = 0.5,
+    ):
+        self.base_delay: float = base_delay
+        """ Задержка перед первой пробой в секундах. """
+        self.max_delay: float = max_delay
+        """ Максимальная задержка между пробами в секундах. """
+        self.multiplier: float = multiplier
+        """ Множитель задержки после каждой неудачной пробы. """
+        self.jitter: float = jitter
+        """ Доля задержки, которая выбирается случайно. """
+
+        self.state: str = CircuitBreakerStates.CLOSED
+        """ Текущее состояние предохранителя. """
+        self.failures: int = 0
+        """ Кол-во подряд полученных CloudFlare проверок с момента открытия. """
+        self.opened_count: int = 0
+        """ Сколько раз предохранитель открывался. """
+        self.last_response = None
+        """ Последний ответ со страницей CloudFlare проверки. """
+
+        self._retry_at: float = 0
+        self._opened_at: float | None = None
+        self._time_open: float = 0
+        self._condition = Condition()
+
+    def _next_delay(self) -> float:
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** max(self.failures - 1, 0))
+        return delay * (1 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+    def _try_acquire(self, max_failures: int | None) -> tuple[bool, float | None]:
+        """
+        Пытается получить разрешение на запрос.
+
+        :return: Кортеж (является ли запрос пробным, сколько ждать перед новой попыткой).
+            Если время ожидания `None` — запрос можно отправлять.
+        """
+        with self._condition:
+            if self.state == CircuitBreakerStates.CLOSED:
+                return False, None
+            if max_failures is not None and self.failures >= max_failures:
+                raise CloudflareDetectedException(self.last_response)
+            if self.state == CircuitBreakerStates.OPEN:
+                wait = self._retry_at - time.monotonic()
+                if wait <= 0:
+                    self.state = CircuitBreakerStates.HALF_OPEN
+                    return True, None
+                return False, wait
+            return False, self.base_delay
+
+    def acquire(self, max_failures: int | None = None) -> bool:
+        """
+        Блокирует поток, пока предохранитель не разрешит отправить запрос.
+
+        :param max_failures: Значение `failures`, при достижении которого ожидание
+            прекращается ошибкой `CloudflareDetectedException`, _опционально_.
+        :type max_failures: `int` or `None`
+
+        :return: True, если этот запрос — пробный (его результат нужно передать в `record_*`).
+        :rtype: `bool`
+        """
+        while True:
+            probe, wait = self._try_acquire(max_failures)
+            if wait is None:
+                return probe
+            with self._condition:
+                self._condition.wait(wait)
+
+    async def acquire_async(self, max_failures: int | None = None) -> bool:
+        """
+        То же, что `acquire()`, но не блокирует event loop.
+
+        :param max_failures: Значение `failures`, при достижении которого ожидание
+            прекращается ошибкой `CloudflareDetectedException`, _опционально_.
+        :type max_failures: `int` or `None`
+
+        :return: True, если этот запрос — пробный.
+        :rtype: `bool`
+        """
+        while True:
+            probe, wait = self._try_acquire(max_failures)
+            if wait is None:
+                return probe
+            await asyncio.sleep(min(wait, 0.5))
+
+    def record_success(self, probe: bool):
+        """
+        Записывает успешный (без CloudFlare проверки) ответ.\n
+        Предохранитель закрывает только успешный пробный запрос.
+
+        :param probe: Был ли запрос пробным.
+        :type probe: `bool`
+        """
+        if not probe:
+            # ответ на запрос, отправленный до открытия предохранителя, ничего не говорит о его состоянии
+            return
+        with self._condition:
+            if self.state == CircuitBreakerStates.CLOSED:
+                return
+            if self._opened_at is not None:
+                self._time_open += time.monotonic() - self._opened_at
+            self.state = CircuitBreakerStates.CLOSED
+            self.failures = 0
+            self._opened_at = None
+            self._condition.notify_all()
+
+    def record_challenge(self, probe: bool, response=None):
+        """
+        Записывает ответ со страницей CloudFlare проверки.
+
+        :param probe: Был ли запрос пробным.
+        :type probe: `bool`
+
+        :param response: Объект ответа.
+        """
+        with self._condition:
+            self.last_response = response
+            if self.state == CircuitBreakerStates.CLOSED:
+                self.opened_count += 1
+                self._opened_at = time.monotonic()
+            elif not probe:
+                # запрос был отправлен до открытия предохранителя, расписание уже есть
+                return
+            self.failures += 1
+            self.state = CircuitBreakerStates.OPEN
+            self._retry_at = time.monotonic() + self._next_delay()
+            self._condition.notify_all()
+
+    def record_error(self, probe: bool):
+        """
+        Записывает, что запрос завершился ошибкой, не связанной с CloudFlare
+        (например, таймаут), чтобы пробу мог отправить следующий запрос.
+
+        :param probe: Был ли запрос пробным.
+        :type probe: `bool`
+        """
+        if not probe:
+            return
+        with self._condition:
+            if self.state == CircuitBreakerStates.HALF_OPEN:
+                self.state = CircuitBreakerStates.OPEN
+                self._retry_at = time.monotonic()
+                self._condition.notify_all()
+
+    def get_time_open(self) -> float:
+        """
+        Получает суммарное время, которое предохранитель был открыт.
+
+        :return: Время в секундах.
+        :rtype: `float`
+        """
+        with self._condition:
+            current = time.monotonic() - self._opened_at if self._opened_at is not None else 0
+            return self._time_open + current
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики предохранителя.
+
+        :return: Словарь с состоянием, кол-вом открытий, неудачных проб и временем в открытом состоянии.
+        :rtype: `dict`
+        """
+        with self._condition:
+            current = time.monotonic() - self._opened_at if self._opened_at is not None else 0
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "opened_count": self.opened_count,
+                "current_open_time": current,
+                "total_open_time": self._time_open + current,
+            }
+
+
+cloudflare_breaker = CloudflareCircuitBreaker()
+""" Общий для всех аккаунтов процесса предохранитель от CloudFlare проверки. """
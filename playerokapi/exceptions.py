@@ -44,13 +44,19 @@ class RequestError(Exception):
 
     :param response: Объект ответа.
     :type response: `Response`
+
+    :param json: Ответ с ошибкой, _опционально_ (например, ответ на одну из операций в запросе-массиве).
+    :type json: `dict` or `None`
     """
 
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: requests.Response, json: dict | None = None):
         self.response = response
-        self.json = response.json()
-        self.error_code = self.json["errors"][0]["extensions"]["code"]
-        self.error_message = self.json["errors"][0]["message"]
+        self.json = json if json is not None else response.json()
+        if isinstance(self.json, list):
+            self.json = next((entry for entry in self.json if entry.get("errors")), self.json[0])
+        error = self.json["errors"][0]
+        self.error_code = error.get("extensions", {}).get("code")
+        self.error_message = error.get("message")
 
     def __str__(self):
         msg = f"Ошибка запроса к {self.response.url}" \
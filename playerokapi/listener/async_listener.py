@@ -0,0 +1,324 @@
+from __future__ import annotations
+import asyncio
+import time
+from typing import AsyncGenerator
+from loguru import logger
+
+from ..async_account import AsyncAccount
+from .. import parser
+from ..types import ChatList, ChatMessage, ChatMessageList, Chat
+from ..enums import ChatTypes, ChatStatuses
+from .events import *
+from .polling import ChatPoller
+from .checkpoint import ListenerCheckpoint, LastMessages
+from .dedup import MessageDeduplicator
+from .listener import EventListener
+from .subscription import SubscriptionTransport
+
+
+class AsyncEventListener(EventListener):
+    """
+    Асинхронная версия слушателя событий для использования внутри `asyncio` event loop'а.\n
+    Запросы отправляются через `AsyncAccount`, а паузы между опросами ожидаются через
+    `asyncio.sleep`, поэтому пока слушатель ждёт, в том же event loop'е выполняются
+    хендлеры, таймеры и фоновые задачи. Ивенты получаются через `async for`:
+
+    `async for event in listener.listen(): ...`
+
+    Если указан транспорт подписки, обновления чатов приходят по websocket'у сразу,
+    а опрос остаётся страховкой: пока подписка подключена, чаты опрашиваются с максимальным
+    интервалом, а когда соединение обрывается — снова с обычным адаптивным.
+
+    :param account: Объект асинхронного аккаунта.
+    :type account: `PlayerokAPI.async_account.AsyncAccount`
+
+    :param page_budget: Сколько дополнительных страниц чатов и сообщений можно запросить за один цикл.
+    :type page_budget: `int`
+
+    :param checkpoint: Контрольная точка на диске, чтобы продолжать с того же места после перезапуска, _опционально_.
+    :type checkpoint: `PlayerokAPI.listener.checkpoint.ListenerCheckpoint` or `None`
+
+    :param dedup: Индекс уже обработанных сообщений, _опционально_ (по умолчанию в памяти на 10000 сообщений).
+    :type dedup: `PlayerokAPI.listener.dedup.MessageDeduplicator` or `None`
+
+    :param subscription: Транспорт подписки на обновления чатов (graphql-ws), _опционально_.
+    :type subscription: `PlayerokAPI.listener.subscription.SubscriptionTransport` or `None`
+
+    :param manual_ack: Продвигать контрольную точку только после подтверждения обработки ивентов через `acknowledge()`.
+    :type manual_ack: `bool`
+    """
+
+    def __init__(
+        self,
+        account: AsyncAccount,
+        page_budget: int = 5,
+        checkpoint: ListenerCheckpoint | None = None,
+        dedup: MessageDeduplicator | None = None,
+        subscription: SubscriptionTransport | None = None,
+        manual_ack: bool = False,
+    ):
+        super().__init__(account, page_budget, checkpoint, dedup, manual_ack)
+        self.account: AsyncAccount = account
+        """ Объект асинхронного аккаунта. """
+        self.subscription: SubscriptionTransport | None = subscription
+        """ Транспорт подписки на обновления чатов. """
+        self.pushed_updates: int = 0
+        """ Сколько обновлений чатов пришло по подписке. """
+        self.push_errors: int = 0
+        """ Сколько обновлений из подписки не удалось разобрать (они пропущены). """
+        self.pump_restarts: int = 0
+        """ Сколько раз перезапускалась задача, перекладывающая обновления из подписки. """
+
+        self._dedup_saves: set[asyncio.Future] = set()
+        self._pump: asyncio.Task | None = None
+        self._pump_updates: asyncio.Queue | None = None
+        self._checkpoint_saving: asyncio.Future | None = None
+        self._checkpoint_dirty: bool = False
+
+    async def get_message_events(self, old_chats: ChatList | LastMessages, new_chats: ChatList):
+        changed_chats = self._get_changed_chats(old_chats, new_chats)
+
+        # первые страницы сообщений всех изменившихся чатов получаем одним запросом
+        known_chats = [(new_chat, old_chat) for new_chat, old_chat in changed_chats if old_chat]
+        msg_lists = await self.account.get_chats_messages([new_chat.id for new_chat, _ in known_chats],
+                                                          self.messages_page_size)
+
+        # следующие страницы (если они нужны) догружаем для всех чатов параллельно
+        semaphore = asyncio.Semaphore(max(self.account.max_concurrent_requests, 1))
+
+        async def collect(new_chat: Chat, msg_list: ChatMessageList, last_message_id: str) -> list[ChatMessage]:
+            async with semaphore:
+                return await self._collect_new_messages(new_chat, msg_list, last_message_id)
+
+        new_msg_lists = await asyncio.gather(*(collect(new_chat, msg_list, old_chat[0])
+                                               for (new_chat, old_chat), msg_list in zip(known_chats, msg_lists)))
+        return self._build_message_events(changed_chats, new_msg_lists)
+
+    async def _collect_new_messages(self, chat: Chat, msg_list: ChatMessageList, last_message_id: str) -> list[ChatMessage]:
+        new_msgs = []
+        first_page = True
+        while not self._take_new_messages(msg_list, last_message_id, new_msgs):
+            cursor = self._next_page_cursor(msg_list.page_info, first_page, f"все новые сообщения чата {chat.id}")
+            if cursor is None:
+                break
+            first_page = False
+            msg_list = await self.account.get_chat_messages(chat.id, self.catchup_page_size, cursor)
+        return new_msgs
+
+    async def get_chats(
+        self,
+        old_chats: ChatList | LastMessages | None = None,
+        type: ChatTypes | None = None,
+        status: ChatStatuses | None = None,
+    ) -> ChatList:
+        chats = await self.account.get_chats(self.chats_page_size, type, status)
+        catch_up = self._chats_catch_up(chats, old_chats)
+        if catch_up is None:
+            return chats
+
+        page = chats
+        while page.chats:
+            cursor = self._next_page_cursor(page.page_info, page is chats, "все изменившиеся чаты")
+            if cursor is None:
+                break
+            page = await self.account.get_chats(self.catchup_page_size, type, status, cursor)
+            if self._merge_chats_page(chats, page, *catch_up):
+                break
+        return chats
+
+    async def listen(
+        self,
+        requests_delay: int | float = 4,
+        min_delay: int | float | None = None,
+        max_delay: int | float | None = None,
+        pollers: list[ChatPoller] | None = None,
+    ) -> AsyncGenerator[ChatInitializedEvent | NewMessageEvent | NewDealEvent | ItemPaidEvent
+                        | ItemSentEvent | DealConfirmedEvent | DealRolledBackEvent | DealHasProblemEvent
+                        | DealProblemResolvedEvent | DealStatusChangedEvent,
+                        None]:
+        """
+        "Слушает" события в чатах, не блокируя event loop.
+        Принимает те же параметры, что и `EventListener.listen()`.
+
+        :return: Полученный ивент.
+        :rtype: `AsyncGenerator` of ивентов `PlayerokAPI.listener.events`
+        """
+
+        self._start_listening(requests_delay, min_delay, max_delay, pollers)
+        updates: asyncio.Queue[Chat] = asyncio.Queue()
+        if self.subscription:
+            self._pump_updates = updates
+            self._start_pump()
+        try:
+            while True:
+                poller, wait = self._next_poller()
+                if self.subscription:
+                    chat = await self._wait_update(updates, wait)
+                    if chat is not None:
+                        pushed_poller, events = await self._on_pushed_chat(chat)
+                        if events:
+                            self._track_events(pushed_poller, events)
+                        for event in events:
+                            yield event
+                        if events:
+                            self._save_checkpoint(pushed_poller)
+                        continue
+                elif wait > 0:
+                    await asyncio.sleep(wait)
+                try:
+                    self._pages_left = self.page_budget
+                    next_chats = await self.get_chats(poller.last_messages, poller.type, poller.status)
+                    if poller.last_messages is None:
+                        events = self.get_chat_events(next_chats)
+                    elif self._is_unchanged(poller, next_chats):
+                        events = []
+                    else:
+                        events = await self.get_message_events(poller.last_messages, next_chats)
+                    self._finish_poll(poller, next_chats, events)
+                    self._track_events(poller, events)
+                    for event in events:
+                        yield event
+                    self._save_checkpoint(poller)
+                except Exception as e:
+                    self._poll_failed(poller, e)
+                poller.next_poll_at = time.monotonic() + self._poll_delay(poller)
+        finally:
+            if self.subscription:
+                pump, self._pump, self._pump_updates = self._pump, None, None
+                if pump is not None:
+                    pump.cancel()
+                await self.subscription.close()
+
+    def _update_checkpoint(self, name: str, last_messages: LastMessages):
+        """
+        Обновляет контрольную точку в памяти, а на диск записывает в пуле потоков, не блокируя event loop.\n
+        Пока идёт запись, новые изменения копятся и записываются одной следующей записью.
+        """
+        # после неудачной записи повторяем её при следующем обновлении, даже если оно ничего не изменило
+        if self.checkpoint.update(name, last_messages, save=False) or self._checkpoint_dirty:
+            self._schedule_checkpoint_save()
+
+    def _schedule_checkpoint_save(self):
+        if self._checkpoint_saving is not None:
+            self._checkpoint_dirty = True
+            return
+        self._checkpoint_dirty = False
+        self._checkpoint_saving = asyncio.get_running_loop().run_in_executor(None, self.checkpoint.save)
+        self._checkpoint_saving.add_done_callback(self._checkpoint_saved)
+
+    def _checkpoint_saved(self, future: asyncio.Future):
+        self._checkpoint_saving = None
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Не удалось записать контрольную точку слушателя: {future.exception()}")
+            self._checkpoint_dirty = True
+        elif self._checkpoint_dirty:
+            self._schedule_checkpoint_save()
+
+    def _save_dedup(self, exclude: set[str] | None = None):
+        """ Дописывает новые ID обработанных сообщений в файл индекса в пуле потоков, не блокируя event loop. """
+        if not self.dedup.path:
+            return
+        future = asyncio.get_running_loop().run_in_executor(None, self.dedup.save, exclude)
+        self._dedup_saves.add(future)
+        future.add_done_callback(self._dedup_saved)
+
+    def _dedup_saved(self, future: asyncio.Future):
+        self._dedup_saves.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Не удалось записать индекс обработанных сообщений: {future.exception()}")
+
+    def _poll_delay(self, poller: ChatPoller) -> float:
+        """ Через сколько секунд опросить выборку снова (пока подписка подключена — с максимальным интервалом). """
+        if self.subscription and self.subscription.connected:
+            return poller.interval.max_delay
+        return poller.interval.current
+
+    def _start_pump(self):
+        """ Запускает задачу, перекладывающую обновления из подписки в очередь слушателя. """
+        if self._pump is not None or self._pump_updates is None:
+            return  # задача уже работает или слушатель остановлен
+        self._pump = asyncio.create_task(self._pump_subscription(self._pump_updates))
+        self._pump.add_done_callback(self._pump_done)
+
+    def _pump_done(self, task: asyncio.Task):
+        """ Задача подписки завершилась: если слушатель ещё работает, логирует причину и перезапускает её. """
+        if task is not self._pump or task.cancelled():
+            return  # слушатель остановлен
+        error = task.exception()
+        if error is not None:
+            logger.opt(exception=error).error(f"Задача подписки на обновления чатов упала: {error}")
+        else:
+            logger.warning("Задача подписки на обновления чатов неожиданно завершилась")
+        self.pump_restarts += 1
+        self._pump = None
+        asyncio.get_running_loop().call_later(self.subscription.reconnect_delay, self._start_pump)
+
+    async def _pump_subscription(self, updates: asyncio.Queue):
+        """ Перекладывает обновления чатов из подписки в очередь слушателя (неразборчивые обновления пропускаются). """
+        async for data in self.subscription.listen():
+            if not data:
+                continue
+            try:
+                chat = parser.chat(data)
+            except Exception as e:
+                self.push_errors += 1
+                logger.warning(f"Не удалось разобрать обновление чата из подписки: {e}")
+                continue
+            if chat and chat.id:
+                updates.put_nowait(chat)
+
+    async def _wait_update(self, updates: asyncio.Queue, wait: float) -> Chat | None:
+        """ Ждёт обновление чата по подписке не дольше, чем до следующего опроса. """
+        if not updates.empty():
+            return updates.get_nowait()
+        if wait <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(updates.get(), wait)
+        except asyncio.TimeoutError:
+            return None
+
+    def _get_poller(self, chat: Chat) -> ChatPoller | None:
+        """ Находит выборку, в которую попадает чат. """
+        for poller in self.pollers:
+            if poller.type not in (None, chat.type) or poller.status not in (None, chat.status):
+                continue
+            return poller
+        return None
+
+    async def _on_pushed_chat(self, chat: Chat) -> tuple[ChatPoller | None, list]:
+        """
+        Получает ивенты чата, обновление которого пришло по подписке.
+        Новые сообщения догружаются тем же путём, что и при опросе, поэтому ивенты совпадают.
+
+        :return: Выборка чата и её новые ивенты.
+        """
+        self.pushed_updates += 1
+        poller = self._get_poller(chat)
+        if poller is None or poller.last_messages is None:
+            return poller, []
+        old_chat = poller.last_messages.get(chat.id)
+        if not old_chat:
+            # о новом чате (например, новой покупке) подписка знает не всё — сразу опрашиваем выборку
+            poller.next_poll_at = 0
+            return poller, []
+        if not self._is_chat_changed(chat, old_chat):
+            return poller, []
+        try:
+            self._pages_left = self.page_budget
+            events = await self.get_message_events(poller.last_messages, ChatList([chat], None, 1))
+        except Exception as e:
+            logger.exception(e)
+            poller.next_poll_at = 0
+            return poller, []
+        poller.last_messages.pop(chat.id, None)
+        poller.last_messages[chat.id] = (chat.last_message.id, chat.last_message.created_at)
+        return poller, events
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats["pushed_updates"] = self.pushed_updates
+        stats["push_errors"] = self.push_errors
+        stats["pump_restarts"] = self.pump_restarts
+        stats["subscription"] = self.subscription.get_stats() if self.subscription else None
+        return stats
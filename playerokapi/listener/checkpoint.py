@@ -0,0 +1,149 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+from threading import Lock
+from loguru import logger
+
+
+LastMessages = dict[str, tuple[str | None, str | None]]
+""" Последние известные сообщения чатов в формате: {`ID чата`: (`ID сообщения`, `время сообщения`), ...}. """
+
+
+class PendingCheckpoint:
+    """
+    Состояние выборки после опроса, которое ещё нельзя записывать в контрольную точку,
+    потому что не все ивенты этого опроса обработаны.
+
+    :param name: Название выборки.
+    :type name: `str`
+
+    :param last_messages: Последние сообщения чатов выборки после опроса.
+    :type last_messages: `dict[str, tuple[str | None, str | None]]`
+
+    :param message_ids: ID новых сообщений опроса (в индекс обработанных на диске они попадают вместе с контрольной точкой).
+    :type message_ids: `list[str]`
+
+    :param ack_ids: ID ивентов опроса, обработка которых ещё не подтверждена.
+    :type ack_ids: `set[str]`
+    """
+
+    def __init__(self, name: str, last_messages: LastMessages, message_ids: list[str], ack_ids: set[str]):
+        self.name: str = name
+        """ Название выборки. """
+        self.last_messages: LastMessages = last_messages
+        """ Последние сообщения чатов выборки после опроса. """
+        self.message_ids: list[str] = message_ids
+        """ ID новых сообщений опроса. """
+        self.ack_ids: set[str] = ack_ids
+        """ ID ивентов опроса, обработка которых ещё не подтверждена. """
+
+
+class ListenerCheckpoint:
+    """
+    Контрольная точка слушателя событий на диске.\n
+    Хранит последние увиденные сообщения чатов каждой выборки, чтобы после перезапуска
+    слушатель продолжил с того же места: не отправлял `ChatInitializedEvent` для всех чатов
+    и получил сообщения, пришедшие, пока бот был выключен.\n
+    Файл перезаписывается атомарно (через временный файл и `os.replace`)
+    и только тогда, когда данные действительно изменились.
+
+    :param path: Путь к файлу контрольной точки.
+    :type path: `str`
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        """ Путь к файлу контрольной точки. """
+        self.saves: int = 0
+        """ Кол-во записей на диск. """
+
+        self._state: dict[str, LastMessages] = {}
+        """ Сохранённые данные в формате: {`название выборки`: `последние сообщения чатов`, ...}. """
+        self._lock = Lock()
+        self._save_lock = Lock()
+
+    def load(self) -> dict[str, LastMessages]:
+        """
+        Загружает контрольную точку с диска.
+
+        :return: Последние сообщения чатов каждой выборки (пустой словарь, если файла нет или он повреждён).
+        :rtype: `dict[str, dict[str, tuple[str | None, str | None]]]`
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._state = {
+                name: {chat_id: (entry[0], entry[1]) for chat_id, entry in last_messages.items()}
+                for name, last_messages in data.get("pollers", {}).items()
+            }
+        except FileNotFoundError:
+            self._state = {}
+        except Exception as e:
+            logger.warning(f"Не удалось прочитать контрольную точку слушателя {self.path}: {e}")
+            self._state = {}
+        return {name: dict(last_messages) for name, last_messages in self._state.items()}
+
+    def get(self, name: str) -> LastMessages | None:
+        """
+        Получает последние сообщения чатов выборки из загруженной контрольной точки.
+
+        :param name: Название выборки.
+        :type name: `str`
+
+        :return: Последние сообщения чатов или `None`, если выборки нет в контрольной точке.
+        :rtype: `dict[str, tuple[str | None, str | None]]` or `None`
+        """
+        last_messages = self._state.get(name)
+        return dict(last_messages) if last_messages is not None else None
+
+    def update(self, name: str, last_messages: LastMessages, save: bool = True) -> bool:
+        """
+        Обновляет последние сообщения чатов выборки и записывает контрольную точку на диск,
+        если они изменились.
+
+        :param name: Название выборки.
+        :type name: `str`
+
+        :param last_messages: Последние сообщения чатов выборки.
+        :type last_messages: `dict[str, tuple[str | None, str | None]]`
+
+        :param save: Записывать ли контрольную точку на диск сразу (иначе — только в памяти до вызова `save()`).
+        :type save: `bool`
+
+        :return: Изменились ли данные контрольной точки.
+        :rtype: `bool`
+        """
+        with self._lock:
+            if self._state.get(name) == last_messages:
+                return False
+            self._state[name] = dict(last_messages)
+        if save:
+            self.save()
+        return True
+
+    def save(self):
+        """ Атомарно записывает контрольную точку на диск (можно вызывать из другого потока). """
+        with self._save_lock:
+            self._save()
+
+    def _save(self):
+        folder_path = os.path.dirname(self.path) or "."
+        os.makedirs(folder_path, exist_ok=True)
+        with self._lock:
+            data = {"pollers": {name: {chat_id: list(entry) for chat_id, entry in last_messages.items()}
+                                for name, last_messages in self._state.items()}}
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint_", dir=folder_path)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.saves += 1
@@ -0,0 +1,185 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from threading import Lock
+from loguru import logger
+
+
+class MessageDeduplicator:
+    """
+    Ограниченный по памяти индекс уже обработанных сообщений.\n
+    Через него проходит каждое сообщение перед созданием ивентов, поэтому одно и то же сообщение
+    не превращается в ивенты повторно (например, после временной ошибки API или когда чат
+    выпал из списка последних чатов и вернулся в него). Хранит не более `max_size` последних
+    ID сообщений, самые давние вытесняются (LRU).
+
+    :param max_size: Сколько последних ID сообщений хранить.
+    :type max_size: `int`
+
+    :param path: Путь к файлу, в котором индекс сохраняется между перезапусками, _опционально_.
+        Новые ID дописываются в конец файла (по одному в строке), а целиком файл перезаписывается,
+        только когда в нём накопилось вдвое больше строк, чем `max_size`.
+    :type path: `str` or `None`
+    """
+
+    def __init__(self, max_size: int = 10000, path: str | None = None):
+        self.max_size: int = max(int(max_size), 1)
+        """ Сколько последних ID сообщений хранить. """
+        self.path: str | None = path
+        """ Путь к файлу индекса. """
+
+        self.hits: int = 0
+        """ Сколько сообщений было отброшено как уже обработанные. """
+        self.misses: int = 0
+        """ Сколько новых сообщений прошло через индекс. """
+        self.evictions: int = 0
+        """ Сколько ID было вытеснено из индекса. """
+
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self._unsaved: dict[str, None] = {}
+        """ ID, ещё не записанные в файл. """
+        self._file_lines: int = 0
+        """ Сколько строк сейчас в файле. """
+        self._lock = Lock()
+        self._file_lock = Lock()
+        if path:
+            self.load()
+
+    def seen(self, message_id: str) -> bool:
+        """
+        Проверяет, обрабатывалось ли уже сообщение, и запоминает его.
+
+        :param message_id: ID сообщения.
+        :type message_id: `str`
+
+        :return: `True`, если сообщение уже было (его нужно пропустить), иначе `False`.
+        :rtype: `bool`
+        """
+        with self._lock:
+            if message_id in self._ids:
+                self._ids.move_to_end(message_id)
+                self.hits += 1
+                return True
+            self._ids[message_id] = None
+            self._unsaved[message_id] = None
+            self.misses += 1
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+                self.evictions += 1
+            return False
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def load(self):
+        """ Загружает индекс из файла (если файла нет или он повреждён — индекс остаётся пустым). """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Не удалось прочитать индекс обработанных сообщений {self.path}: {e}")
+            return
+        legacy = data.startswith("[")
+        if legacy:
+            # файл старого формата (JSON массив) — перезаписываем построчно при первом сохранении
+            try:
+                lines = json.loads(data)
+            except Exception as e:
+                logger.warning(f"Не удалось прочитать индекс обработанных сообщений {self.path}: {e}")
+                return
+        else:
+            lines = data.splitlines()
+        ids = OrderedDict()
+        for message_id in lines:
+            if message_id:
+                ids[message_id] = None
+                ids.move_to_end(message_id)
+        while len(ids) > self.max_size:
+            ids.popitem(last=False)
+        with self._lock:
+            self._ids = ids
+            self._unsaved = {}
+            self._file_lines = len(lines) if not legacy else 2 * self.max_size + 1
+
+    def save(self, exclude: set[str] | None = None) -> bool:
+        """
+        Дописывает в файл ID, добавленные с прошлой записи
+        (когда файл разрастается, он атомарно перезаписывается текущим индексом).
+
+        :param exclude: ID сообщений, которые пока не нужно записывать (их ивенты ещё не обработаны), _опционально_.
+        :type exclude: `set[str]` or `None`
+
+        :return: Был ли индекс записан.
+        :rtype: `bool`
+        """
+        if not self.path or not self._unsaved:
+            return False
+        with self._file_lock:
+            with self._lock:
+                new_ids = [message_id for message_id in self._unsaved if not exclude or message_id not in exclude]
+                if not new_ids:
+                    return False
+                for message_id in new_ids:
+                    del self._unsaved[message_id]
+                compact = self._file_lines + len(new_ids) > 2 * self.max_size
+                if compact:
+                    ids = [message_id for message_id in self._ids if not exclude or message_id not in exclude]
+            try:
+                if compact:
+                    self._rewrite(ids)
+                    self._file_lines = len(ids)
+                else:
+                    self._append(new_ids)
+                    self._file_lines += len(new_ids)
+            except Exception:
+                with self._lock:
+                    self._unsaved.update(dict.fromkeys(new_ids))
+                raise
+        return True
+
+    def _append(self, ids: list[str]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{message_id}\n" for message_id in ids))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite(self, ids: list[str]):
+        """ Атомарно перезаписывает файл (через временный файл и `os.replace`). """
+        folder_path = os.path.dirname(self.path) or "."
+        os.makedirs(folder_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".seen_", dir=folder_path)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("".join(f"{message_id}\n" for message_id in ids))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики индекса.
+
+        :return: Словарь с размером индекса и счётчиками попаданий.
+        :rtype: `dict`
+        """
+        return {
+            "size": len(self._ids),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -19,6 +19,8 @@ class BaseEvent:
         """ Объект чата, в котором произошло событие. """
         self.time = time.time()
         """ Время события. """
+        self.ack_id: str | None = None
+        """ ID для подтверждения обработки ивента слушателю (`EventListener.acknowledge()`). """
 
 class ChatInitializedEvent(BaseEvent):
     """
@@ -1,10 +1,19 @@
 from ..account import Account
-from ..types import ChatList, ChatMessage, Chat
+from ..types import ChatList, ChatMessage, ChatMessageList, Chat
+from ..enums import ChatTypes, ChatStatuses
 from .events import *
+from .polling import AdaptiveInterval, ChatPoller
+from .checkpoint import ListenerCheckpoint, LastMessages, PendingCheckpoint
+from .dedup import MessageDeduplicator
 from typing import Generator
 from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import count
+from threading import Lock
 
 import time
+import uuid
 
 class EventListener:
     """
@@ -12,11 +21,80 @@ class EventListener:
 
     :param account: Объект аккаунта.
     :type account: `PlayerokAPI.account.Account`
+
+    :param page_budget: Сколько дополнительных страниц чатов и сообщений можно запросить за один цикл,
+        если за время между запросами событий накопилось больше, чем помещается на одну страницу.
+    :type page_budget: `int`
+
+    :param checkpoint: Контрольная точка на диске, чтобы продолжать с того же места после перезапуска, _опционально_.
+    :type checkpoint: `PlayerokAPI.listener.checkpoint.ListenerCheckpoint` or `None`
+
+    :param dedup: Индекс уже обработанных сообщений, _опционально_ (по умолчанию в памяти на 10000 сообщений).
+    :type dedup: `PlayerokAPI.listener.dedup.MessageDeduplicator` or `None`
+
+    :param manual_ack: Продвигать контрольную точку и индекс обработанных сообщений на диске только после того,
+        как обработка всех ивентов опроса подтверждена через `acknowledge()` (например, когда ивенты
+        обрабатывает очередь в фоне). По умолчанию ивент считается обработанным, как только у генератора
+        `listen()` запрошен следующий ивент.
+    :type manual_ack: `bool`
     """
     
-    def __init__(self, account: Account):
+    def __init__(
+        self,
+        account: Account,
+        page_budget: int = 5,
+        checkpoint: ListenerCheckpoint | None = None,
+        dedup: MessageDeduplicator | None = None,
+        manual_ack: bool = False,
+    ):
         self.account: Account = account
         """ Объект аккаунта. """
+        self.checkpoint: ListenerCheckpoint | None = checkpoint
+        """ Контрольная точка слушателя на диске. """
+        self.dedup: MessageDeduplicator = dedup if dedup is not None else MessageDeduplicator()
+        """ Индекс уже обработанных сообщений (повторно ивенты по ним не создаются). """
+        self.page_budget: int = page_budget
+        """ Сколько дополнительных страниц чатов и сообщений можно запросить за один цикл. """
+        self.manual_ack: bool = manual_ack
+        """ Продвигать контрольную точку только после подтверждения обработки ивентов через `acknowledge()`. """
+        self.chats_page_size: int = 10
+        """ Сколько чатов запрашивается первой страницей в каждом цикле. """
+        self.messages_page_size: int = 10
+        """ Сколько сообщений изменившегося чата запрашивается первой страницей. """
+        self.catchup_page_size: int = 24
+        """ Сколько чатов/сообщений запрашивается на каждой дополнительной странице. """
+        self.max_tracked_chats: int = 1000
+        """ Для скольких чатов выборки запоминается последнее сообщение (чаты, обновлявшиеся давнее всех, забываются). """
+
+        self.catchup_count: int = 0
+        """ Сколько раз понадобилось догонять пропущенные события дополнительными страницами. """
+        self.catchup_pages: int = 0
+        """ Сколько всего дополнительных страниц было запрошено. """
+        self.catchup_truncated: int = 0
+        """ Сколько раз бюджета страниц не хватило, чтобы дойти до последнего известного чата/сообщения. """
+        self.unchanged_polls: int = 0
+        """ Сколько опросов завершились сразу, потому что отпечаток чатов не изменился. """
+
+        self.pollers: list[ChatPoller] = []
+        """ Опрашиваемые выборки чатов (заполняются при запуске `listen()`). """
+        self.base_delay: float | None = None
+        """ Фиксированный интервал опроса, относительно которого считается экономия запросов. """
+
+        self._pages_left: int = page_budget
+        """ Остаток бюджета дополнительных страниц в текущем цикле. """
+        self._pages_lock = Lock()
+        """ Блокировка бюджета страниц (сообщения чатов догружаются параллельно). """
+        self._listen_started_at: float | None = None
+        """ Когда (time.monotonic) был запущен `listen()`. """
+        self._new_message_ids: list[str] = []
+        """ ID новых сообщений текущего опроса. """
+        self._pending_checkpoints: deque[PendingCheckpoint] = deque()
+        """ Состояния выборок после опросов, ивенты которых ещё обрабатываются (от старых к новым). """
+        self._unacked: dict[str, PendingCheckpoint] = {}
+        """ Неподтверждённые ивенты: {`ack_id`: `состояние опроса ивента`, ...}. """
+        self._ack_prefix: str = uuid.uuid4().hex[:8]
+        """ Префикс ID ивентов этого запуска (ивенты прошлых запусков, например, с диска, не путаются с текущими). """
+        self._ack_counter = count()
 
     def parse_chat_event(self, chat: Chat) -> list[ChatInitializedEvent]:
         """
@@ -96,12 +174,12 @@ class EventListener:
         
         return [NewMessageEvent(message, chat)]
 
-    def get_message_events(self, old_chats: ChatList, new_chats: ChatList):
+    def get_message_events(self, old_chats: ChatList | LastMessages, new_chats: ChatList):
         """
         Получает новые ивенты сообщений, сравнивая старые чаты с новыми полученными.
         
-        :param old_chats: Старые чаты.
-        :type old_chats: `PlayerokAPI.types.ChatList`
+        :param old_chats: Старые чаты (или последние известные сообщения чатов).
+        :type old_chats: `PlayerokAPI.types.ChatList` or `dict[str, tuple[str | None, str | None]]`
         
         :param new_chats: Новые чаты.
         :type new_chats: `PlayerokAPI.types.ChatList`
@@ -120,43 +198,318 @@ class EventListener:
         _or_ `PlayerokAPI.listener.events.DealStatusChangedEvent(message.deal)`
         """
         
+        changed_chats = self._get_changed_chats(old_chats, new_chats)
+
+        # первые страницы сообщений всех изменившихся чатов получаем одним запросом
+        known_chats = [(new_chat, old_chat) for new_chat, old_chat in changed_chats if old_chat]
+        msg_lists = self.account.get_chats_messages([new_chat.id for new_chat, _ in known_chats], self.messages_page_size)
+        jobs = [(new_chat, msg_list, old_chat[0]) for (new_chat, old_chat), msg_list in zip(known_chats, msg_lists)]
+
+        # следующие страницы (если они нужны) догружаем для всех чатов параллельно
+        workers = min(sum(self._needs_more_pages(*job) for job in jobs), self.account.max_concurrent_requests)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                new_msg_lists = list(executor.map(lambda job: self._collect_new_messages(*job), jobs))
+        else:
+            new_msg_lists = [self._collect_new_messages(*job) for job in jobs]
+        return self._build_message_events(changed_chats, new_msg_lists)
+
+    def _needs_more_pages(self, chat: Chat, msg_list: ChatMessageList, last_message_id: str) -> bool:
+        """ Нужно ли догружать следующие страницы сообщений чата (последнего известного сообщения нет на первой). """
+        if any(msg.id == last_message_id for msg in msg_list.messages):
+            return False
+        return bool(msg_list.page_info and msg_list.page_info.has_next_page)
+
+    def _build_message_events(
+        self,
+        changed_chats: list[tuple[Chat, tuple[str | None, str | None] | None]],
+        new_msg_lists: list[list[ChatMessage]],
+    ) -> list:
+        """ Собирает ивенты изменившихся чатов в порядке чатов, а внутри чата — от старых сообщений к новым. """
+        new_msg_lists = iter(new_msg_lists)
         events = []
-        old_chat_map = {chat.id: chat for chat in old_chats.chats}
-        for new_chat in new_chats.chats:
-            old_chat = old_chat_map.get(new_chat.id)
-            
+        for new_chat, old_chat in changed_chats:
             if not old_chat:
                 # если это новый чат, парсим ивенты только последнего сообщения, ведь это - покупка товара
-                events.extend(self.parse_message_event(new_chat.last_message, new_chat))
+                events.extend(self._parse_new_message(new_chat.last_message, new_chat))
                 continue
 
-            if not new_chat.last_message or not old_chat.last_message:
+            for msg in reversed(next(new_msg_lists)):
+                events.extend(self._parse_new_message(msg, new_chat))
+        return events
+
+    def _parse_new_message(self, message: ChatMessage | None, chat: Chat) -> list:
+        """ Получает ивенты сообщения, если оно ещё не обрабатывалось. """
+        if message and self.dedup.seen(message.id):
+            return []
+        if message:
+            self._new_message_ids.append(message.id)
+        return self.parse_message_event(message, chat)
+
+    def _get_changed_chats(
+        self, old_chats: ChatList | LastMessages, new_chats: ChatList
+    ) -> list[tuple[Chat, tuple[str | None, str | None] | None]]:
+        """ Находит новые и изменившиеся чаты: [(`чат`, `известное последнее сообщение` или `None`, если чат новый), ...]. """
+        known = self._as_last_messages(old_chats)
+        changed_chats = []
+        for new_chat in new_chats.chats:
+            old_chat = known.get(new_chat.id)
+            if not old_chat:
+                changed_chats.append((new_chat, None))
                 continue
-            if new_chat.last_message.id == old_chat.last_message.id:
+            if not self._is_chat_changed(new_chat, old_chat):
                 continue
+            changed_chats.append((new_chat, old_chat))
+        return changed_chats
 
-            msg_list = self.account.get_chat_messages(new_chat.id, 10)
-            new_msgs = []
-            for msg in msg_list.messages:
-                if msg.id == old_chat.last_message.id:
-                    break
-                new_msgs.append(msg)
+    def get_last_messages(self, chats: ChatList) -> LastMessages:
+        """
+        Получает последние сообщения чатов страницы (то, что запоминается между циклами).
+
+        :param chats: Страница чатов.
+        :type chats: `PlayerokAPI.types.ChatList`
+
+        :return: Последние сообщения чатов в формате: {`ID чата`: (`ID сообщения`, `время сообщения`), ...}.
+        :rtype: `dict[str, tuple[str | None, str | None]]`
+        """
+        return {
+            chat.id: (chat.last_message.id, chat.last_message.created_at) if chat.last_message else (None, None)
+            for chat in chats.chats
+        }
 
-            for msg in reversed(new_msgs):
-                events.extend(self.parse_message_event(msg, new_chat))
-        return events      
+    def _as_last_messages(self, chats: ChatList | LastMessages) -> LastMessages:
+        return chats if isinstance(chats, dict) else self.get_last_messages(chats)
+
+    def _is_chat_changed(self, new_chat: Chat, old_chat: tuple[str | None, str | None]) -> bool:
+        """ Появились ли в чате новые сообщения после известного последнего сообщения `old_chat`. """
+        if not new_chat.last_message or not old_chat[0]:
+            return False
+        return new_chat.last_message.id != old_chat[0]
+
+    def _take_page(self) -> bool:
+        """ Забирает одну дополнительную страницу из бюджета текущего цикла. """
+        with self._pages_lock:
+            if self._pages_left <= 0:
+                return False
+            self._pages_left -= 1
+            self.catchup_pages += 1
+            return True
+
+    def _collect_new_messages(self, chat: Chat, msg_list: ChatMessageList, last_message_id: str) -> list[ChatMessage]:
+        """
+        Собирает новые сообщения чата (от новых к старым), пока не дойдёт
+        до последнего известного сообщения. Если оно не попало на первую страницу,
+        догружает следующие страницы по курсору в пределах бюджета цикла.
+
+        :param chat: Изменившийся чат.
+        :type chat: `PlayerokAPI.types.Chat`
+
+        :param msg_list: Первая страница сообщений чата.
+        :type msg_list: `PlayerokAPI.types.ChatMessageList`
+
+        :param last_message_id: ID последнего известного сообщения чата.
+        :type last_message_id: `str`
+
+        :return: Новые сообщения чата (от новых к старым).
+        :rtype: `list` of `PlayerokAPI.types.ChatMessage`
+        """
+        new_msgs = []
+        first_page = True
+        while not self._take_new_messages(msg_list, last_message_id, new_msgs):
+            cursor = self._next_page_cursor(msg_list.page_info, first_page, f"все новые сообщения чата {chat.id}")
+            if cursor is None:
+                break
+            first_page = False
+            msg_list = self.account.get_chat_messages(chat.id, self.catchup_page_size, cursor)
+        return new_msgs
+
+    def _take_new_messages(self, msg_list: ChatMessageList, last_message_id: str, new_msgs: list[ChatMessage]) -> bool:
+        """
+        Добавляет в `new_msgs` сообщения страницы, пока не встретится последнее известное сообщение.
+
+        :return: Встретилось ли последнее известное сообщение (дальше страницы догружать не нужно).
+        :rtype: `bool`
+        """
+        for msg in msg_list.messages:
+            if msg.id == last_message_id:
+                return True
+            new_msgs.append(msg)
+        return False
+
+    def _next_page_cursor(self, page_info, first_page: bool, what: str) -> str | None:
+        """
+        Получает курсор следующей страницы, если она есть и в бюджете цикла осталось место.
+
+        :param page_info: Информация о текущей странице.
+
+        :param first_page: Догружается ли первая дополнительная страница (для счётчика догрузок).
+        :type first_page: `bool`
+
+        :param what: Что догружается (для предупреждения о нехватке бюджета).
+        :type what: `str`
+
+        :return: Курсор следующей страницы или `None`, если догружать больше нечего или нельзя.
+        :rtype: `str` or `None`
+        """
+        if not page_info or not page_info.has_next_page or not page_info.end_cursor:
+            return None
+        if not self._take_page():
+            self.catchup_truncated += 1
+            logger.warning(f"Не хватило бюджета страниц, чтобы получить {what}")
+            return None
+        if first_page:
+            self.catchup_count += 1
+        return page_info.end_cursor
+
+    def get_chats(
+        self,
+        old_chats: ChatList | LastMessages | None = None,
+        type: ChatTypes | None = None,
+        status: ChatStatuses | None = None,
+    ) -> ChatList:
+        """
+        Получает страницу последних чатов. Если все чаты первой страницы изменились
+        с момента получения `old_chats` (значит, на странице не поместились все
+        изменившиеся чаты), догружает следующие страницы по курсору, пока не встретится
+        неизменившийся чат (или чат, последнее сообщение которого не новее уже известных),
+        или пока не закончится бюджет страниц цикла.
+
+        :param old_chats: Чаты, полученные в прошлом цикле (или последние известные сообщения чатов), _опционально_.
+        :type old_chats: `PlayerokAPI.types.ChatList` or `dict[str, tuple[str | None, str | None]]` or `None`
+
+        :param type: Тип чатов, которые нужно получать, _опционально_.
+        :type type: `PlayerokAPI.enums.ChatTypes` or `None`
+
+        :param status: Статус чатов, которые нужно получать, _опционально_.
+        :type status: `PlayerokAPI.enums.ChatStatuses` or `None`
+
+        :return: Страница чатов (при догрузке — со всеми полученными чатами).
+        :rtype: `PlayerokAPI.types.ChatList`
+        """
+        chats = self.account.get_chats(self.chats_page_size, type, status)
+        catch_up = self._chats_catch_up(chats, old_chats)
+        if catch_up is None:
+            return chats
+
+        page = chats
+        while page.chats:
+            cursor = self._next_page_cursor(page.page_info, page is chats, "все изменившиеся чаты")
+            if cursor is None:
+                break
+            page = self.account.get_chats(self.catchup_page_size, type, status, cursor)
+            if self._merge_chats_page(chats, page, *catch_up):
+                break
+        return chats
+
+    def _chats_catch_up(
+        self, chats: ChatList, old_chats: ChatList | LastMessages | None
+    ) -> tuple[LastMessages, str | None] | None:
+        """
+        Проверяет, нужно ли догружать следующие страницы чатов (изменились все чаты первой страницы).
+
+        :return: Последние известные сообщения чатов и время самого нового из них
+            или `None`, если догружать не нужно.
+        :rtype: `tuple[dict[str, tuple[str | None, str | None]], str | None]` or `None`
+        """
+        if not old_chats:
+            return None
+        old_chat_map = self._as_last_messages(old_chats)
+        # время последнего сообщения, которое уже было известно в прошлом цикле
+        watermark = max((created_at for _, created_at in old_chat_map.values() if created_at), default=None)
+        if any(self._is_behind_watermark(chat, old_chat_map, watermark) for chat in chats.chats):
+            return None
+        return old_chat_map, watermark
+
+    def _merge_chats_page(self, chats: ChatList, page: ChatList, old_chat_map: LastMessages, watermark: str | None) -> bool:
+        """
+        Добавляет к `chats` изменившиеся чаты догруженной страницы.
+
+        :return: Встретился ли неизменившийся чат (дальше страницы догружать не нужно).
+        :rtype: `bool`
+        """
+        known_ids = {chat.id for chat in chats.chats}
+        chats.page_info = page.page_info
+        for chat in page.chats:
+            if self._is_behind_watermark(chat, old_chat_map, watermark):
+                return True
+            if chat.id not in known_ids:
+                chats.chats.append(chat)
+        return False
+
+    def _is_behind_watermark(self, chat: Chat, old_chat_map: LastMessages, watermark: str | None) -> bool:
+        """ Не изменился ли чат с прошлого цикла (по последнему известному сообщению или его времени). """
+        old_chat = old_chat_map.get(chat.id)
+        if old_chat and not self._is_chat_changed(chat, old_chat):
+            return True
+        return bool(watermark and chat.last_message and chat.last_message.created_at
+                    and chat.last_message.created_at <= watermark)
+
+    def requests_saved_per_hour(self) -> float:
+        """
+        Считает, сколько запросов чатов в час экономит адаптивный интервал
+        по сравнению с опросом через фиксированный `requests_delay`.
+
+        :return: Сэкономленные запросы в час (отрицательное значение — запросов стало больше).
+        :rtype: `float`
+        """
+        if not self._listen_started_at or not self.base_delay:
+            return 0
+        elapsed = time.monotonic() - self._listen_started_at
+        if elapsed < self.base_delay:
+            return 0
+        polls = sum(poller.interval.polls for poller in self.pollers)
+        return (elapsed / self.base_delay - polls) * 3600 / elapsed
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики слушателя.
+
+        :return: Словарь с бюджетом страниц, счётчиками догрузки пропущенных событий
+            и метриками интервалов опроса.
+        :rtype: `dict`
+        """
+        return {
+            "page_budget": self.page_budget,
+            "catchup_count": self.catchup_count,
+            "catchup_pages": self.catchup_pages,
+            "catchup_truncated": self.catchup_truncated,
+            "unchanged_polls": self.unchanged_polls,
+            "interval": min((poller.interval.current for poller in self.pollers), default=None),
+            "requests_saved_per_hour": self.requests_saved_per_hour(),
+            "pollers": [poller.get_stats() for poller in self.pollers],
+            "dedup": self.dedup.get_stats(),
+        }
                 
-    def listen(self, requests_delay: int | float = 4) -> Generator[ChatInitializedEvent | NewMessageEvent | NewDealEvent | ItemPaidEvent
-                                                                  | ItemSentEvent | DealConfirmedEvent | DealRolledBackEvent | DealHasProblemEvent
-                                                                  | DealProblemResolvedEvent | DealStatusChangedEvent,
-                                                                  None, None]:
+    def listen(
+        self,
+        requests_delay: int | float = 4,
+        min_delay: int | float | None = None,
+        max_delay: int | float | None = None,
+        pollers: list[ChatPoller] | None = None,
+    ) -> Generator[ChatInitializedEvent | NewMessageEvent | NewDealEvent | ItemPaidEvent
+                   | ItemSentEvent | DealConfirmedEvent | DealRolledBackEvent | DealHasProblemEvent
+                   | DealProblemResolvedEvent | DealStatusChangedEvent,
+                   None, None]:
         """
         "Слушает" события в чатах. 
-        Бесконечно отправляет запросы, узнавая новые события из чатов.
+        Бесконечно отправляет запросы, узнавая новые события из чатов.\n
+        Если указаны `min_delay` и `max_delay`, интервал опроса адаптивный: после активности
+        он сбрасывается до `min_delay`, а во время простоя растёт до `max_delay`.
 
         :param requests_delay: Периодичность отправления запросов (в секундах).
+            Если интервал адаптивный — используется только для подсчёта сэкономленных запросов.
         :type requests_delay: `int` or `float`
 
+        :param min_delay: Минимальный интервал опроса (сразу после активности), _опционально_.
+        :type min_delay: `int` or `float` or `None`
+
+        :param max_delay: Максимальный интервал опроса (при простое), _опционально_.
+        :type max_delay: `int` or `float` or `None`
+
+        :param pollers: Выборки чатов со своими интервалами (например, по типам чатов), _опционально_.
+            По умолчанию опрашиваются все чаты сразу.
+        :type pollers: `list` of `PlayerokAPI.listener.polling.ChatPoller` or `None`
+
         :return: Полученный ивент.
         :rtype: `Generator` of
         `PlayerokAPI.listener.events.ChatInitializedEvent` \
@@ -171,23 +524,149 @@ class EventListener:
         _or_ `PlayerokAPI.listener.events.DealStatusChangedEvent(message.deal)`
         """
 
-        chats: ChatList | None = None
+        self._start_listening(requests_delay, min_delay, max_delay, pollers)
         while True:
+            poller, wait = self._next_poller()
+            if wait > 0:
+                time.sleep(wait)
             try:
-                next_chats = self.account.get_chats(10)
-                if not chats:
+                self._pages_left = self.page_budget
+                next_chats = self.get_chats(poller.last_messages, poller.type, poller.status)
+                if poller.last_messages is None:
                     events = self.get_chat_events(next_chats)
-                    for event in events:
-                        yield event
-                elif chats != next_chats:
-                    events = self.get_message_events(chats, next_chats)
-                    for event in events:
-                        yield event
-
-                chats = next_chats
-                time.sleep(requests_delay)
+                elif self._is_unchanged(poller, next_chats):
+                    events = []
+                else:
+                    events = self.get_message_events(poller.last_messages, next_chats)
+                self._finish_poll(poller, next_chats, events)
+                self._track_events(poller, events)
+                for event in events:
+                    yield event
+                self._save_checkpoint(poller)
             except Exception as e:
-                logger.exception(e)
-                print(f"Ошибка при получении ивентов: {e}")
-                time.sleep(requests_delay)  
-                continue
+                self._poll_failed(poller, e)
+            poller.next_poll_at = time.monotonic() + poller.interval.current
+
+    def _start_listening(
+        self,
+        requests_delay: int | float,
+        min_delay: int | float | None,
+        max_delay: int | float | None,
+        pollers: list[ChatPoller] | None,
+    ):
+        """ Подготавливает выборки чатов к опросу (и восстанавливает их из контрольной точки). """
+        self.pollers = pollers or [ChatPoller(AdaptiveInterval(min_delay or requests_delay,
+                                                               max_delay or min_delay or requests_delay))]
+        self.base_delay = requests_delay
+        self._listen_started_at = time.monotonic()
+        if self.checkpoint:
+            self.checkpoint.load()
+            for poller in self.pollers:
+                # продолжаем с того места, на котором остановились до перезапуска
+                poller.last_messages = self.checkpoint.get(poller.name)
+
+    def _next_poller(self) -> tuple[ChatPoller, float]:
+        """ Выбирает выборку, которую нужно опросить следующей, и сколько секунд до её опроса. """
+        poller = min(self.pollers, key=lambda p: p.next_poll_at)
+        return poller, poller.next_poll_at - time.monotonic()
+
+    def _is_unchanged(self, poller: ChatPoller, next_chats: ChatList) -> bool:
+        """ Совпадает ли отпечаток полученных чатов с отпечатком прошлого опроса выборки. """
+        if next_chats.fingerprint is None or next_chats.fingerprint != poller.fingerprint:
+            return False
+        self.unchanged_polls += 1
+        return True
+
+    def _finish_poll(self, poller: ChatPoller, next_chats: ChatList, events: list):
+        """ Запоминает результат опроса выборки и подстраивает её интервал. """
+        if poller.last_messages is not None and events:
+            poller.interval.on_activity()
+        else:
+            poller.interval.on_idle()
+        if poller.fingerprint is None or next_chats.fingerprint != poller.fingerprint:
+            poller.last_messages = self._merge_last_messages(poller.last_messages, next_chats)
+            poller.fingerprint = next_chats.fingerprint
+
+    def _merge_last_messages(self, last_messages: LastMessages | None, chats: ChatList) -> LastMessages:
+        """
+        Дополняет последние сообщения чатов выборки чатами страницы.\n
+        Чаты, выпавшие со страницы, не забываются, поэтому когда в них появится сообщение,
+        его ивенты будут получены от известного последнего сообщения, а не как ивенты нового чата.
+        Хранится не более `max_tracked_chats` чатов — обновлявшиеся давнее всех вытесняются.
+        """
+        merged = dict(last_messages or {})
+        # страница идёт от новых чатов к старым, а в конце словаря должны быть самые свежие
+        for chat_id, last_message in reversed(list(self.get_last_messages(chats).items())):
+            merged.pop(chat_id, None)
+            merged[chat_id] = last_message
+        for chat_id in list(merged)[:max(len(merged) - self.max_tracked_chats, 0)]:
+            del merged[chat_id]
+        return merged
+
+    def _track_events(self, poller: ChatPoller, events: list):
+        """
+        Запоминает состояние выборки после опроса до того, как его ивенты будут отданы.\n
+        При `manual_ack` ивентам выдаются `ack_id`, а состояние ждёт подтверждения их обработки.
+        """
+        message_ids, self._new_message_ids = self._new_message_ids, []
+        if not self.manual_ack:
+            return
+        pending = PendingCheckpoint(poller.name, dict(poller.last_messages or {}), message_ids, set())
+        for event in events:
+            event.ack_id = f"{self._ack_prefix}-{next(self._ack_counter)}"
+            pending.ack_ids.add(event.ack_id)
+            self._unacked[event.ack_id] = pending
+        self._pending_checkpoints.append(pending)
+
+    def acknowledge(self, event):
+        """
+        Подтверждает, что ивент обработан (при `manual_ack`).\n
+        Когда обработаны все ивенты опроса и всех опросов до него, его состояние
+        записывается в контрольную точку, а новые сообщения — в индекс обработанных на диске.
+        Ивенты прошлых запусков и повторные подтверждения игнорируются.
+
+        :param event: Ивент, полученный из `listen()`.
+        :type event: ивент `PlayerokAPI.listener.events`
+        """
+        ack_id = getattr(event, "ack_id", None)
+        pending = self._unacked.pop(ack_id, None)
+        if pending is None:
+            return
+        pending.ack_ids.discard(ack_id)
+        self._commit_acknowledged()
+
+    def _commit_acknowledged(self):
+        """ Записывает состояния опросов, все ивенты которых (и всех опросов до них) обработаны. """
+        committed = False
+        while self._pending_checkpoints and not self._pending_checkpoints[0].ack_ids:
+            pending = self._pending_checkpoints.popleft()
+            if self.checkpoint:
+                self._update_checkpoint(pending.name, pending.last_messages)
+            committed = True
+        if committed:
+            # сообщения опросов, ивенты которых ещё обрабатываются, на диск пока не попадают
+            self._save_dedup({message_id for pending in self._pending_checkpoints
+                              for message_id in pending.message_ids})
+
+    def _save_checkpoint(self, poller: ChatPoller):
+        """ Сохраняет выборку в контрольную точку (после обработки ивентов, чтобы при падении они не потерялись). """
+        if self.manual_ack:
+            # ивенты могли ещё не обработаться — записывается только то, что уже подтверждено
+            self._commit_acknowledged()
+            return
+        if self.checkpoint:
+            self._update_checkpoint(poller.name, poller.last_messages)
+        self._save_dedup()
+
+    def _update_checkpoint(self, name: str, last_messages: LastMessages):
+        """ Записывает последние сообщения чатов выборки в контрольную точку. """
+        self.checkpoint.update(name, last_messages)
+
+    def _save_dedup(self, exclude: set[str] | None = None):
+        """ Дописывает новые ID обработанных сообщений в файл индекса. """
+        self.dedup.save(exclude)
+
+    def _poll_failed(self, poller: ChatPoller, e: Exception):
+        logger.exception(e)
+        print(f"Ошибка при получении ивентов: {e}")
+        poller.interval.on_idle()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from ..enums import ChatTypes, ChatStatuses
+from .checkpoint import LastMessages
+
+
+class AdaptiveInterval:
+    """
+    Адаптивный интервал опроса.\n
+    Сразу после активности (новые сообщения, сделки) интервал сбрасывается до минимального,
+    а во время простоя постепенно увеличивается до максимального.
+
+    :param min_delay: Минимальный интервал (сразу после активности) в секундах.
+    :type min_delay: `int` or `float`
+
+    :param max_delay: Максимальный интервал (при долгом простое) в секундах.
+    :type max_delay: `int` or `float`
+
+    :param decay: Во сколько раз интервал увеличивается после каждого опроса без активности.
+    :type decay: `float`
+    """
+
+    def __init__(self, min_delay: int | float, max_delay: int | float, decay: float = 1.5):
+        self.min_delay: float = min_delay
+        """ Минимальный интервал в секундах. """
+        self.max_delay: float = max(max_delay, min_delay)
+        """ Максимальный интервал в секундах. """
+        self.decay: float = decay
+        """ Во сколько раз интервал увеличивается после опроса без активности. """
+        self.current: float = min_delay
+        """ Текущий интервал в секундах. """
+
+        self.polls: int = 0
+        """ Кол-во опросов. """
+        self.active_polls: int = 0
+        """ Кол-во опросов, на которых была активность. """
+
+    def on_activity(self) -> float:
+        """
+        Сбрасывает интервал до минимального после опроса с активностью.
+
+        :return: Новый интервал в секундах.
+        :rtype: `float`
+        """
+        self.polls += 1
+        self.active_polls += 1
+        self.current = self.min_delay
+        return self.current
+
+    def on_idle(self) -> float:
+        """
+        Увеличивает интервал после опроса без активности.
+
+        :return: Новый интервал в секундах.
+        :rtype: `float`
+        """
+        self.polls += 1
+        self.current = min(self.max_delay, self.current * self.decay)
+        return self.current
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики интервала.
+
+        :return: Словарь с границами, текущим интервалом и кол-вом опросов.
+        :rtype: `dict`
+        """
+        return {
+            "min_delay": self.min_delay,
+            "max_delay": self.max_delay,
+            "current": self.current,
+            "polls": self.polls,
+            "active_polls": self.active_polls,
+        }
+
+
+class ChatPoller:
+    """
+    Опрашиваемая слушателем выборка чатов со своим интервалом опроса.\n
+    Позволяет опрашивать разные типы/статусы чатов с разной частотой,
+    например личные сообщения чаще, чем чат уведомлений.
+
+    :param interval: Интервал опроса выборки.
+    :type interval: `PlayerokAPI.listener.polling.AdaptiveInterval`
+
+    :param type: Тип чатов выборки. По умолчанию не указан, значит все типы, _опционально_.
+    :type type: `PlayerokAPI.enums.ChatTypes` or `None`
+
+    :param status: Статус чатов выборки. По умолчанию не указан, значит любые, _опционально_.
+    :type status: `PlayerokAPI.enums.ChatStatuses` or `None`
+    """
+
+    def __init__(
+        self,
+        interval: AdaptiveInterval,
+        type: ChatTypes | None = None,
+        status: ChatStatuses | None = None,
+    ):
+        self.interval: AdaptiveInterval = interval
+        """ Интервал опроса выборки. """
+        self.type: ChatTypes | None = type
+        """ Тип чатов выборки. """
+        self.status: ChatStatuses | None = status
+        """ Статус чатов выборки. """
+        self.last_messages: LastMessages | None = None
+        """ Последние сообщения чатов, полученных при последнем опросе (`None` — выборка ещё не опрашивалась). """
+        self.fingerprint: int | None = None
+        """ Отпечаток первой страницы чатов, полученной при последнем опросе. """
+        self.next_poll_at: float = 0
+        """ Когда (time.monotonic) выборку нужно опросить в следующий раз. """
+
+    @property
+    def name(self) -> str:
+        """ Название выборки (для логов и статистики). """
+        parts = [self.type.name if self.type else "ALL"]
+        if self.status:
+            parts.append(self.status.name)
+        return "/".join(parts)
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики выборки.
+
+        :return: Словарь с названием выборки и метриками её интервала.
+        :rtype: `dict`
+        """
+        return {"name": self.name, **self.interval.get_stats()}
@@ -0,0 +1,185 @@
+from __future__ import annotations
+import asyncio
+import json
+import random
+from typing import AsyncGenerator
+from loguru import logger
+
+from ..account import Account
+from ..operations import Operation, CHAT_UPDATED
+
+
+GRAPHQL_WS_PROTOCOL = "graphql-transport-ws"
+""" Подпротокол websocket'а, по которому работают подписки (graphql-ws). """
+
+
+class SubscriptionClosed(Exception):
+    """ Сервер закрыл подписку или соединение. """
+
+
+class SubscriptionTransport:
+    """
+    Транспорт GraphQL подписок по websocket'у (протокол graphql-ws / `graphql-transport-ws`).\n
+    Подписывается на обновления чатов и отдаёт их через `async for`. Если соединение
+    обрывается, переподключается с экспоненциальной задержкой (с небольшим случайным разбросом),
+    а пока соединения нет — `AsyncEventListener` получает события обычным опросом.\n
+    Адрес и операция подписки настраиваются, поэтому транспорт можно проверить
+    на локальной заглушке websocket сервера.
+
+    :param account: Объект аккаунта (из него берутся токен, юзер-агент и прокси).
+    :type account: `PlayerokAPI.account.Account`
+
+    :param operation: Операция подписки, _опционально_ (по умолчанию обновления чатов).
+    :type operation: `PlayerokAPI.operations.Operation`
+
+    :param variables: Переменные подписки, _опционально_ (по умолчанию `{"userId": ID аккаунта}`).
+    :type variables: `dict` or `None`
+
+    :param url: Адрес websocket'а, _опционально_ (по умолчанию `wss://<домен сайта>/graphql`).
+    :type url: `str` or `None`
+
+    :param reconnect_delay: Задержка перед первым переподключением в секундах.
+    :type reconnect_delay: `int` or `float`
+
+    :param max_reconnect_delay: Максимальная задержка между переподключениями в секундах.
+    :type max_reconnect_delay: `int` or `float`
+
+    :param heartbeat: Как часто проверять соединение websocket ping'ом в секундах.
+    :type heartbeat: `int` or `float`
+    """
+
+    def __init__(
+        self,
+        account: Account,
+        operation: Operation = CHAT_UPDATED,
+        variables: dict | None = None,
+        url: str | None = None,
+        reconnect_delay: int | float = 1,
+        max_reconnect_delay: int | float = 60,
+        heartbeat: int | float = 20,
+    ):
+        if operation.document is None:
+            raise ValueError(f"Для подписки {operation.name} нужен текст документа")
+        self.account: Account = account
+        """ Объект аккаунта. """
+        self.operation: Operation = operation
+        """ Операция подписки. """
+        self.variables: dict | None = variables
+        """ Переменные подписки. """
+        self.url: str = url or account.base_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1) + "/graphql"
+        """ Адрес websocket'а. """
+        self.reconnect_delay: float = reconnect_delay
+        """ Задержка перед первым переподключением в секундах. """
+        self.max_reconnect_delay: float = max(max_reconnect_delay, reconnect_delay)
+        """ Максимальная задержка между переподключениями в секундах. """
+        self.heartbeat: float = heartbeat
+        """ Как часто проверять соединение websocket ping'ом в секундах. """
+
+        self.connected: bool = False
+        """ Подключён ли сейчас websocket (и подтверждена ли подписка сервером). """
+        self.connections: int = 0
+        """ Кол-во успешных подключений. """
+        self.reconnects: int = 0
+        """ Кол-во переподключений после обрыва или ошибки. """
+        self.messages: int = 0
+        """ Кол-во полученных обновлений. """
+        self.errors: int = 0
+        """ Кол-во ошибок соединения и подписки. """
+
+        self._closed: bool = False
+        self._ws = None
+
+    async def listen(self) -> AsyncGenerator[dict, None]:
+        """
+        Подписывается и бесконечно отдаёт обновления, переподключаясь при обрывах.
+
+        :return: Данные обновления (поле `field` операции из `payload.data`).
+        :rtype: `AsyncGenerator` of `dict`
+        """
+        import aiohttp
+
+        delay = self.reconnect_delay
+        async with aiohttp.ClientSession() as session:
+            while not self._closed:
+                try:
+                    async for data in self._subscribe(session):
+                        # соединение живое — следующая задержка снова начнётся с минимальной
+                        delay = self.reconnect_delay
+                        yield data
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.errors += 1
+                    logger.warning(f"Подписка {self.operation.name} оборвалась: {e}")
+                finally:
+                    self.connected = False
+                    self._ws = None
+                if self._closed:
+                    break
+                self.reconnects += 1
+                await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _subscribe(self, session) -> AsyncGenerator[dict, None]:
+        """ Одно подключение: инициализация, подписка и чтение сообщений до закрытия. """
+        import aiohttp
+
+        proxy = self.account.proxy_pool.choose() if self.account.proxy_pool else self.account.https_proxy
+        headers = self.account._prepare_headers({"Origin": self.account.base_url})
+        async with session.ws_connect(self.url, protocols=(GRAPHQL_WS_PROTOCOL,), headers=headers,
+                                      proxy=proxy, heartbeat=self.heartbeat) as ws:
+            self._ws = ws
+            await ws.send_json({"type": "connection_init", "payload": {}})
+            ack = await ws.receive_json(timeout=self.account.requests_timeout)
+            if ack.get("type") != "connection_ack":
+                raise SubscriptionClosed(f"Сервер не подтвердил соединение: {ack}")
+            await ws.send_json({
+                "id": "1",
+                "type": "subscribe",
+                "payload": {
+                    "operationName": self.operation.name,
+                    "query": self.operation.document,
+                    "variables": self.variables if self.variables is not None else {"userId": self.account.id},
+                },
+            })
+            self.connected = True
+            self.connections += 1
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    break
+                message = json.loads(msg.data)
+                msg_type = message.get("type")
+                if msg_type == "ping":
+                    await ws.send_json({"type": "pong"})
+                elif msg_type == "next":
+                    payload = message.get("payload") or {}
+                    if payload.get("errors"):
+                        raise SubscriptionClosed(f"Ошибка подписки: {payload['errors']}")
+                    self.messages += 1
+                    yield (payload.get("data") or {}).get(self.operation.field)
+                elif msg_type == "error":
+                    raise SubscriptionClosed(f"Ошибка подписки: {message.get('payload')}")
+                elif msg_type == "complete":
+                    raise SubscriptionClosed("Сервер завершил подписку")
+            raise SubscriptionClosed(f"Соединение закрыто (код {ws.close_code})")
+
+    async def close(self):
+        """ Закрывает подписку и больше не переподключается. """
+        self._closed = True
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики подписки.
+
+        :return: Словарь с состоянием соединения и счётчиками подключений, обновлений и ошибок.
+        :rtype: `dict`
+        """
+        return {
+            "connected": self.connected,
+            "connections": self.connections,
+            "reconnects": self.reconnects,
+            "messages": self.messages,
+            "errors": self.errors,
+        }
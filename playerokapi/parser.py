@@ -582,14 +582,19 @@ def chat_list(data: dict) -> 'ChatList':
     if not data:
         return None
     chats = []
+    fingerprint = []
     edges: dict[dict] = data.get("edges")
     if edges:
         for edge in edges:
+            node = edge.get("node") or {}
+            last_message = node.get("lastMessage") or {}
+            fingerprint.append((node.get("id"), last_message.get("id"), node.get("unreadMessagesCounter")))
             chats.append(chat(edge.get("node")))
     return ChatList(
         chats=chats,
         page_info=chat_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount")
+        total_count=data.get("totalCount"),
+        fingerprint=hash(tuple(fingerprint))
     )
 
 def review(data: dict) -> 'Review':
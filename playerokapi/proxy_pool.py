@@ -0,0 +1,213 @@
+from __future__ import annotations
+import time
+from collections import deque
+from threading import Lock
+from typing import Collection
+from urllib.parse import urlsplit
+
+
+class ProxyStats:
+    """
+    Статистика работы одного прокси.
+
+    :param proxy: Прокси в формате: `https://user:pass@ip:port` или `https://ip:port`.
+    :type proxy: `str`
+
+    :param window: Сколько последних запросов учитывается в статистике.
+    :type window: `int`
+    """
+
+    def __init__(self, proxy: str, window: int = 100):
+        self.proxy: str = proxy
+        """ Прокси. """
+        self.requests: int = 0
+        """ Всего запросов через прокси. """
+        self.errors: int = 0
+        """ Всего запросов, завершившихся ошибкой соединения или 5xx ответом. """
+        self.challenges: int = 0
+        """ Всего ответов со страницей CloudFlare проверки. """
+        self.consecutive_failures: int = 0
+        """ Кол-во неудачных запросов подряд. """
+        self.ejected_until: float = 0
+        """ До какого момента (time.monotonic) прокси исключён из выбора. """
+        self.ejections: int = 0
+        """ Сколько раз прокси исключался из выбора. """
+
+        self._eject_streak: int = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._outcomes: deque[int] = deque(maxlen=window)
+        """ Исходы последних запросов: 0 - успех, 1 - ошибка, 2 - CloudFlare проверка. """
+
+    @property
+    def name(self) -> str:
+        """ Прокси без логина и пароля (для вывода в логи и статистику). """
+        parts = urlsplit(self.proxy)
+        if not parts.hostname:
+            return self.proxy
+        return f"{parts.hostname}:{parts.port}" if parts.port else parts.hostname
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Получает перцентиль задержки ответа.
+
+        :param percent: Перцентиль (от 0 до 100).
+        :type percent: `float`
+
+        :return: Задержка в секундах или `None`, если запросов ещё не было.
+        :rtype: `float` or `None`
+        """
+        if not self._latencies:
+            return None
+        values = sorted(self._latencies)
+        index = min(len(values) - 1, int(round(percent / 100 * (len(values) - 1))))
+        return values[index]
+
+    @property
+    def error_rate(self) -> float:
+        """ Доля ошибок среди последних запросов. """
+        return self._outcomes.count(1) / len(self._outcomes) if self._outcomes else 0
+
+    @property
+    def challenge_rate(self) -> float:
+        """ Доля CloudFlare проверок среди последних запросов. """
+        return self._outcomes.count(2) / len(self._outcomes) if self._outcomes else 0
+
+    def score(self) -> float:
+        """
+        Оценка прокси — чем меньше, тем лучше.
+        Медианная задержка, увеличенная пропорционально доле ошибок и CloudFlare проверок.
+        """
+        p50 = self.percentile(50)
+        if p50 is None:
+            if self.error_rate or self.challenge_rate:
+                return float("inf")  # ни одного ответа, только ошибки — выбирается в последнюю очередь
+            return 0  # ещё не опробованный прокси выбирается в первую очередь
+        return p50 * (1 + 5 * self.error_rate + 10 * self.challenge_rate)
+
+    def to_dict(self) -> dict:
+        """ Статистика прокси в виде словаря. """
+        return {
+            "proxy": self.name,
+            "requests": self.requests,
+            "errors": self.errors,
+            "challenges": self.challenges,
+            "latency_p50": self.percentile(50),
+            "latency_p95": self.percentile(95),
+            "error_rate": self.error_rate,
+            "challenge_rate": self.challenge_rate,
+            "ejected": self.ejected_until > time.monotonic(),
+            "ejections": self.ejections,
+        }
+
+
+class ProxyPool:
+    """
+    Пул прокси с оценкой их состояния.\n
+    Для каждого запроса выбирается прокси с лучшей оценкой (по задержке, доле ошибок
+    и CloudFlare проверок). Прокси, у которого несколько запросов подряд завершились
+    неудачно, временно исключается из выбора.
+
+    :param proxies: Массив прокси в формате: `https://user:pass@ip:port` или `https://ip:port`.
+    :type proxies: `list[str]`
+
+    :param eject_after: После скольких неудачных запросов подряд прокси исключается.
+    :type eject_after: `int`
+
+    :param eject_seconds: На сколько секунд прокси исключается (удваивается при повторных исключениях, но не более 10 минут).
+    :type eject_seconds: `float`
+
+    :param window: Сколько последних запросов учитывается в статистике прокси.
+    :type window: `int`
+    """
+
+    def __init__(
+        self,
+        proxies: list[str],
+        eject_after: int = 3,
+        eject_seconds: float = 60,
+        window: int = 100,
+    ):
+        if not proxies:
+            raise ValueError("Пул прокси не может быть пустым")
+        self.eject_after: int = eject_after
+        """ После скольких неудачных запросов подряд прокси исключается. """
+        self.eject_seconds: float = eject_seconds
+        """ На сколько секунд прокси исключается. """
+        self.stats: dict[str, ProxyStats] = {proxy: ProxyStats(proxy, window) for proxy in dict.fromkeys(proxies)}
+        """ Статистика прокси в формате: {`прокси`: `статистика`, ...}. """
+        self._lock = Lock()
+
+    @property
+    def proxies(self) -> list[str]:
+        """ Все прокси пула. """
+        return list(self.stats)
+
+    def choose(self, exclude: Collection[str] = ()) -> str:
+        """
+        Выбирает прокси для следующего запроса.
+
+        :param exclude: Прокси, которые не нужно выбирать (например, уже опробованные для этого запроса), _опционально_.
+            Если исключены все прокси пула, выбирается из всех.
+        :type exclude: `Collection[str]`
+
+        :return: Прокси с лучшей оценкой среди неисключённых
+            (если исключены все — тот, который вернётся раньше остальных).
+        :rtype: `str`
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [s for s in self.stats.values() if s.proxy not in exclude] or list(self.stats.values())
+            available = [s for s in candidates if s.ejected_until <= now]
+            if not available:
+                return min(candidates, key=lambda s: s.ejected_until).proxy
+            return min(available, key=lambda s: (s.score(), s.requests)).proxy
+
+    def record(self, proxy: str | None, latency: float | None = None, error: bool = False, challenge: bool = False):
+        """
+        Записывает результат запроса через прокси.
+
+        :param proxy: Прокси, через который был отправлен запрос.
+        :type proxy: `str` or `None`
+
+        :param latency: Время ответа в секундах (если ответ был получен).
+        :type latency: `float` or `None`
+
+        :param error: Завершился ли запрос ошибкой.
+        :type error: `bool`
+
+        :param challenge: Вернул ли сайт страницу CloudFlare проверки.
+        :type challenge: `bool`
+        """
+        stats = self.stats.get(proxy)
+        if stats is None:
+            return
+        with self._lock:
+            stats.requests += 1
+            if latency is not None:
+                stats._latencies.append(latency)
+            if error or challenge:
+                stats.errors += error
+                stats.challenges += challenge
+                stats._outcomes.append(2 if challenge else 1)
+                stats.consecutive_failures += 1
+                if stats.consecutive_failures >= self.eject_after or challenge:
+                    duration = min(self.eject_seconds * 2 ** stats._eject_streak, 600)
+                    stats.ejected_until = time.monotonic() + duration
+                    stats.ejections += 1
+                    stats._eject_streak += 1
+                    stats.consecutive_failures = 0
+            else:
+                stats._outcomes.append(0)
+                stats.consecutive_failures = 0
+                stats.ejected_until = 0
+                stats._eject_streak = 0
+
+    def get_stats(self) -> list[dict]:
+        """
+        Получает метрики всех прокси пула.
+
+        :return: Массив словарей со статистикой каждого прокси.
+        :rtype: `list[dict]`
+        """
+        with self._lock:
+            return [stats.to_dict() for stats in self.stats.values()]
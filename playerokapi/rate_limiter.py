@@ -0,0 +1,124 @@
+from __future__ import annotations
+import asyncio
+import time
+from threading import Lock
+
+
+class RateLimiter:
+    """
+    Клиентский ограничитель частоты запросов по алгоритму token bucket.\n
+    Один объект разделяется всеми, кто отправляет запросы от имени аккаунта
+    (слушатель событий, хендлеры, фоновые циклы), чтобы суммарная частота запросов
+    не превышала заданный бюджет и сайт не отвечал ошибкой `TOO_MANY_REQUESTS`.
+
+    :param requests_per_second: Сколько запросов в секунду можно отправлять в среднем.
+        Если `0` или `None` — ограничение отключено.
+    :type requests_per_second: `float` or `None`
+
+    :param burst: Сколько запросов можно отправить подряд без ожидания.
+    :type burst: `int`
+    """
+
+    def __init__(self, requests_per_second: float | None = 2, burst: int = 5):
+        self.requests_per_second: float | None = requests_per_second
+        """ Средняя разрешённая частота запросов в секунду. """
+        self.burst: int = max(int(burst), 1)
+        """ Размер "ведра" — кол-во запросов, которое можно отправить подряд без ожидания. """
+
+        self.calls: int = 0
+        """ Кол-во запросов, прошедших через ограничитель. """
+        self.delayed_calls: int = 0
+        """ Кол-во запросов, которым пришлось ждать в очереди. """
+        self.total_wait: float = 0
+        """ Суммарное время ожидания в очереди в секундах. """
+        self.max_wait: float = 0
+        """ Максимальное время ожидания одного запроса в секундах. """
+        self.last_wait: float = 0
+        """ Время ожидания последнего запроса в секундах. """
+
+        self._tokens: float = self.burst
+        self._updated_at: float = time.monotonic()
+        self._lock = Lock()
+
+    def configure(self, requests_per_second: float | None, burst: int):
+        """
+        Изменяет бюджет запросов на лету (например, после изменения конфига).
+
+        :param requests_per_second: Сколько запросов в секунду можно отправлять в среднем.
+        :type requests_per_second: `float` or `None`
+
+        :param burst: Сколько запросов можно отправить подряд без ожидания.
+        :type burst: `int`
+        """
+        with self._lock:
+            self.requests_per_second = requests_per_second
+            self.burst = max(int(burst), 1)
+            self._tokens = min(self._tokens, self.burst)
+
+    def _reserve(self) -> float:
+        """
+        Забирает токен из ведра (при необходимости — в долг) и считает,
+        сколько нужно подождать до отправки запроса.
+
+        :return: Время ожидания в секундах.
+        :rtype: `float`
+        """
+        with self._lock:
+            self.calls += 1
+            if not self.requests_per_second:
+                self.last_wait = 0
+                return 0
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.requests_per_second)
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.requests_per_second if self._tokens < 0 else 0
+            self.last_wait = wait
+            if wait > 0:
+                self.delayed_calls += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self) -> float:
+        """
+        Блокирует поток, пока бюджет не позволит отправить запрос.
+
+        :return: Время, проведённое в очереди, в секундах.
+        :rtype: `float`
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        То же, что `acquire()`, но не блокирует event loop.
+
+        :return: Время, проведённое в очереди, в секундах.
+        :rtype: `float`
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики ограничителя.
+
+        :return: Словарь с бюджетом, кол-вом запросов и временем ожидания в очереди.
+        :rtype: `dict`
+        """
+        with self._lock:
+            return {
+                "requests_per_second": self.requests_per_second,
+                "burst": self.burst,
+                "calls": self.calls,
+                "delayed_calls": self.delayed_calls,
+                "total_wait": self.total_wait,
+                "average_wait": self.total_wait / self.calls if self.calls else 0,
+                "max_wait": self.max_wait,
+                "last_wait": self.last_wait,
+            }
@@ -0,0 +1,263 @@
+from __future__ import annotations
+import asyncio
+import gzip
+import json
+import time
+from collections import deque
+from threading import Lock
+from typing import Any
+
+
+def describe_request(method: str, payload: dict[str, str] | bytes | None) -> tuple[Any, Any, bool]:
+    """
+    Получает из запроса имя GraphQL операции и её переменные.
+
+    :param method: Метод запроса: post, get.
+    :type method: `str`
+
+    :param payload: Payload запроса (параметры GET запроса, тело POST запроса или поля multipart запроса).
+    :type payload: `dict[str, str]` or `bytes` or `None`
+
+    :return: Кортеж (имя операции, переменные, отправлен ли полный текст документа).
+        Для запроса-массива имя и переменные — массивы по всем операциям.
+    :rtype: `tuple`
+    """
+    try:
+        if method == "get":
+            body = {"operationName": payload.get("operationName"),
+                    "variables": json.loads(payload.get("variables") or "{}")}
+        elif isinstance(payload, bytes):
+            body = json.loads(payload)
+        elif isinstance(payload, dict) and "operations" in payload:
+            body = json.loads(payload["operations"])
+        else:
+            return None, payload, False
+    except (ValueError, AttributeError):
+        return None, None, False
+    if isinstance(body, list):
+        return ([b.get("operationName") for b in body], [b.get("variables") for b in body],
+                any("query" in b for b in body))
+    return body.get("operationName"), body.get("variables"), "query" in body
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RecordedResponse:
+    """
+    Ответ, воспроизведённый из записи трафика.\n
+    Повторяет те поля ответа клиента, которые использует аккаунт.
+
+    :param status_code: HTTP статус ответа.
+    :type status_code: `int`
+
+    :param text: Тело ответа.
+    :type text: `str`
+
+    :param content_type: Тип содержимого ответа.
+    :type content_type: `str`
+
+    :param url: URL запроса.
+    :type url: `str`
+    """
+
+    def __init__(self, status_code: int, text: str, content_type: str = "application/json", url: str = ""):
+        self.status_code: int = status_code
+        """ HTTP статус ответа. """
+        self.text: str = text
+        """ Тело ответа. """
+        self.content: bytes = text.encode("utf-8")
+        """ Тело ответа в байтах. """
+        self.headers: dict[str, str] = {"content-type": content_type}
+        """ Заголовки ответа. """
+        self.url: str = url
+        """ URL запроса. """
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class TrafficRecorder:
+    """
+    Записывает GraphQL запросы аккаунта и ответы на них в файл.\n
+    Каждая строка файла — JSON запись: время от начала записи, метод, имя операции, переменные,
+    статус, тело ответа и время ответа. Если путь заканчивается на `.gz`, файл сжимается.\n
+    Записанный трафик воспроизводится через `TrafficReplayer`, чтобы профилировать
+    слушатель и хендлеры без обращения к сайту.
+
+    :param path: Путь к файлу записи.
+    :type path: `str`
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        """ Путь к файлу записи. """
+        self.records: int = 0
+        """ Кол-во записанных ответов. """
+
+        self._started_at: float = time.monotonic()
+        self._file = _open(path, "a")
+        self._lock = Lock()
+
+    def record(self, method: str, payload: dict[str, str] | bytes | None, resp, latency: float):
+        """
+        Записывает запрос и ответ на него.
+
+        :param method: Метод запроса: post, get.
+        :type method: `str`
+
+        :param payload: Payload запроса.
+        :type payload: `dict[str, str]` or `bytes` or `None`
+
+        :param resp: Объект ответа.
+        :type resp: `requests.Response`
+
+        :param latency: Время ответа в секундах.
+        :type latency: `float`
+        """
+        operation, variables, with_document = describe_request(method, payload)
+        line = json.dumps({
+            "t": round(time.monotonic() - self._started_at, 4),
+            "method": method,
+            "op": operation,
+            "vars": variables,
+            "doc": with_document,
+            "status": resp.status_code,
+            "type": resp.headers.get("content-type", ""),
+            "latency": round(latency, 4),
+            "body": resp.text,
+        }, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.records += 1
+
+    def close(self):
+        """ Закрывает файл записи. """
+        with self._lock:
+            self._file.close()
+
+
+class TrafficReplayer:
+    """
+    Воспроизводит записанный через `TrafficRecorder` трафик вместо запросов на сайт.\n
+    Ответы подбираются по имени операции и переменным запроса и отдаются в том порядке,
+    в котором были записаны (после последнего повторяется он же), поэтому слушатель событий
+    и бот проходят ту же последовательность ответов, что и при записи.
+    Если для переменных нет записи, отдаётся следующий ответ той же операции.
+
+    :param path: Путь к файлу записи.
+    :type path: `str`
+
+    :param speed: Во сколько раз быстрее записи отдавать ответы
+        (время ответа делится на `speed`; 0 — без задержек).
+    :type speed: `int` or `float`
+    """
+
+    def __init__(self, path: str, speed: int | float = 1):
+        self.path: str = path
+        """ Путь к файлу записи. """
+        self.speed: float = speed
+        """ Во сколько раз быстрее записи отдавать ответы (0 — без задержек). """
+
+        self.hits: int = 0
+        """ Кол-во запросов, для которых нашёлся ответ с теми же переменными. """
+        self.fallbacks: int = 0
+        """ Кол-во запросов, для которых нашёлся только ответ той же операции с другими переменными. """
+        self.misses: int = 0
+        """ Кол-во запросов, для которых в записи нет ответа. """
+        self.exhausted: int = 0
+        """ Кол-во запросов, для которых записанные ответы закончились (повторён последний). """
+
+        self._by_request: dict[str, deque[dict]] = {}
+        self._by_operation: dict[str, deque[dict]] = {}
+        self._lock = Lock()
+        self.load()
+
+    def load(self):
+        """ Загружает запись из файла. """
+        by_request, by_operation = {}, {}
+        with _open(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = self._key(entry["op"], entry["vars"], entry.get("doc", False))
+                by_request.setdefault(key, deque()).append(entry)
+                by_operation.setdefault(json.dumps(entry["op"]), deque()).append(entry)
+        with self._lock:
+            self._by_request, self._by_operation = by_request, by_operation
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_request.values())
+
+    def _key(self, operation: Any, variables: Any, with_document: bool) -> str:
+        return json.dumps([operation, variables, with_document], sort_keys=True, ensure_ascii=False)
+
+    def _next(self, method: str, url: str, payload: dict[str, str] | bytes | None) -> tuple[RecordedResponse, float]:
+        """ Выбирает следующий записанный ответ на запрос: (ответ, задержка перед ним в секундах). """
+        operation, variables, with_document = describe_request(method, payload)
+        with self._lock:
+            entries = self._by_request.get(self._key(operation, variables, with_document))
+            if entries:
+                self.hits += 1
+            else:
+                entries = self._by_operation.get(json.dumps(operation))
+                if not entries:
+                    self.misses += 1
+                    body = json.dumps({"errors": [{"message": f"Нет записанного ответа на {operation}"}]})
+                    return RecordedResponse(599, body, url=url), 0
+                self.fallbacks += 1
+            if len(entries) > 1:
+                entry = entries.popleft()
+            else:
+                entry = entries[0]
+                self.exhausted += 1
+        delay = entry.get("latency", 0) / self.speed if self.speed else 0
+        return RecordedResponse(entry["status"], entry["body"], entry.get("type") or "application/json", url), delay
+
+    def replay(self, method: str, url: str, payload: dict[str, str] | bytes | None) -> RecordedResponse:
+        """
+        Отдаёт записанный ответ на запрос (выждав записанное время ответа с учётом `speed`).
+
+        :param method: Метод запроса: post, get.
+        :type method: `str`
+
+        :param url: URL запроса.
+        :type url: `str`
+
+        :param payload: Payload запроса.
+        :type payload: `dict[str, str]` or `bytes` or `None`
+
+        :return: Записанный ответ.
+        :rtype: `PlayerokAPI.recording.RecordedResponse`
+        """
+        resp, delay = self._next(method, url, payload)
+        if delay > 0:
+            time.sleep(delay)
+        return resp
+
+    async def replay_async(self, method: str, url: str, payload: dict[str, str] | bytes | None) -> RecordedResponse:
+        """ Асинхронная версия `replay()`, не блокирующая event loop. """
+        resp, delay = self._next(method, url, payload)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return resp
+
+    def get_stats(self) -> dict:
+        """
+        Получает метрики воспроизведения.
+
+        :return: Словарь с кол-вом оставшихся записей и счётчиками подбора ответов.
+        :rtype: `dict`
+        """
+        return {
+            "remaining": len(self),
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "misses": self.misses,
+            "exhausted": self.exhausted,
+        }
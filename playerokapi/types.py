@@ -4,6 +4,7 @@ import json
 
 from .account import Account
 from . import parser
+from . import operations
 from .enums import *
 
 class FileObject:
@@ -317,6 +318,17 @@ class UserProfile:
     def set_account(self, acc: Account):
         self.__account = acc
 
+    def __getstate__(self) -> dict:
+        # аккаунт (сессия, блокировки) не сериализуется — например, при складывании ивентов на диск
+        state = self.__dict__.copy()
+        state.pop("_UserProfile__account", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        from . import get_account
+        self.__dict__.update(state)
+        self.__account = get_account()
+
     def get_items(self, count: int = 24, statuses: list[ItemStatuses] | None = None,
                   after_cursor: str | None = None) -> ItemProfileList:
         """
@@ -338,18 +350,11 @@ class UserProfile:
         if statuses:
             for status in statuses:
                 payload_status.append(status.name)
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.__account.base_url
-        }
-        payload = {
-            "operationName": "items",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id, "status": payload_status}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": "d79d6e2921fea03c5f1515a8925fbb816eacaa7bcafe03eb47a40425ef49601e"}}, ensure_ascii=False)
-        }
-        r = self.__account.request("get", f"{self.__account.base_url}/graphql", headers, payload).json()
-        return parser.item_profile_list(r["data"]["items"])
+        return self.__account._execute(
+            operations.ITEMS,
+            {"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id, "status": payload_status}},
+            parser.item_profile_list,
+        )
 
     def get_reviews(self, count: int = 24, status: ReviewStatuses = ReviewStatuses.APPROVED, 
                     comment_required: bool = False, rating: int | None = None, game_id: str | None = None, 
@@ -394,12 +399,6 @@ class UserProfile:
         :return: Страница отзывов.
         :rtype: `PlayerokAPI.types.ReviewList`
         """
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Origin": self.__account.base_url,
-        }
-
         filters = {"userId": self.id, "status": [status.name] if status else None}
         if comment_required is not None:
             filters["hasComment"] = comment_required
@@ -416,13 +415,11 @@ class UserProfile:
             if max_item_price is not None:
                 item_price["max"] = max_item_price
             filters["itemPrice"] = item_price
-        payload = {
-            "operationName": "testimonials",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": filters, "sort": {"direction": sort_direction.name if sort_direction else None, "field": sort_field}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": "bd4f2f6b77502701689193a1ab4cee28b683fc66164c54fba96fd01873b08a01"}}, ensure_ascii=False)
-        }
-        r = self.__account.request("get", f"{self.__account.base_url}/graphql", headers, payload).json()
-        return parser.review_list(r["data"]["testimonials"])
+        return self.__account._execute(
+            operations.TESTIMONIALS,
+            {"pagination": {"first": count, "after": after_cursor}, "filter": filters, "sort": {"direction": sort_direction.name if sort_direction else None, "field": sort_field}},
+            parser.review_list,
+        )
 
 class Event:
     #TODO: Сделать класс ивента Event
@@ -1883,15 +1880,23 @@ class ChatList:
 
     :param total_count: Всего чатов.
     :type total_count: `int`
+
+    :param fingerprint: Отпечаток страницы (ID чатов, ID их последних сообщений и счётчики непрочитанных), _опционально_.
+    :type fingerprint: `int` or `None`
     """
     def __init__(self, chats: list[Chat], page_info: ChatPageInfo,
-                 total_count: int):
+                 total_count: int, fingerprint: int | None = None):
         self.chats: list[Chat] = chats
         """ Чаты страницы. """
         self.page_info: ChatPageInfo = page_info
         """ Информация о странице. """
         self.total_count: int = total_count
         """ Всего чатов. """
+        self.fingerprint: int | None = fingerprint
+        """ 
+        Отпечаток страницы в том виде, в котором она пришла с сервера.\n
+        Если отпечатки двух страниц совпадают, в чатах ничего не изменилось. 
+        """
 
 class Review:
     """
@@ -0,0 +1,104 @@
+from __future__ import annotations
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import *
+
+
+Attachment = Union[str, os.PathLike, BinaryIO]
+""" Файл-приложение: путь к файлу или открытый бинарный файловый объект. """
+
+
+class Uploads:
+    """
+    Файлы multipart запроса GraphQL (спецификация graphql-multipart-request).\n
+    Файлы передаются в HTTP клиент путями, поэтому он читает их с диска потоком
+    при отправке, а не целиком в память. Файловые объекты без пути на диске
+    (например, `io.BytesIO`) предварительно копируются во временные файлы по частям,
+    несколько таких объектов копируются параллельно.
+
+    :param attachments: Массив файлов-приложений (пути или файловые объекты).
+    :type attachments: `list[str | os.PathLike | BinaryIO]`
+
+    :param variable: Путь к переменной операции, в которую подставляются файлы, например `attachments`.
+    :type variable: `str`
+    """
+
+    def __init__(self, attachments: list[Attachment], variable: str):
+        self.files: dict[str, str] = {}
+        """ Файлы запроса в формате: {`номер`: `путь к файлу`, ...}. """
+        self.map: dict[str, list[str]] = {}
+        """ Карта файлов запроса в формате: {`номер`: [`путь к переменной`], ...}. """
+
+        self._temp_paths: list[str] = []
+        try:
+            paths = self._resolve_paths(attachments)
+        except Exception:
+            self.close()
+            raise
+        for i, path in enumerate(paths):
+            self.files[str(i + 1)] = path
+            self.map[str(i + 1)] = [f"variables.{variable}.{i}"]
+
+    def _resolve_paths(self, attachments: list[Attachment]) -> list[str]:
+        paths: list[str | None] = []
+        to_spool: list[tuple[int, BinaryIO]] = []
+        for i, attachment in enumerate(attachments):
+            path = self._file_path(attachment)
+            if path is None:
+                to_spool.append((i, attachment))
+            paths.append(path)
+
+        if len(to_spool) == 1:
+            i, file = to_spool[0]
+            paths[i] = self._spool(file)
+        elif to_spool:
+            with ThreadPoolExecutor(max_workers=min(len(to_spool), 8)) as executor:
+                for (i, _), path in zip(to_spool, executor.map(self._spool, [f for _, f in to_spool])):
+                    paths[i] = path
+        return paths
+
+    def _file_path(self, attachment: Attachment) -> str | None:
+        """ Получает путь к файлу на диске, если его можно отправить без копирования. """
+        if isinstance(attachment, (str, os.PathLike)):
+            path = os.fspath(attachment)
+            if not os.path.isfile(path):
+                raise FileNotFoundError(path)
+            return path
+        name = getattr(attachment, "name", None)
+        if isinstance(name, str) and os.path.isfile(name):
+            try:
+                if attachment.tell() == 0:
+                    return name
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def _spool(self, file: BinaryIO) -> str:
+        """ Копирует файловый объект во временный файл по частям. """
+        name = getattr(file, "name", None)
+        suffix = os.path.splitext(name)[1] if isinstance(name, str) else ""
+        fd, path = tempfile.mkstemp(prefix="playerokapi_", suffix=suffix)
+        self._temp_paths.append(path)
+        with os.fdopen(fd, "wb") as out:
+            shutil.copyfileobj(file, out, 1024 * 1024)
+        return path
+
+    def close(self):
+        """ Удаляет временные файлы. """
+        for path in self._temp_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._temp_paths.clear()
+
+    def __bool__(self) -> bool:
+        return bool(self.files)
+
+    def __enter__(self) -> Uploads:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,13 +1,36 @@
+from contextvars import ContextVar
+
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .playerokbot import PlayerokBot
 
 _playerok_bot: 'PlayerokBot' = None
 
-def get_playerok_bot() -> 'PlayerokBot':
+_playerok_bots: dict[str, 'PlayerokBot'] = {}
+""" Все запущенные в процессе боты в формате: {`название аккаунта`: `бот`, ...}. """
+
+_current_bot: ContextVar['PlayerokBot | None'] = ContextVar("plbot_current_bot", default=None)
+""" Бот, ивенты которого сейчас обрабатываются (приоритетнее выбранного глобального бота). """
+
+def get_playerok_bot(name: str | None = None) -> 'PlayerokBot':
     global _playerok_bot
-    return _playerok_bot
+    if name is not None:
+        return _playerok_bots.get(name)
+    return _current_bot.get() or _playerok_bot
 
 def set_playerok_bot(new: 'PlayerokBot') -> 'PlayerokBot':
     global _playerok_bot
-    _playerok_bot = new
\ No newline at end of file
+    _playerok_bot = new
+
+def get_playerok_bots() -> dict[str, 'PlayerokBot']:
+    return _playerok_bots
+
+def add_playerok_bot(new: 'PlayerokBot') -> 'PlayerokBot':
+    """ Добавляет бота в список запущенных (первый добавленный становится выбранным глобальным ботом). """
+    _playerok_bots[new.name] = new
+    if _playerok_bot is None:
+        set_playerok_bot(new)
+
+def set_current_playerok_bot(new: 'PlayerokBot'):
+    """ Задаёт бота текущего контекста (задачи asyncio или потока), например на время обработки его ивентов. """
+    return _current_bot.set(new)
@@ -3,25 +3,37 @@ import os
 
 class Data:
     INITIALIZED_USERS_PATH = 'plbot/bot_data/initialized_users.json'
+    LISTENER_CHECKPOINT_PATH = 'plbot/bot_data/listener_checkpoint.json'
+    LISTENER_SEEN_MESSAGES_PATH = 'plbot/bot_data/listener_seen_messages.json'
+    EVENT_SPILL_PATH = 'plbot/bot_data/event_spill.bin'
 
     @staticmethod
-    def get_initialized_users() -> list[str]:
+    def account_path(path: str, account_name: str = "main") -> str:
+        """ Получает путь к файлу данных аккаунта (у основного аккаунта `main` пути не меняются). """
+        if account_name == "main":
+            return path
+        root, ext = os.path.splitext(path)
+        return f"{root}_{account_name}{ext}"
+
+    @staticmethod
+    def get_initialized_users(account_name: str = "main") -> list[str]:
         """ Получает содержимое initialized_users.json """
-        folder_path = os.path.dirname(Data.INITIALIZED_USERS_PATH)
+        path = Data.account_path(Data.INITIALIZED_USERS_PATH, account_name)
+        folder_path = os.path.dirname(path)
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
         try:
-            with open(Data.INITIALIZED_USERS_PATH, 'r', encoding="utf-8") as f:
+            with open(path, 'r', encoding="utf-8") as f:
                 initialized_users = json.load(f)
         except:
-            with open(Data.INITIALIZED_USERS_PATH, 'w', encoding='utf-8') as f:
+            with open(path, 'w', encoding='utf-8') as f:
                 json.dump([], f, indent=4, ensure_ascii=False)
             initialized_users = []
         finally:
             return initialized_users
 
     @staticmethod
-    def set_initialized_users(new_data):
+    def set_initialized_users(new_data, account_name: str = "main"):
         """ Перезаписывает данные в initialized_users.json """
-        with open(Data.INITIALIZED_USERS_PATH, 'w', encoding='utf-8') as f:
+        with open(Data.account_path(Data.INITIALIZED_USERS_PATH, account_name), 'w', encoding='utf-8') as f:
             json.dump(new_data, f, indent=4, ensure_ascii=False)
\ No newline at end of file
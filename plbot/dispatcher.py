@@ -0,0 +1,458 @@
+import asyncio
+import os
+import pickle
+import struct
+import time
+from collections import OrderedDict, deque
+from logging import getLogger
+from typing import Any, Awaitable, Callable
+
+from playerokapi import use_account
+from playerokapi.enums import EventTypes
+
+
+logger = getLogger("UNIVERSAL.Dispatcher")
+
+
+class OverflowPolicies:
+    """
+    Что делать с новым ивентом, когда очередь диспетчера заполнена.
+    """
+    BLOCK = "block"
+    """ Ждать, пока в очереди освободится место (слушатель приостанавливается). """
+    SPILL = "spill"
+    """ Складывать ивенты на диск и возвращать их в очередь по мере освобождения места. """
+    DROP = "drop"
+    """ Отбрасывать ивенты низкого приоритета (новые сообщения), чтобы не потерять сделки и оплаты. """
+
+
+LOW_PRIORITY_EVENTS = frozenset({EventTypes.CHAT_INITIALIZED, EventTypes.NEW_MESSAGE})
+""" Ивенты низкого приоритета — отбрасываются первыми при переполнении очереди с политикой `drop`. """
+
+
+class EventSpill:
+    """
+    Очередь ивентов на диске для политики переполнения `spill`.\n
+    Ивенты дописываются в конец файла и читаются с начала; когда все прочитаны, файл очищается.
+    Каждый ивент хранится отдельной записью (длина + pickle) и записывается на диск через fsync,
+    поэтому ивенты, оставшиеся в файле после перезапуска (или сбоя), обрабатываются при следующем запуске,
+    а запись, которую не удалось разобрать, пропускается, не затрагивая остальные.
+
+    :param path: Путь к файлу очереди.
+    :type path: `str`
+    """
+
+    HEADER = struct.Struct("<I")
+    """ Заголовок записи — длина pickle данных. """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        """ Путь к файлу очереди. """
+
+        folder_path = os.path.dirname(path)
+        if folder_path and not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+        self._file = open(path, "a+b")
+        self._read_offset: int = 0
+        self._size: int = 0
+        self._file.seek(0)
+        good_offset = 0
+        while True:
+            header = self._file.read(self.HEADER.size)
+            if not header:
+                break
+            if len(header) == self.HEADER.size:
+                length, = self.HEADER.unpack(header)
+                if len(self._file.read(length)) == length:
+                    good_offset = self._file.tell()
+                    self._size += 1
+                    continue
+            # недописанная последняя запись (например, процесс был убит во время записи)
+            logger.warning(f"В файле очереди ивентов {path} недописана последняя запись, она пропущена")
+            self._file.truncate(good_offset)
+            break
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, item: Any):
+        """ Дописывает ивент в конец файла и ждёт записи на диск (если ивент не сериализуется, файл не меняется). """
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(self.HEADER.pack(len(data)) + data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._size += 1
+
+    def pop(self) -> Any:
+        """
+        Достаёт самый старый ивент из файла (`None`, если файл пуст).\n
+        Если запись не удалось разобрать (например, класс ивента изменился после обновления),
+        она всё равно считается прочитанной, а ошибка возбуждается дальше.
+        """
+        if not self._size:
+            return None
+        self._file.seek(self._read_offset)
+        length, = self.HEADER.unpack(self._file.read(self.HEADER.size))
+        data = self._file.read(length)
+        self._read_offset = self._file.tell()
+        self._size -= 1
+        if not self._size:
+            self._file.truncate(0)
+            self._read_offset = 0
+        return pickle.loads(data)
+
+    def close(self):
+        self._file.close()
+
+
+class ChatLag:
+    """
+    Задержка обработки ивентов одного чата.
+
+    :param chat_id: ID чата.
+    :type chat_id: `str`
+    """
+
+    def __init__(self, chat_id: str):
+        self.chat_id: str = chat_id
+        """ ID чата. """
+        self.pending: int = 0
+        """ Сколько ивентов чата ждут обработки. """
+        self.processed: int = 0
+        """ Сколько ивентов чата обработано. """
+        self.last_lag: float = 0
+        """ Задержка последнего ивента (от его получения до начала обработки) в секундах. """
+        self.max_lag: float = 0
+        """ Максимальная задержка ивента чата в секундах. """
+
+    def get_stats(self) -> dict:
+        return {
+            "chat_id": self.chat_id,
+            "pending": self.pending,
+            "processed": self.processed,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+        }
+
+
+class EventDispatcher:
+    """
+    Диспетчер ивентов Playerok с ограниченным пулом обработчиков.\n
+    Ивенты одного чата обрабатываются строго по очереди (в порядке получения),
+    а ивенты разных чатов — параллельно, не более `workers` одновременно.
+    Поэтому медленный хендлер в одном чате не задерживает оплаченный заказ в другом.
+    Хендлеры одного ивента вызываются функцией `handle` в своём порядке.\n
+    Очередь между слушателем и обработчиками может быть ограничена `max_size`, тогда слушатель продолжает
+    опрашивать сайт во время всплесков работы хендлеров, а переполнение разрешается политикой `overflow_policy`.
+
+    :param handle: Асинхронная функция, обрабатывающая один ивент (вызывает все его хендлеры).
+    :type handle: `Callable[[event], Awaitable]`
+
+    :param workers: Сколько ивентов разных чатов может обрабатываться одновременно.
+    :type workers: `int`
+
+    :param tracked_chats: Для скольких последних чатов хранить задержку обработки.
+    :type tracked_chats: `int`
+
+    :param max_size: Максимальное кол-во ивентов в очереди (0 — без ограничения).
+    :type max_size: `int`
+
+    :param overflow_policy: Что делать с ивентом при заполненной очереди (см. `OverflowPolicies`).
+    :type overflow_policy: `str`
+
+    :param spill_path: Путь к файлу, в который складываются ивенты при политике `spill`.
+    :type spill_path: `str` or `None`
+
+    :param on_done: Функция, вызываемая, когда ивент обработан, отброшен или сложен на диск
+        (например, `EventListener.acknowledge`), _опционально_.
+    :type on_done: `Callable[[event], Any]` or `None`
+
+    :param spill_account: Аккаунт, к которому привязываются ивенты, прочитанные с диска
+        (тот же, что у слушателя), _опционально_.
+    :type spill_account: `PlayerokAPI.account.Account` or `None`
+    """
+
+    def __init__(self, handle: Callable[[Any], Awaitable], workers: int = 8, tracked_chats: int = 100,
+                 max_size: int = 0, overflow_policy: str = OverflowPolicies.BLOCK, spill_path: str | None = None,
+                 on_done: Callable[[Any], Any] | None = None, spill_account: Any = None):
+        self.handle: Callable[[Any], Awaitable] = handle
+        """ Функция, обрабатывающая один ивент. """
+        self.on_done: Callable[[Any], Any] | None = on_done
+        """ Функция, вызываемая, когда ивент обработан, отброшен или сложен на диск. """
+        self.spill_account: Any = spill_account
+        """ Аккаунт, к которому привязываются ивенты, прочитанные с диска. """
+        self.workers: int = max(int(workers), 1)
+        """ Сколько ивентов разных чатов может обрабатываться одновременно. """
+        self.tracked_chats: int = tracked_chats
+        """ Для скольких последних чатов хранится задержка обработки. """
+        self.max_size: int = max_size
+        """ Максимальное кол-во ивентов в очереди (0 — без ограничения). """
+        self.overflow_policy: str = overflow_policy
+        """ Что делать с ивентом при заполненной очереди (см. `OverflowPolicies`). """
+        self.spill: EventSpill | None = EventSpill(spill_path) if overflow_policy == OverflowPolicies.SPILL and spill_path else None
+        """ Очередь ивентов на диске (при политике `spill`). """
+
+        self.processed: int = 0
+        """ Сколько ивентов обработано. """
+        self.max_queue_depth: int = 0
+        """ Максимальное кол-во ивентов, одновременно ждавших обработки. """
+        self.total_lag: float = 0
+        """ Суммарная задержка обработанных ивентов в секундах. """
+        self.max_lag: float = 0
+        """ Максимальная задержка ивента в секундах. """
+        self.total_queue_wait: float = 0
+        """ Суммарное время ивентов в очереди (от постановки до начала обработки) в секундах. """
+        self.max_queue_wait: float = 0
+        """ Максимальное время ивента в очереди в секундах. """
+        self.dropped: dict[str, int] = {}
+        """ Отброшенные при переполнении ивенты: {`тип ивента`: кол-во, ...}. """
+        self.spilled: int = 0
+        """ Сколько ивентов было сложено на диск. """
+        self.spill_errors: int = 0
+        """ Сколько ивентов не удалось сложить на диск (они ждали места в очереди, как при политике `block`). """
+        self.blocked: int = 0
+        """ Сколько раз слушатель ждал свободного места в очереди. """
+        self.blocked_time: float = 0
+        """ Сколько секунд слушатель суммарно ждал свободного места в очереди. """
+
+        self._queues: dict[str, deque] = {}
+        """ Ивенты, ждущие обработки, по чатам: {`ID чата`: очередь ивентов, ...}. """
+        self._ready: asyncio.Queue[str] | None = None
+        """ Чаты, ивенты которых можно обрабатывать (чат в ней не больше одного раза). """
+        self._active: set[str] = set()
+        """ Чаты, которые сейчас в очереди или обрабатываются. """
+        self._lags: OrderedDict[str, ChatLag] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+        self._queue_depth: int = 0
+        self._has_space: asyncio.Event | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """ Сколько ивентов сейчас ждут обработки. """
+        return self._queue_depth
+
+    def start(self):
+        """ Запускает обработчиков в текущем event loop'е. """
+        if self._tasks:
+            return
+        self._ready = asyncio.Queue()
+        self._has_space = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if self.spill is not None and len(self.spill):
+            logger.info(f"В очереди на диске осталось {len(self.spill)} необработанных ивентов с прошлого запуска")
+            self._refill()
+
+    async def stop(self):
+        """ Останавливает обработчиков (необработанные ивенты остаются в очереди). """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.spill is not None:
+            self.spill.close()
+
+    async def join(self):
+        """ Ждёт, пока будут обработаны все ивенты очереди. """
+        if self._ready is not None:
+            await self._ready.join()
+
+    def _chat_id(self, event) -> str:
+        chat = getattr(event, "chat", None)
+        return getattr(chat, "id", None) or ""
+
+    @property
+    def is_full(self) -> bool:
+        """ Заполнена ли очередь. """
+        return bool(self.max_size) and self._queue_depth >= self.max_size
+
+    async def submit(self, event):
+        """
+        Ставит ивент в очередь его чата.\n
+        Если очередь заполнена, поступает согласно `overflow_policy`: ждёт свободного места,
+        складывает ивент на диск или отбрасывает ивенты низкого приоритета.
+
+        :param event: Ивент Playerok.
+        :type event: ивент `PlayerokAPI.listener.events`
+        """
+        if not self._tasks:
+            self.start()
+        if self.spill is not None and (len(self.spill) or self.is_full):
+            # пока на диске есть ивенты, новые тоже идут на диск, чтобы не нарушить их порядок
+            try:
+                self.spill.append((event, time.time()))
+                self.spilled += 1
+                self._done(event)  # ивент на диске не потеряется
+                return
+            except Exception as e:
+                # ивент не сериализуется — ждём места в очереди, как при политике block
+                logger.error(f"Не удалось сложить ивент {getattr(event, 'type', event)} в очередь на диске: {e}")
+                self.spill_errors += 1
+                while len(self.spill) or self.is_full:
+                    self._has_space.clear()
+                    await self._has_space.wait()
+        if self.is_full:
+            if self.overflow_policy == OverflowPolicies.DROP:
+                if not self._make_room(event):
+                    return
+            else:
+                started_at = time.monotonic()
+                self.blocked += 1
+                while self.is_full:
+                    self._has_space.clear()
+                    await self._has_space.wait()
+                self.blocked_time += time.monotonic() - started_at
+        self._enqueue(event, time.time())
+
+    def _enqueue(self, event, queued_at: float):
+        chat_id = self._chat_id(event)
+        self._queues.setdefault(chat_id, deque()).append((event, queued_at))
+        self._queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue_depth)
+        self._chat_lag(chat_id).pending += 1
+        if chat_id not in self._active:
+            self._active.add(chat_id)
+            self._ready.put_nowait(chat_id)
+
+    def _drop(self, event):
+        name = getattr(getattr(event, "type", None), "name", str(event))
+        self.dropped[name] = self.dropped.get(name, 0) + 1
+        self._done(event)
+
+    def _done(self, event):
+        """ Сообщает, что с ивентом закончено (обработан, отброшен или сложен на диск). """
+        if self.on_done is None:
+            return
+        try:
+            self.on_done(event)
+        except Exception as e:
+            logger.error(f"Ошибка при подтверждении обработки ивента {getattr(event, 'type', event)}: {e}")
+
+    def _make_room(self, event) -> bool:
+        """
+        Освобождает место под ивент при политике `drop`.\n
+        Ивент низкого приоритета отбрасывается сам; под остальные из очереди убирается
+        самый старый ивент низкого приоритета (если таких нет, ивент ставится сверх лимита).
+
+        :return: Нужно ли ставить ивент в очередь.
+        :rtype: `bool`
+        """
+        if getattr(event, "type", None) in LOW_PRIORITY_EVENTS:
+            self._drop(event)
+            return False
+        oldest = None
+        for chat_id, queue in self._queues.items():
+            for item in queue:
+                if getattr(item[0], "type", None) in LOW_PRIORITY_EVENTS:
+                    if oldest is None or item[1] < oldest[1][1]:
+                        oldest = (chat_id, item)
+                    break
+        if oldest is not None:
+            chat_id, item = oldest
+            self._queues[chat_id].remove(item)
+            self._queue_depth -= 1
+            self._chat_lag(chat_id).pending -= 1
+            self._drop(item[0])
+        return True
+
+    def _refill(self):
+        """ Освободилось место: возвращает ивенты с диска и будит ждущего слушателя. """
+        if self.spill is not None:
+            while len(self.spill) and not self.is_full:
+                try:
+                    # профили пользователей в ивентах привязываются к аккаунту слушателя, а не к аккаунту контекста
+                    with use_account(self.spill_account):
+                        event, queued_at = self.spill.pop()
+                except Exception as e:
+                    # запись уже пропущена в `pop`, поэтому цикл не зациклится на ней
+                    logger.error(f"Не удалось прочитать ивент из очереди на диске, он пропущен: {e}")
+                    continue
+                self._enqueue(event, queued_at)
+        if not self.is_full and self._has_space is not None:
+            self._has_space.set()
+
+    def _chat_lag(self, chat_id: str) -> ChatLag:
+        lag = self._lags.get(chat_id)
+        if lag is None:
+            lag = self._lags[chat_id] = ChatLag(chat_id)
+            # вытесняем давние чаты, в которых ничего не ждёт обработки
+            for old_id in list(self._lags):
+                if len(self._lags) <= self.tracked_chats:
+                    break
+                if self._lags[old_id].pending == 0:
+                    del self._lags[old_id]
+        else:
+            self._lags.move_to_end(chat_id)
+        return lag
+
+    async def _worker(self):
+        while True:
+            chat_id = await self._ready.get()
+            try:
+                queue = self._queues[chat_id]
+                if not queue:
+                    # все ивенты чата отброшены при переполнении
+                    del self._queues[chat_id]
+                    self._active.discard(chat_id)
+                    continue
+                event, queued_at = queue.popleft()
+                self._queue_depth -= 1
+                self._refill()
+                now = time.time()
+                lag = self._chat_lag(chat_id)
+                lag.pending -= 1
+                # задержка считается от получения ивента слушателем (или постановки в очередь, если она позже)
+                lag.last_lag = now - min(getattr(event, "time", queued_at), queued_at)
+                lag.max_lag = max(lag.max_lag, lag.last_lag)
+                self.total_lag += lag.last_lag
+                self.max_lag = max(self.max_lag, lag.last_lag)
+                self.total_queue_wait += now - queued_at
+                self.max_queue_wait = max(self.max_queue_wait, now - queued_at)
+                try:
+                    await self.handle(event)
+                except Exception as e:
+                    logger.error(f"Ошибка при обработке ивента {getattr(event, 'type', event)} в чате {chat_id}: {e}")
+                self._done(event)
+                lag.processed += 1
+                self.processed += 1
+                if queue:
+                    # следующий ивент чата — в конец очереди, чтобы другие чаты не ждали
+                    self._ready.put_nowait(chat_id)
+                else:
+                    del self._queues[chat_id]
+                    self._active.discard(chat_id)
+            finally:
+                self._ready.task_done()
+
+    def get_stats(self, top: int = 5) -> dict:
+        """
+        Получает метрики диспетчера.
+
+        :param top: Сколько чатов с наибольшей задержкой вернуть.
+        :type top: `int`
+
+        :return: Словарь с глубиной очереди, задержками, отброшенными и сложенными на диск ивентами
+            и чатами с наибольшей задержкой.
+        :rtype: `dict`
+        """
+        chats = sorted(self._lags.values(), key=lambda lag: lag.last_lag, reverse=True)[:top]
+        return {
+            "workers": self.workers,
+            "busy_chats": len(self._active),
+            "queue_depth": self._queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "max_size": self.max_size,
+            "overflow_policy": self.overflow_policy,
+            "processed": self.processed,
+            "average_lag": self.total_lag / self.processed if self.processed else 0,
+            "max_lag": self.max_lag,
+            "average_queue_wait": self.total_queue_wait / self.processed if self.processed else 0,
+            "max_queue_wait": self.max_queue_wait,
+            "dropped": dict(self.dropped),
+            "spilled": self.spilled,
+            "spill_size": len(self.spill) if self.spill is not None else 0,
+            "spill_errors": self.spill_errors,
+            "blocked": self.blocked,
+            "blocked_time": self.blocked_time,
+            "chats": [lag.get_stats() for lag in chats],
+        }
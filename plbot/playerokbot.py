@@ -12,21 +12,32 @@ from .data import Data
 from .utils.stats import get_stats, set_stats
 
 from playerokapi.account import Account
+from playerokapi.async_account import AsyncAccount
+from playerokapi.rate_limiter import RateLimiter
+from playerokapi.recording import TrafficRecorder, TrafficReplayer
 from playerokapi import exceptions as plapi_exceptions
 from playerokapi.enums import *
 from playerokapi.listener.events import *
-from playerokapi.listener.listener import EventListener
+from playerokapi.listener.async_listener import AsyncEventListener
+from playerokapi.listener.polling import AdaptiveInterval, ChatPoller
+from playerokapi.listener.checkpoint import ListenerCheckpoint
+from playerokapi.listener.dedup import MessageDeduplicator
+from playerokapi.listener.subscription import SubscriptionTransport
 from playerokapi.types import Chat, Item
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from tgbot.telegrambot import TelegramBot
 
-from bot_settings.app import CURRENT_VERSION
-from core.console import set_title, restart
+from core.console import restart
 from core.handlers_manager import HandlersManager
+from core.handler_stats import handler_profiler, handler_name
+from core.handler_runner import handler_runner
 
-from . import set_playerok_bot
+from . import add_playerok_bot, get_playerok_bots, set_current_playerok_bot
+from .scheduler import start_scheduler
+from .dispatcher import EventDispatcher
+from playerokapi import set_current_account
 from tgbot import get_telegram_bot, get_loop
 
 PREFIX = F"{Fore.LIGHTWHITE_EX}[playerok bot]{Fore.WHITE}"
@@ -34,11 +45,25 @@ PREFIX = F"{Fore.LIGHTWHITE_EX}[playerok bot]{Fore.WHITE}"
 
 class PlayerokBot:
     """
-    Класс, запускающий и инициализирующий Playerok бота.
+    Класс, запускающий и инициализирующий Playerok бота.\n
+    В одном процессе может работать несколько ботов — по одному на каждый аккаунт из конфига.
+    Они работают в одном event loop'е, используют общие соединения с сайтом, общий планировщик
+    и одного Telegram бота, а частота запросов ограничивается для каждого аккаунта отдельно.
+
+    :param name: Название аккаунта из конфига (основной аккаунт — `main`).
+    :type name: `str`
+
+    :param shared_with: Бот, с аккаунтом которого нужно разделить соединения с сайтом, _опционально_.
+    :type shared_with: `PlayerokBot` or `None`
     """
 
-    def __init__(self):
-        self.config = Config.get()
+    _handlers_registered: bool = False
+    """ Зарегистрированы ли уже начальные хендлеры (они общие для всех ботов процесса). """
+
+    def __init__(self, name: str = "main", shared_with: 'PlayerokBot | None' = None):
+        self.name: str = name
+        """ Название аккаунта бота. """
+        self.config = Config.get_account(name)
         self.messages = Messages.get()
         self.custom_commands = CustomCommands.get()
         self.auto_deliveries = AutoDeliveries.get()
@@ -47,28 +72,71 @@ class PlayerokBot:
         try:
             self.playerok_account = Account(token=self.config["token"],
                                             user_agent=self.config["user_agent"],
-                                            requests_timeout=self.config["playerokapi_requests_timeout"]).get()
+                                            requests_timeout=self.config["playerokapi_requests_timeout"],
+                                            rate_limiter=RateLimiter(requests_per_second=self.config["playerokapi_requests_per_second"],
+                                                                     burst=self.config["playerokapi_requests_burst"]),
+                                            proxies=self.config["playerokapi_proxies"] or None)
             """ Класс, содержащий данные и методы аккаунта Playerok """
+            if self.config["playerokapi_traffic_replay_path"]:
+                self.playerok_account.replayer = TrafficReplayer(self.config["playerokapi_traffic_replay_path"],
+                                                                 speed=self.config["playerokapi_traffic_replay_speed"])
+            elif self.config["playerokapi_traffic_record_path"]:
+                self.playerok_account.recorder = TrafficRecorder(self.config["playerokapi_traffic_record_path"])
+            if shared_with is not None:
+                self.playerok_account.share_connections(shared_with.playerok_account)
+                if self.config["playerokapi_proxies"] == shared_with.config["playerokapi_proxies"]:
+                    # оценки прокси общие, раз аккаунты ходят через одни и те же прокси
+                    self.playerok_account.proxy_pool = shared_with.playerok_account.proxy_pool
+            self.playerok_account.get()
+            self.playerok_async_account = AsyncAccount.from_account(self.playerok_account)
+            """ Асинхронная версия аккаунта Playerok для хендлеров, чтобы не блокировать event loop """
+            if shared_with is not None:
+                self.playerok_async_account.share_connections(shared_with.playerok_async_account)
         except plapi_exceptions.UnauthorizedError as e:
-            self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}Не удалось подключиться к вашему Playerok аккаунту. Ошибка: {Fore.WHITE}{e}")
+            if name != "main":
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Не удалось подключиться к Playerok аккаунту {name}. Ошибка: {Fore.WHITE}{e}")
+                raise
+            self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Не удалось подключиться к вашему Playerok аккаунту. Ошибка: {Fore.WHITE}{e}")
             print(f"{Fore.LIGHTWHITE_EX}Начать снова настройку конфига? +/-")
             a = input(f"{Fore.WHITE}> {Fore.LIGHTWHITE_EX}")
             if a == "+":
                 Config.configure_config()
                 restart()
             else:
-                self.logger.info(f"{PREFIX} Вы отказались от настройки конфига. Перезагрузим бота и попробуем снова подключиться к вашему аккаунту...")
+                self.logger.info(f"{self.prefix} Вы отказались от настройки конфига. Перезагрузим бота и попробуем снова подключиться к вашему аккаунту...")
                 restart()
 
-        self.initialized_users: list = Data.get_initialized_users()
+        self.initialized_users: list = Data.get_initialized_users(name)
         """ Инициализированные пользователи. """
-        self.stats: dict = get_stats()
+        self.stats: dict = get_stats(name)
         """ Словарь статистика бота с момента запуска. """
 
         self.refresh_account_next_time = datetime.now() + timedelta(seconds=3600)
         """ Время следующего обновление данных об аккаунте. """
         self.try_restore_items_next_time = datetime.now()
         """ Время следующей попытки восстановить предметы. """
+        self.listener = AsyncEventListener(self.playerok_async_account,
+                                           page_budget=self.config["playerokapi_listener_page_budget"],
+                                           checkpoint=ListenerCheckpoint(Data.account_path(Data.LISTENER_CHECKPOINT_PATH, name))
+                                           if self.config["playerokapi_listener_checkpoint_enabled"] else None,
+                                           dedup=MessageDeduplicator(self.config["playerokapi_listener_dedup_size"],
+                                                                     Data.account_path(Data.LISTENER_SEEN_MESSAGES_PATH, name)
+                                                                     if self.config["playerokapi_listener_checkpoint_enabled"] else None),
+                                           subscription=SubscriptionTransport(self.playerok_async_account,
+                                                                              url=self.config["playerokapi_listener_subscription_url"] or None)
+                                           if self.config["playerokapi_listener_subscription_enabled"] else None,
+                                           manual_ack=True)
+        """ Слушатель событий Playerok. """
+        self.dispatcher = EventDispatcher(self.handle_event, workers=self.config["event_dispatcher_workers"],
+                                          max_size=self.config["event_queue_max_size"],
+                                          overflow_policy=self.config["event_queue_overflow_policy"],
+                                          spill_path=Data.account_path(Data.EVENT_SPILL_PATH, name),
+                                          on_done=self.listener.acknowledge,
+                                          spill_account=self.playerok_async_account)
+        """
+        Диспетчер ивентов: ивенты одного чата обрабатываются по очереди, разных чатов — параллельно.\n
+        Контрольная точка слушателя продвигается, только когда диспетчер закончил с ивентами опроса.
+        """
 
         self.__saved_chats: dict[str, Chat] = {}
         """ 
@@ -76,7 +144,14 @@ class PlayerokBot:
         В формате: {`chat_id` _or_ `username`: `chat_obj`, ...}
         """
 
-        set_playerok_bot(self)
+        add_playerok_bot(self)
+
+    @property
+    def prefix(self) -> str:
+        """ Префикс логов бота (у дополнительных аккаунтов — с названием аккаунта). """
+        if self.name == "main":
+            return PREFIX
+        return f"{Fore.LIGHTWHITE_EX}[playerok bot: {self.name}]{Fore.WHITE}"
 
     def get_chat_by_id(self, chat_id: str) -> Chat:
         """ 
@@ -132,6 +207,8 @@ class PlayerokBot:
         :param text: Текст лога.
         :type text: str
         """
+        if len(get_playerok_bots()) > 1:
+            text = f"<b>[{self.name}]</b> {text}"
         asyncio.run_coroutine_threadsafe(get_telegram_bot().log_event(text), get_loop())
 
     async def restore_last_sold_item(self, item: Item):
@@ -143,13 +220,13 @@ class PlayerokBot:
         """
 
         try:
-            profile = self.playerok_account.get_user(id=self.playerok_account.id)
-            items = profile.get_items(count=24, statuses=[ItemStatuses.SOLD]).items
+            profile = await self.playerok_async_account.get_user(id=self.playerok_account.id)
+            items = (await profile.get_items(count=24, statuses=[ItemStatuses.SOLD])).items
             item = [profile_item for profile_item in items if profile_item.name == item.name]
             if len(item) <= 0:
                 return
             item = item[0]
-            priority_statuses = self.playerok_account.get_item_priority_statuses(item.id, item.price)
+            priority_statuses = await self.playerok_async_account.get_item_priority_statuses(item.id, item.price)
             priority_status = None
             for status in priority_statuses:
                 if status.type is PriorityTypes.__members__.get(self.config["auto_restore_items_priority_status"]):
@@ -161,129 +238,177 @@ class PlayerokBot:
                         priority_status = status
                         break
 
-            new_item = self.playerok_account.publish_item(item.id, priority_status.id)
+            new_item = await self.playerok_async_account.publish_item(item.id, priority_status.id)
             if new_item.status is ItemStatuses.PENDING_APPROVAL or new_item.status is ItemStatuses.APPROVED:
-                self.logger.info(f"{PREFIX} Предмет {Fore.LIGHTYELLOW_EX}«{item.name}» {Fore.WHITE}был автоматически восстановлен после его покупки")
+                self.logger.info(f"{self.prefix} Предмет {Fore.LIGHTYELLOW_EX}«{item.name}» {Fore.WHITE}был автоматически восстановлен после его покупки")
                 if self.config["bot_event_notifications_chat_id"]:
                     self.log_to_tg(f"♻️ Предмет <code>{new_item.name}</code> был восстановлен")
             else:
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}Не удалось восстановить предмет «{new_item.name}». Его статус: {Fore.WHITE}{new_item.status.name}")
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Не удалось восстановить предмет «{new_item.name}». Его статус: {Fore.WHITE}{new_item.status.name}")
         except plapi_exceptions.RequestError as e:
             if e.error_code == "TOO_MANY_REQUESTS":
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При попытке восстановления предмета «{item.name}» произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
-                time.sleep(10)
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}При попытке восстановления предмета «{item.name}» произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
+                await asyncio.sleep(10)
             else:
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При восстановлении предмета «{item.name}» произошла ошибка запроса {e.error_code}: {Fore.WHITE}\n{e}")
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}При восстановлении предмета «{item.name}» произошла ошибка запроса {e.error_code}: {Fore.WHITE}\n{e}")
         except Exception as e:
-            self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При восстановлении предмета «{item.name}» произошла ошибка: {Fore.WHITE}{e}")
+            self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}При восстановлении предмета «{item.name}» произошла ошибка: {Fore.WHITE}{e}")
+
+    def refresh(self):
+        """
+        Обновляет данные бота: перечитывает конфиг и файлы настроек,
+        сохраняет инициализированных пользователей и раз в час обновляет данные аккаунта.
+
+        Вызывается общим планировщиком `plbot.scheduler` для всех ботов процесса.
+        """
+        try:
+            if Data.get_initialized_users(self.name) != self.initialized_users:
+                Data.set_initialized_users(self.initialized_users, self.name)
+            config = Config.get_account(self.name)
+            if config != self.config:
+                self.config = config
+            if Messages.get() != self.messages:
+                self.messages = Messages.get()
+            if CustomCommands.get() != self.custom_commands:
+                self.custom_commands = CustomCommands.get()
+            if AutoDeliveries.get() != self.auto_deliveries:
+                self.auto_deliveries = AutoDeliveries.get()
+
+            if datetime.now() > self.refresh_account_next_time:
+                # обновляем данные в том же объекте аккаунта, чтобы не терять пул открытых соединений
+                self.playerok_account.token = self.config["token"]
+                self.playerok_account.user_agent = self.config["user_agent"]
+                self.playerok_account.requests_timeout = self.config["playerokapi_requests_timeout"]
+                self.playerok_account.rate_limiter.configure(self.config["playerokapi_requests_per_second"],
+                                                             self.config["playerokapi_requests_burst"])
+                self.playerok_account.get()
+                self.playerok_async_account.copy_from(self.playerok_account)
+                self.refresh_account_next_time = datetime.now() + timedelta(seconds=3600)
+        except plapi_exceptions.RequestError as e:
+            if e.error_code == "TOO_MANY_REQUESTS":
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}При обновлении данных бота произошла ошибка 429 слишком частых запросов. Попробуем в следующем цикле")
+            else:
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}При обновлении данных бота произошла ошибка запроса {e.error_code}: {Fore.WHITE}\n{e}")
+        except Exception:
+            self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}При обновлении данных бота произошла ошибка: {Fore.WHITE}")
+            traceback.print_exc()
+
+    async def handle_event(self, event):
+        """
+        Обрабатывает ивент Playerok: по очереди вызывает все его хендлеры.
+
+        :param event: Ивент Playerok.
+        :type event: ивент `PlayerokAPI.listener.events`
+        """
+        # таблица хендлеров неизменяемая и подменяется целиком при включении/отключении модулей,
+        # поэтому берём свежую на каждый ивент без блокировок; хендлеры с фильтрами отбираются по индексу
+        for handler in HandlersManager.match_playerok_event_handlers(self, event):
+            try:
+                with handler_profiler.measure(handler, event.type.name, event.chat.id if event.chat else None):
+                    # синхронные хендлеры уходят в пул потоков, а зависшие прерываются по таймауту
+                    await handler_runner.run(handler, self, event)
+            except plapi_exceptions.RequestError as e:
+                if e.error_code == "TOO_MANY_REQUESTS":
+                    self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Произошла ошибка 429 слишком частых запросов при обработке хендлера {handler} в ивенте {event.type.name}. Ждём 10 секунд и пробуем снова")
+                    await asyncio.sleep(10)
+                else:
+                    self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Произошла ошибка {e.error_code} при обработке хендлера {handler} в ивенте {event.type.name}: {Fore.WHITE}\n{e}")
+            except Exception as e:
+                self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Произошла ошибка при обработке хендлера {handler} в ивенте {event.type.name}: {Fore.WHITE}{e}")
+
+    def on_handler_breaker_trip(self, handler, module):
+        """
+        Сообщает в Telegram о срабатывании предохранителя хендлера (см. `HandlerRunner`).
+
+        :param handler: Хендлер, много раз подряд не уложившийся в таймаут.
+        :type handler: `callable`
+
+        :param module: Отключённый модуль хендлера или `None`, если хендлер встроенный.
+        :type module: `core.modules_manager.Module` or `None`
+        """
+        if module is not None:
+            text = f"🚫 Модуль <b>{module.meta.name}</b> отключен: хендлер <code>{handler_name(handler)}</code> " \
+                   f"{handler_runner.breaker_threshold} раз подряд не уложился в {handler_runner.timeout} сек."
+        else:
+            text = f"⚠️ Хендлер <code>{handler_name(handler)}</code> {handler_runner.breaker_threshold} раз подряд " \
+                   f"не уложился в {handler_runner.timeout} сек. и временно пропускается"
+        if self.config["bot_event_notifications_chat_id"]:
+            self.log_to_tg(text)
 
     async def run_bot(self) :
         """ Основная функция-запускатор бота. """
 
-        # --- задаём начальные хендлеры бота ---
+        set_current_playerok_bot(self)
+        set_current_account(self.playerok_account)
+
+        # --- задаём начальные хендлеры бота (один раз на процесс, они общие для всех аккаунтов) ---
+        first_run = not PlayerokBot._handlers_registered
+        PlayerokBot._handlers_registered = True
         def handler_on_playerok_bot_init(plbot: PlayerokBot):
             """ Начальный хендлер ON_INIT. """
-            def endless_loop(cycle_delay=5):
-                """ Действия, которые должны выполняться в другом потоке, вне цикла раннера. """
-                while True:
-                    try:
-                        set_playerok_bot(plbot)
-                        if self.playerok_account.profile.balance is not None: balance = self.playerok_account.profile.balance.value
-                        else: balance = 0
-                        set_title(f"Playerok Universal v{CURRENT_VERSION} | {self.playerok_account.username}: {balance} RUB")
-                        if Data.get_initialized_users() != plbot.initialized_users:
-                            Data.set_initialized_users(plbot.initialized_users)
-                        if Config.get() != plbot.config:
-                            plbot.config = Config.get()
-                        if Messages.get() != plbot.messages:
-                            plbot.messages = Messages.get()
-                        if CustomCommands.get() != plbot.custom_commands:
-                            plbot.custom_commands = CustomCommands.get()
-                        if AutoDeliveries.get() != plbot.auto_deliveries:
-                            plbot.auto_deliveries = AutoDeliveries.get()
-                                    
-                        if datetime.now() > self.refresh_account_next_time:
-                            self.playerok_account = Account(token=self.config["token"],
-                                                            user_agent=self.config["user_agent"],
-                                                            requests_timeout=self.config["playerokapi_requests_timeout"]).get()
-                            self.refresh_account_next_time = datetime.now() + timedelta(seconds=3600)
-                    except plapi_exceptions.RequestError as e:
-                        if e.error_code == "TOO_MANY_REQUESTS":
-                            self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}В бесконечном цикле произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
-                            time.sleep(10)
-                        else:
-                            self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}В бесконечном цикле произошла ошибка запроса {e.error_code}: {Fore.WHITE}\n{e}")
-                    except Exception:
-                        self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}В бесконечном цикле произошла ошибка: {Fore.WHITE}")
-                        traceback.print_exc()
-                    time.sleep(cycle_delay)
-
-            endless_loop_thread = Thread(target=endless_loop, daemon=True)
-            endless_loop_thread.start()
-
-        bot_event_handlers = HandlersManager.get_bot_event_handlers()
-        bot_event_handlers["ON_PLAYEROK_BOT_INIT"].insert(0, handler_on_playerok_bot_init)
-        HandlersManager.set_bot_event_handlers(bot_event_handlers)
+            # обновление данных всех аккаунтов выполняет один общий планировщик
+            start_scheduler()
 
         async def handler_new_message(plbot: PlayerokBot, event: NewMessageEvent):
             """ Начальный хендлер новых сообщений. """
             try:
                 this_chat = event.chat
-                if self.config["first_message_enabled"]:
+                if plbot.config["first_message_enabled"]:
                     if event.message.user is not None:
                         if event.message.user.id == event.message.user.id and event.message.user.id not in plbot.initialized_users:
                             try:
-                                plbot.playerok_account.send_message(this_chat.id, 
-                                                                    plbot.msg("user_not_initialized",
-                                                                            buyer_username=event.message.user.username),
-                                                                    self.config.get("read_chat_before_sending_message_enabled") or False)
+                                await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                plbot.msg("user_not_initialized",
+                                                                                        buyer_username=event.message.user.username),
+                                                                                plbot.config.get("read_chat_before_sending_message_enabled") or False)
                                 plbot.initialized_users.append(event.message.user.id)
                             except Exception as e:
-                                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При отправке приветственного сообщения для {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
+                                plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При отправке приветственного сообщения для {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
 
                 if event.message.user is not None:
                     if event.message.user.id != plbot.playerok_account.id:
-                        if self.config["custom_commands_enabled"]:
-                            if event.message.text in self.custom_commands.keys():
+                        if plbot.config["custom_commands_enabled"]:
+                            if event.message.text in plbot.custom_commands.keys():
                                 try:
-                                    message = "\n".join(self.custom_commands[event.message.text])
-                                    plbot.playerok_account.send_message(this_chat.id, 
-                                                                        message, 
-                                                                        self.config.get("read_chat_before_sending_message_enabled") or False)
+                                    message = "\n".join(plbot.custom_commands[event.message.text])
+                                    await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                    message, 
+                                                                                    plbot.config.get("read_chat_before_sending_message_enabled") or False)
                                 except Exception as e:
-                                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При вводе пользовательской команды \"{event.message.text}\" у {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
-                                    plbot.playerok_account.send_message(this_chat.id, 
-                                                                        plbot.msg("command_error"),
-                                                                        self.config.get("read_chat_before_sending_message_enabled") or False)
+                                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При вводе пользовательской команды \"{event.message.text}\" у {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
+                                    await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                    plbot.msg("command_error"),
+                                                                                    plbot.config.get("read_chat_before_sending_message_enabled") or False)
                         if str(event.message.text).lower() == "!команды" or str(event.message.text).lower() == "!commands":
                             try:
-                                plbot.playerok_account.send_message(this_chat.id, 
-                                                                    plbot.msg("buyer_command_commands"),
-                                                                    self.config.get("read_chat_before_sending_message_enabled") or False)
+                                await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                plbot.msg("buyer_command_commands"),
+                                                                                plbot.config.get("read_chat_before_sending_message_enabled") or False)
                             except Exception as e:
-                                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При вводе команды \"!команды\" у {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
-                                plbot.playerok_account.send_message(this_chat.id, 
-                                                                    plbot.msg("command_error"),
-                                                                    self.config.get("read_chat_before_sending_message_enabled") or False)
+                                plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При вводе команды \"!команды\" у {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
+                                await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                plbot.msg("command_error"),
+                                                                                plbot.config.get("read_chat_before_sending_message_enabled") or False)
                         if str(event.message.text).lower() == "!продавец" or str(event.message.text).lower() == "!seller":
                             try:
-                                asyncio.run_coroutine_threadsafe(get_telegram_bot().call_seller(event.message.user.username, this_chat.id), get_loop())
-                                plbot.playerok_account.send_message(this_chat.id, 
-                                                                    plbot.msg("buyer_command_seller"),
-                                                                    self.config.get("read_chat_before_sending_message_enabled") or False)
+                                asyncio.run_coroutine_threadsafe(get_telegram_bot().call_seller(event.message.user.username, this_chat.id,
+                                                                                              plbot.name if len(get_playerok_bots()) > 1 else None), get_loop())
+                                await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                plbot.msg("buyer_command_seller"),
+                                                                                plbot.config.get("read_chat_before_sending_message_enabled") or False)
                             except Exception as e:
-                                self.logger.log(f"{PREFIX} {Fore.LIGHTRED_EX}При вводе команды \"!продавец\" у {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
-                                plbot.playerok_account.send_message(this_chat.id, 
-                                                                    plbot.msg("command_error"),
-                                                                    self.config.get("read_chat_before_sending_message_enabled") or False)
+                                plbot.logger.log(f"{plbot.prefix} {Fore.LIGHTRED_EX}При вводе команды \"!продавец\" у {event.message.user.username} произошла ошибка: {Fore.WHITE}{e}")
+                                await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                plbot.msg("command_error"),
+                                                                                plbot.config.get("read_chat_before_sending_message_enabled") or False)
             except plapi_exceptions.RequestError as e:
                 if e.error_code == "TOO_MANY_REQUESTS":
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
-                    time.sleep(10)
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
+                    await asyncio.sleep(10)
                 else:
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
             except Exception:
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка: {Fore.WHITE}")
+                plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка: {Fore.WHITE}")
                 traceback.print_exc()
 
         async def handler_new_deal(plbot: PlayerokBot, event: NewDealEvent):
@@ -291,54 +416,54 @@ class PlayerokBot:
             try:
                 try:
                     this_chat = event.chat
-                    self.logger.info(f"{PREFIX} 🛒  {Fore.LIGHTYELLOW_EX}Новая сделка: {Fore.WHITE}Пользователь {Fore.LIGHTYELLOW_EX}{event.deal.user.username}{Fore.WHITE} оплатил предмет {Fore.LIGHTYELLOW_EX}«{event.deal.item.name}»{Fore.WHITE} на сумму {Fore.LIGHTYELLOW_EX}{event.deal.item.price or '?'} р.")
-                    if self.config["bot_event_notifications_chat_id"]:
-                        self.log_to_tg(f"🛒 <b>Новая сделка:</b> пользователь <code>{event.deal.user.username}</code> оплатил предмет <code>{event.deal.item.name}</code> на сумму <b>{event.deal.item.price or '?'} р.</b>")
+                    plbot.logger.info(f"{plbot.prefix} 🛒  {Fore.LIGHTYELLOW_EX}Новая сделка: {Fore.WHITE}Пользователь {Fore.LIGHTYELLOW_EX}{event.deal.user.username}{Fore.WHITE} оплатил предмет {Fore.LIGHTYELLOW_EX}«{event.deal.item.name}»{Fore.WHITE} на сумму {Fore.LIGHTYELLOW_EX}{event.deal.item.price or '?'} р.")
+                    if plbot.config["bot_event_notifications_chat_id"]:
+                        plbot.log_to_tg(f"🛒 <b>Новая сделка:</b> пользователь <code>{event.deal.user.username}</code> оплатил предмет <code>{event.deal.item.name}</code> на сумму <b>{event.deal.item.price or '?'} р.</b>")
 
                     break_flag = False
-                    if self.config["auto_deliveries_enabled"]:
-                        for auto_delivery in self.auto_deliveries:
+                    if plbot.config["auto_deliveries_enabled"]:
+                        for auto_delivery in plbot.auto_deliveries:
                             for keyword in auto_delivery["keywords"]:
                                 if keyword.lower() in event.deal.item.name.lower():
-                                    self.playerok_account.send_message(this_chat.id, 
-                                                                        "\n".join(auto_delivery["message"]),
-                                                                        self.config.get("read_chat_before_sending_message_enabled") or False)
-                                    self.logger.info(f"{PREFIX} 🚀  На оплаченный предмет {Fore.LIGHTYELLOW_EX}«{event.deal.item.name}»{Fore.WHITE} от покупателя {Fore.LIGHTYELLOW_EX}{event.deal.user.username}{Fore.WHITE} было автоматически выдано пользовательское сообщение после покупки (ключевое слово: {keyword})")
+                                    await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                                    "\n".join(auto_delivery["message"]),
+                                                                                    plbot.config.get("read_chat_before_sending_message_enabled") or False)
+                                    plbot.logger.info(f"{plbot.prefix} 🚀  На оплаченный предмет {Fore.LIGHTYELLOW_EX}«{event.deal.item.name}»{Fore.WHITE} от покупателя {Fore.LIGHTYELLOW_EX}{event.deal.user.username}{Fore.WHITE} было автоматически выдано пользовательское сообщение после покупки (ключевое слово: {keyword})")
                                     break_flag = True
                                     break
                             if break_flag: break
 
-                    if self.config["auto_complete_deals_enabled"]:
+                    if plbot.config["auto_complete_deals_enabled"]:
                         if event.deal.user.id != plbot.playerok_account.id:
-                            self.playerok_account.update_deal(event.deal.id, ItemDealStatuses.SENT)
-                            self.logger.info(f"{PREFIX} ☑️  Заказ {Fore.LIGHTYELLOW_EX}{event.deal.id}{Fore.WHITE} от покупателя {Fore.LIGHTYELLOW_EX}{event.deal.user.username}{Fore.WHITE} был автоматически подтверждён")
-                            #if self.config["bot_event_notifications_chat_id"]:
-                            #    self.log_to_tg(f"☑️ Заказ <code>{event.deal.id}</code> от покупателя <code>{event.deal.user.username}</code> был автоматически подтверждён")
+                            await plbot.playerok_async_account.update_deal(event.deal.id, ItemDealStatuses.SENT)
+                            plbot.logger.info(f"{plbot.prefix} ☑️  Заказ {Fore.LIGHTYELLOW_EX}{event.deal.id}{Fore.WHITE} от покупателя {Fore.LIGHTYELLOW_EX}{event.deal.user.username}{Fore.WHITE} был автоматически подтверждён")
+                            #if plbot.config["bot_event_notifications_chat_id"]:
+                            #    plbot.log_to_tg(f"☑️ Заказ <code>{event.deal.id}</code> от покупателя <code>{event.deal.user.username}</code> был автоматически подтверждён")
 
                 except Exception as e:
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке новой сделки от {event.deal.user.username} произошла ошибка: {Fore.WHITE}{e}")
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке новой сделки от {event.deal.user.username} произошла ошибка: {Fore.WHITE}{e}")
             except plapi_exceptions.RequestError as e:
                 if e.error_code == "TOO_MANY_REQUESTS":
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новой сделки произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
-                    time.sleep(10)
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новой сделки произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
+                    await asyncio.sleep(10)
                 else:
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новой сделки произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новой сделки произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
             except Exception:
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новой сделки произошла ошибка: {Fore.WHITE}")
+                plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новой сделки произошла ошибка: {Fore.WHITE}")
                 traceback.print_exc()
 
         async def handler_item_paid(plbot: PlayerokBot, event: ItemPaidEvent):
             try:
-                if self.config["auto_restore_items_enabled"]:
-                    await self.restore_last_sold_item(event.deal.item)
+                if plbot.config["auto_restore_items_enabled"]:
+                    await plbot.restore_last_sold_item(event.deal.item)
             except plapi_exceptions.RequestError as e:
                 if e.error_code == "TOO_MANY_REQUESTS":
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
-                    time.sleep(10)
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
+                    await asyncio.sleep(10)
                 else:
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
             except Exception:
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка: {Fore.WHITE}")
+                plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента новых сообщений произошла ошибка: {Fore.WHITE}")
                 traceback.print_exc()
 
         async def handler_deal_status_changed(plbot: PlayerokBot, event: DealStatusChangedEvent):
@@ -352,31 +477,34 @@ class PlayerokBot:
                     elif event.deal.status is ItemDealStatuses.ROLLED_BACK:
                         plbot.stats["orders_refunded"] += 1
                 except Exception as e:
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При подсчёте статистики произошла ошибка: {Fore.WHITE}{e}")
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При подсчёте статистики произошла ошибка: {Fore.WHITE}{e}")
                 finally:
-                    set_stats(plbot.stats)
+                    set_stats(plbot.stats, plbot.name)
 
                 if event.deal.status is ItemDealStatuses.CONFIRMED or event.deal.status is ItemDealStatuses.ROLLED_BACK:
                     if event.deal.status is ItemDealStatuses.CONFIRMED:
-                        plbot.playerok_account.send_message(this_chat.id, 
-                                                            plbot.msg("deal_confirmed"),
-                                                            self.config.get("read_chat_before_sending_message_enabled") or False)
+                        await plbot.playerok_async_account.send_message(this_chat.id, 
+                                                                        plbot.msg("deal_confirmed"),
+                                                                        plbot.config.get("read_chat_before_sending_message_enabled") or False)
             except plapi_exceptions.RequestError as e:
                 if e.error_code == "TOO_MANY_REQUESTS":
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента смены статуса сделки произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
-                    time.sleep(10)
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента смены статуса сделки произошла ошибка 429 слишком частых запросов. Ждём 10 секунд и пробуем снова")
+                    await asyncio.sleep(10)
                 else:
-                    self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента смены статуса сделки произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
+                    plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента смены статуса сделки произошла ошибка {e.error_code}: {Fore.WHITE}\n{e}")
             except Exception:
-                self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}При обработке ивента смены статуса сделки произошла ошибка: {Fore.WHITE}")
+                plbot.logger.error(f"{plbot.prefix} {Fore.LIGHTRED_EX}При обработке ивента смены статуса сделки произошла ошибка: {Fore.WHITE}")
                 traceback.print_exc()
             
-        playerok_event_handlers = HandlersManager.get_playerok_event_handlers()
-        playerok_event_handlers[EventTypes.NEW_MESSAGE].insert(0, handler_new_message)
-        playerok_event_handlers[EventTypes.NEW_DEAL].insert(0, handler_new_deal)
-        playerok_event_handlers[EventTypes.DEAL_STATUS_CHANGED].insert(0, handler_deal_status_changed)
-        playerok_event_handlers[EventTypes.ITEM_PAID].insert(0, handler_item_paid)
-        HandlersManager.set_playerok_event_handlers(playerok_event_handlers)
+        if first_run:
+            HandlersManager.add_bot_event_handler("ON_PLAYEROK_BOT_INIT", handler_on_playerok_bot_init, 0)
+            # каждое добавление — отдельное атомарное изменение таблицы, поэтому модуль,
+            # подключённый в это время из Telegram бота, не потеряется
+            HandlersManager.add_playerok_event_handler(EventTypes.NEW_MESSAGE, handler_new_message, 0)
+            HandlersManager.add_playerok_event_handler(EventTypes.NEW_DEAL, handler_new_deal, 0)
+            HandlersManager.add_playerok_event_handler(EventTypes.DEAL_STATUS_CHANGED, handler_deal_status_changed, 0)
+            HandlersManager.add_playerok_event_handler(EventTypes.ITEM_PAID, handler_item_paid, 0)
+            handler_runner.on_breaker_trip.append(self.on_handler_breaker_trip)
 
         bot_event_handlers = HandlersManager.get_bot_event_handlers()
         def handle_on_playerok_bot_init():
@@ -387,24 +515,23 @@ class PlayerokBot:
             if "ON_PLAYEROK_BOT_INIT" in bot_event_handlers:
                 for handler in bot_event_handlers["ON_PLAYEROK_BOT_INIT"]:
                     try:
-                        handler(self)
+                        with handler_profiler.measure(handler, "ON_PLAYEROK_BOT_INIT"):
+                            handler(self)
                     except Exception as e:
-                        self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}Ошибка при обработке хендлера ивента ON_PLAYEROK_BOT_INIT: {Fore.WHITE}{e}")
+                        self.logger.error(f"{self.prefix} {Fore.LIGHTRED_EX}Ошибка при обработке хендлера ивента ON_PLAYEROK_BOT_INIT: {Fore.WHITE}{e}")
         handle_on_playerok_bot_init()
 
-        self.logger.info(f"{PREFIX} Playerok бот запущен и активен")
-        listener = EventListener(self.playerok_account)
-        for event in listener.listen(requests_delay=self.config["playerokapi_listener_requests_delay"]):
-            playerok_event_handlers = HandlersManager.get_playerok_event_handlers() # чтобы каждый раз брать свежие хендлеры, ибо модули могут отключаться/включаться
-            if event.type in playerok_event_handlers:
-                for handler in playerok_event_handlers[event.type]:
-                    try:
-                        await handler(self, event)
-                    except plapi_exceptions.RequestError as e:
-                        if e.error_code == "TOO_MANY_REQUESTS":
-                            self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}Произошла ошибка 429 слишком частых запросов при обработке хендлера {handler} в ивенте {event.type.name}. Ждём 10 секунд и пробуем снова")
-                            time.sleep(10)
-                        else:
-                            self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}Произошла ошибка {e.error_code} при обработке хендлера {handler} в ивенте {event.type.name}: {Fore.WHITE}\n{e}")
-                    except Exception as e:
-                        self.logger.error(f"{PREFIX} {Fore.LIGHTRED_EX}Произошла ошибка при обработке хендлера {handler} в ивенте {event.type.name}: {Fore.WHITE}{e}")
\ No newline at end of file
+        self.logger.info(f"{self.prefix} Playerok бот запущен и активен")
+        requests_delay = self.config["playerokapi_listener_requests_delay"]
+        # если интервалы не заданы явно, они считаются от периодичности запросов, заданной пользователем,
+        # чтобы бот не опрашивал сайт чаще, чем тот разрешил
+        min_delay = self.config["playerokapi_listener_min_delay"] or requests_delay
+        max_delay = self.config["playerokapi_listener_max_delay"] or max(requests_delay * 5, min_delay)
+        chat_type_delays = self.config["playerokapi_listener_chat_type_delays"]
+        # если для типов чатов указаны свои интервалы ({"NOTIFICATIONS": [10, 60], ...}), каждый тип опрашивается отдельно
+        pollers = [ChatPoller(AdaptiveInterval(*chat_type_delays.get(chat_type.name, (min_delay, max_delay))), type=chat_type)
+                   for chat_type in ChatTypes] if chat_type_delays else None
+        self.dispatcher.start()  # сразу, чтобы обработать ивенты, оставшиеся на диске с прошлого запуска
+        async for event in self.listener.listen(requests_delay=requests_delay,
+                                                min_delay=min_delay, max_delay=max_delay, pollers=pollers):
+            await self.dispatcher.submit(event)
\ No newline at end of file
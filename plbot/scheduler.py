@@ -0,0 +1,50 @@
+import time
+import traceback
+from threading import Thread, Lock
+from logging import getLogger
+
+from bot_settings.app import CURRENT_VERSION
+from core.console import set_title
+
+from . import get_playerok_bots
+
+
+logger = getLogger("UNIVERSAL.Scheduler")
+
+_scheduler_thread: Thread | None = None
+_scheduler_lock = Lock()
+
+
+def _title() -> str:
+    """ Заголовок консоли с балансами всех аккаунтов. """
+    balances = []
+    for bot in get_playerok_bots().values():
+        profile = bot.playerok_account.profile
+        balance = profile.balance.value if profile and profile.balance is not None else 0
+        balances.append(f"{bot.playerok_account.username}: {balance} RUB")
+    return f"Playerok Universal v{CURRENT_VERSION} | " + " | ".join(balances)
+
+
+def run_scheduler(cycle_delay: int | float = 5):
+    """
+    Бесконечно обновляет данные всех ботов процесса (см. `PlayerokBot.refresh()`).
+    Один поток на все аккаунты вместо отдельного потока на каждого бота.
+    """
+    while True:
+        for bot in list(get_playerok_bots().values()):
+            bot.refresh()
+        try:
+            set_title(_title())
+        except Exception:
+            traceback.print_exc()
+        time.sleep(cycle_delay)
+
+
+def start_scheduler(cycle_delay: int | float = 5) -> Thread:
+    """ Запускает общий планировщик ботов в отдельном потоке (если он ещё не запущен). """
+    global _scheduler_thread
+    with _scheduler_lock:
+        if _scheduler_thread is None or not _scheduler_thread.is_alive():
+            _scheduler_thread = Thread(target=run_scheduler, args=(cycle_delay,), daemon=True)
+            _scheduler_thread.start()
+        return _scheduler_thread
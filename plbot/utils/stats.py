@@ -3,20 +3,30 @@ from typing import Union
 
 
 
-stats = {
-    "bot_launch_time": datetime.now(),
-    "orders_completed": 0,
-    "orders_refunded": 0,
-    "active_orders": 0,
-    "earned_money": 0,
-}
+def _new_stats() -> dict[str, Union[int, str]]:
+    return {
+        "bot_launch_time": datetime.now(),
+        "orders_completed": 0,
+        "orders_refunded": 0,
+        "active_orders": 0,
+        "earned_money": 0,
+    }
+
+stats = _new_stats()
+accounts_stats: dict[str, dict[str, Union[int, str]]] = {}
+""" Статистика дополнительных аккаунтов в формате: {`название аккаунта`: `статистика`, ...}. """
 
 # Legacy support
-def get_stats() -> dict[str, Union[int, str]]:
+def get_stats(account_name: str = "main") -> dict[str, Union[int, str]]:
     """ Возвращает статистику """
+    if account_name != "main":
+        return accounts_stats.setdefault(account_name, _new_stats())
     return stats
 
-def set_stats(new_data):
+def set_stats(new_data, account_name: str = "main"):
     """ Устанавливает новую статистику """
     global stats
+    if account_name != "main":
+        accounts_stats[account_name] = new_data
+        return
     stats = new_data
@@ -28,6 +28,25 @@ class Config:
         with open(Config.PATH, 'w', encoding='utf-8') as f:
             json.dump(new_data, f, indent=4, ensure_ascii=False)
 
+    @staticmethod
+    def get_account(name: str = "main") -> dict:
+        """
+        Возвращает конфиг аккаунта: общий конфиг, поверх которого
+        применены настройки аккаунта из списка `accounts` (для основного аккаунта `main` — общий конфиг).
+        """
+        config = Config.get()
+        if name == "main":
+            return config
+        for account in config["accounts"]:
+            if account.get("name") == name:
+                return {**config, **account}
+        raise KeyError(f"Аккаунт {name} не найден в конфиге")
+
+    @staticmethod
+    def get_account_names() -> list[str]:
+        """ Возвращает названия всех аккаунтов из конфига (основной аккаунт — `main`). """
+        return ["main"] + [account["name"] for account in Config.get()["accounts"] if account.get("name")]
+
     @staticmethod
     def default_config() -> dict:
         """ Возвращает стандартную структуру config.json. """
@@ -38,6 +57,27 @@ class Config:
             "tg_bot_token": "",
             "playerokapi_requests_timeout": 30,
             "playerokapi_listener_requests_delay": 2,
+            "playerokapi_listener_page_budget": 5,
+            "playerokapi_listener_min_delay": None,
+            "playerokapi_listener_max_delay": None,
+            "playerokapi_listener_chat_type_delays": {},
+            "playerokapi_listener_checkpoint_enabled": True,
+            "playerokapi_listener_dedup_size": 10000,
+            "playerokapi_listener_subscription_enabled": False,
+            "playerokapi_listener_subscription_url": "",
+            "playerokapi_requests_per_second": 3,
+            "playerokapi_requests_burst": 10,
+            "playerokapi_proxies": [],
+            "playerokapi_traffic_record_path": "",
+            "playerokapi_traffic_replay_path": "",
+            "playerokapi_traffic_replay_speed": 1,
+            "event_dispatcher_workers": 8,
+            "event_queue_max_size": 1000,
+            "event_queue_overflow_policy": "block",
+            "handler_slow_threshold": 1,
+            "handler_executor_workers": 4,
+            "handler_timeout": 60,
+            "handler_breaker_threshold": 3,
             "messages_watermark_enabled": True,
             "messages_watermark": "©️ 𝗣𝗹𝗮𝘆𝗲𝗿𝗼𝗸 𝗨𝗻𝗶𝘃𝗲𝗿𝘀𝗮𝗹",
             "read_chat_before_sending_message_enabled": True,
@@ -48,7 +88,8 @@ class Config:
             "auto_restore_items_priority_status": "DEFAULT",
             "auto_complete_deals_enabled": True,
             "bot_event_notifications_enabled": False,
-            "bot_event_notifications_chat_id": 0
+            "bot_event_notifications_chat_id": 0,
+            "accounts": []
         }
     
     @staticmethod
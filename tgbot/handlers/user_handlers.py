@@ -1,4 +1,5 @@
 from aiogram import types, Router, Bot
+from aiogram.types import BufferedInputFile
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 
@@ -6,6 +7,9 @@ import tgbot.templates.user_templates as Templates
 from tgbot.states.states import *
 
 from settings import Config, Messages, CustomCommands, AutoDeliveries
+from plbot import get_playerok_bot, set_playerok_bot
+from playerokapi import set_account
+from core.handler_stats import handler_profiler
 
 
 router = Router()
@@ -55,6 +59,41 @@ async def handler_stats(message: types.Message, state: FSMContext):
     except Exception as e:
         await message.answer(text=Templates.System.Error.text(e), parse_mode="HTML")
 
+@router.message(Command('accounts'))
+async def handler_accounts(message: types.Message, state: FSMContext):
+    """ Отрабатывает команду /accounts (список аккаунтов и выбор аккаунта для меню) """
+    try:
+        await state.set_state(None)
+        config = Config.get()
+        if message.from_user.id != config["tg_admin_id"]:
+            return
+        args = message.text.split(maxsplit=1)
+        if len(args) > 1:
+            playerokbot = get_playerok_bot(args[1].strip())
+            if playerokbot is None:
+                raise Exception(f"Аккаунт {args[1].strip()} не найден")
+            set_playerok_bot(playerokbot)
+            set_account(playerokbot.playerok_account)
+        await message.answer(text=Templates.System.Accounts.text(), parse_mode="HTML")
+    except Exception as e:
+        await message.answer(text=Templates.System.Error.text(e), parse_mode="HTML")
+
+@router.message(Command('handlers'))
+async def handler_handlers(message: types.Message, state: FSMContext):
+    """ Отрабатывает команду /handlers (время работы хендлеров, /handlers json — выгрузка в файл) """
+    try:
+        await state.set_state(None)
+        config = Config.get()
+        if message.from_user.id != config["tg_admin_id"]:
+            return
+        args = message.text.split(maxsplit=1)
+        if len(args) > 1 and args[1].strip().lower() == "json":
+            await message.answer_document(BufferedInputFile(handler_profiler.dump().encode("utf-8"), filename="handlers_stats.json"))
+            return
+        await message.answer(text=Templates.System.Handlers.text(), parse_mode="HTML")
+    except Exception as e:
+        await message.answer(text=Templates.System.Error.text(e), parse_mode="HTML")
+
 # /---- Настройки бота ----\
 
 @router.message(MessagesNavigationStates.entering_messages_page)
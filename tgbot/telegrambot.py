@@ -13,6 +13,7 @@ from settings import Config
 
 from core.modules_manager import ModulesManager
 from core.handlers_manager import HandlersManager
+from core.handler_stats import handler_profiler
 from core.console import restart
 
 PREFIX = f"{Fore.LIGHTCYAN_EX}[telegram bot]{Fore.WHITE}"
@@ -54,7 +55,11 @@ class TelegramBot:
             BotCommand(command="/settings",
                     description="Настройки бота"),
             BotCommand(command="/stats",
-                    description="Статистика бота")
+                    description="Статистика бота"),
+            BotCommand(command="/accounts",
+                    description="Аккаунты"),
+            BotCommand(command="/handlers",
+                    description="Время работы хендлеров")
         ]
         await self.bot.set_my_commands(main_menu_commands)
 
@@ -70,7 +75,8 @@ class TelegramBot:
             if "ON_TELEGRAM_BOT_INIT" in bot_event_handlers:
                 for handler in bot_event_handlers["ON_TELEGRAM_BOT_INIT"]:
                     try:
-                        await handler(self)
+                        with handler_profiler.measure(handler, "ON_TELEGRAM_BOT_INIT"):
+                            await handler(self)
                     except Exception as e:
                         logger.error(f"{Fore.LIGHTRED_EX}Ошибка при обработке хендлера в ивента ON_TELEGRAM_BOT_INIT: {Fore.WHITE}{e}")
         await handle_on_telegram_bot_init()
@@ -79,7 +85,7 @@ class TelegramBot:
         logger.info(f"{PREFIX} Telegram бот {Fore.LIGHTWHITE_EX}@{me.username} {Fore.WHITE}запущен и активен")
         await self.dp.start_polling(self.bot, skip_updates=True, handle_signals=False)
         
-    async def call_seller(self, calling_name: str, chat_id: int | str):
+    async def call_seller(self, calling_name: str, chat_id: int | str, account_name: str | None = None):
         """
         Пишет админу в Telegram с просьбой о помощи от заказчика.
                 
@@ -88,9 +94,13 @@ class TelegramBot:
 
         :param chat_id: ID чата с заказчиком
         :type chat_id: `int` or `str`
+
+        :param account_name: Название аккаунта, в чат которого написал заказчик (если аккаунтов несколько)
+        :type account_name: `str` or `None`
         """
         await self.bot.send_message(chat_id=self.admin_id, 
-                                    text=Templates.Callbacks.CallSeller.text(calling_name, f"https://playerok.com/chats/{chat_id}"),
+                                    text=Templates.Callbacks.CallSeller.text(calling_name, f"https://playerok.com/chats/{chat_id}",
+                                                                             account_name),
                                     parse_mode="HTML")
         
     async def log_event(self, text: str):
@@ -10,12 +10,15 @@ from settings import Config, Messages, CustomCommands, AutoDeliveries
 
 from bot_settings.app import CURRENT_VERSION
 from plbot.utils.stats import get_stats
-from plbot import get_playerok_bot
+from plbot import get_playerok_bot, get_playerok_bots
 
 from core.modules_manager import ModulesManager, Module
 from uuid import UUID
 
 from playerokapi import types as plapi_types
+from playerokapi.circuit_breaker import cloudflare_breaker
+from core.handler_stats import handler_profiler
+from core.handler_runner import handler_runner
         
 class System:
     """ Шаблоны системных сообщений """
@@ -24,6 +27,41 @@ class System:
             msg = f"❌ Произошла ошибка: <b>{error_text}</b>"
             return msg
 
+    class Accounts:
+        def text() -> str:
+            selected = get_playerok_bot()
+            msg = "👥 <b>Аккаунты</b>" \
+                f"\n"
+            for name, playerokbot in get_playerok_bots().items():
+                rl_stats = playerokbot.playerok_account.rate_limiter.get_stats()
+                msg += f"\n{'→' if playerokbot is selected else '·'} <code>{name}</code>: <b>{playerokbot.playerok_account.username}</b>" \
+                       f" ({rl_stats['calls']} запр.)"
+            msg += f"\n" \
+                f"\nМеню и статистика показываются для выбранного аккаунта (→)." \
+                f"\nЧтобы выбрать другой: <code>/accounts название</code>"
+            return msg
+
+    class Handlers:
+        def text(top: int = 15) -> str:
+            handlers_stats = handler_profiler.get_stats()
+            msg = "⏱️ <b>Время работы хендлеров</b>" \
+                f"\n"
+            if not handlers_stats:
+                msg += "\nХендлеры ещё не вызывались"
+            for h in handlers_stats[:top]:
+                msg += f"\n→ <code>{h['handler']}</code>: {h['count']} выз., " \
+                       f"p50/p95/макс. <code>{h['p50'] * 1000:.0f}/{h['p95'] * 1000:.0f}/{h['max'] * 1000:.0f}</code> мс" \
+                       f", ошибок <code>{h['errors']}</code>, медленных <code>{h['slow']}</code>"
+            runner_stats = handler_runner.get_stats()
+            for b in runner_stats["breakers"]:
+                msg += f"\n{'⛔' if b['open'] else '⏳'} <code>{b['handler']}</code>: таймаутов <code>{b['timeouts']}</code>" \
+                       f" (подряд {b['consecutive_timeouts']}, срабатываний предохранителя {b['trips']})"
+            msg += f"\n" \
+                f"\nСинхронных вызовов в пуле потоков: <code>{runner_stats['sync_calls']}</code>, таймаут хендлера: <code>{runner_stats['timeout']}</code> сек." \
+                f"\nМедленными считаются вызовы дольше <code>{handler_profiler.slow_threshold}</code> сек." \
+                f"\nВыгрузка в JSON: <code>/handlers json</code>"
+            return msg
+
 class Navigation:
     """ Шаблоны навигации по боту """
 
@@ -121,7 +159,30 @@ class Navigation:
                 
             class Default:
                 def text() -> str:
-                    stats = get_stats()
+                    stats = get_stats(get_playerok_bot().name)
+                    cf_stats = cloudflare_breaker.get_stats()
+                    rl_stats = get_playerok_bot().playerok_account.rate_limiter.get_stats()
+                    proxy_pool = get_playerok_bot().playerok_account.proxy_pool
+                    listener_stats = get_playerok_bot().listener.get_stats()
+                    dispatcher_stats = get_playerok_bot().dispatcher.get_stats()
+                    dispatcher_overflow_text = ""
+                    if dispatcher_stats["max_size"]:
+                        dropped = sum(dispatcher_stats["dropped"].values())
+                        dispatcher_overflow_text = f"\n→ Переполнений очереди ({dispatcher_stats['overflow_policy']}, лимит {dispatcher_stats['max_size']}): " \
+                                                   f"ждали <code>{dispatcher_stats['blocked']}</code> раз ({dispatcher_stats['blocked_time']:.1f} сек.), " \
+                                                   f"на диск <code>{dispatcher_stats['spilled']}</code>, отброшено <code>{dropped}</code>"
+                    proxies_text = ""
+                    for proxy in proxy_pool.get_stats() if proxy_pool else []:
+                        p50 = f"{proxy['latency_p50'] * 1000:.0f}" if proxy['latency_p50'] is not None else "—"
+                        p95 = f"{proxy['latency_p95'] * 1000:.0f}" if proxy['latency_p95'] is not None else "—"
+                        proxies_text += f"\n→ {'⛔' if proxy['ejected'] else '🟢'} <code>{proxy['proxy']}</code>: " \
+                                        f"p50/p95 <code>{p50}/{p95}</code> мс, ошибок <code>{proxy['error_rate']:.0%}</code>, " \
+                                        f"CF <code>{proxy['challenge_rate']:.0%}</code> ({proxy['requests']} запр.)"
+                    subscription_text = ""
+                    if listener_stats.get("subscription"):
+                        sub = listener_stats["subscription"]
+                        subscription_text = f"\n→ Подписка на обновления: <code>{'подключена' if sub['connected'] else 'нет соединения'}</code> " \
+                                            f"(обновлений: {listener_stats['pushed_updates']}, переподключений: {sub['reconnects']})"
                     msg = "📊 <b>Статистика Playerok бота</b>" \
                         f"\n" \
                         f"\n→ Дата запуска: <code>{stats['bot_launch_time'].strftime('%d.%m.%Y %H:%M:%S')}</code>" \
@@ -131,6 +192,20 @@ class Navigation:
                         f"\n→ Возвратов: <code>{stats['orders_refunded']}</code>" \
                         f"\n→ Заработано: <code>{stats['earned_money']}</code> р." \
                         f"\n" \
+                        f"\n→ CloudFlare защита: <code>{cf_stats['state']}</code>" \
+                        f"\n→ Время под защитой: <code>{int(cf_stats['total_open_time'])}</code> сек. ({cf_stats['opened_count']} раз)" \
+                        f"\n→ Запросов к playerok.com: <code>{rl_stats['calls']}</code> (ждали в очереди: <code>{rl_stats['delayed_calls']}</code>)" \
+                        f"\n→ Ожидание в очереди: среднее <code>{rl_stats['average_wait']:.2f}</code> сек., макс. <code>{rl_stats['max_wait']:.2f}</code> сек." \
+                        f"{proxies_text}" \
+                        f"{subscription_text}" \
+                        f"\n→ Отброшено повторных сообщений: <code>{listener_stats['dedup']['hits']}</code> (в индексе {listener_stats['dedup']['size']} из {listener_stats['dedup']['max_size']})" \
+                        f"\n→ Интервал опроса чатов: <code>{listener_stats['interval'] or 0:.1f}</code> сек. (сэкономлено запросов в час: <code>{listener_stats['requests_saved_per_hour']:.0f}</code>)" \
+                        f"\n→ Догрузок пропущенных событий: <code>{listener_stats['catchup_count']}</code> ({listener_stats['catchup_pages']} стр., не хватило бюджета: {listener_stats['catchup_truncated']})" \
+                        f"\n→ Ивентов в очереди: <code>{dispatcher_stats['queue_depth']}</code> (макс. {dispatcher_stats['max_queue_depth']}, чатов в обработке: {dispatcher_stats['busy_chats']} из {dispatcher_stats['workers']})" \
+                        f"\n→ Задержка обработки ивентов: среднее <code>{dispatcher_stats['average_lag']:.2f}</code> сек., макс. <code>{dispatcher_stats['max_lag']:.2f}</code> сек." \
+                        f"\n→ Ожидание в очереди ивентов: среднее <code>{dispatcher_stats['average_queue_wait']:.2f}</code> сек., макс. <code>{dispatcher_stats['max_queue_wait']:.2f}</code> сек." \
+                        f"{dispatcher_overflow_text}" \
+                        f"\n" \
                         f"\nВыберите действие ↓"
                     return msg
                     
@@ -1744,7 +1819,9 @@ class Navigation:
               
 class Callbacks:
     class CallSeller:
-        def text(calling_name, chat_link) -> str:
+        def text(calling_name, chat_link, account_name=None) -> str:
             msg = f"🆘 <b>{calling_name}</b> требуется ваша помощь!" \
                   f"\n{chat_link}"
+            if account_name:
+                msg += f"\n→ Аккаунт: <code>{account_name}</code>"
             return msg
\ No newline at end of file